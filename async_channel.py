@@ -0,0 +1,91 @@
+"""
+Async Channel
+asyncio.Queue that can be closed, so consumers end on close instead of polling
+"""
+import asyncio
+
+
+class ChannelClosed(Exception):
+    """get() on a channel that is closed and drained"""
+
+
+class Channel(asyncio.Queue):
+    """
+    Queue with close semantics, iterable with `async for`
+
+    close() wakes every waiting get(); items already queued are still
+    delivered, then get() raises ChannelClosed and iteration stops. Puts
+    after close are ignored (late producers during teardown are expected,
+    e.g. a media frame arriving while the call ends). Consumers block on
+    data or close only: no timeouts, no periodic wakeups.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.closed = False
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for getter in self._getters:
+            if not getter.done():
+                getter.set_result(None)
+        # producers waiting for room won't get any
+        for putter in self._putters:
+            if not putter.done():
+                putter.set_result(None)
+
+    def put_nowait(self, item):
+        if self.closed:
+            return
+        super().put_nowait(item)
+
+    async def put(self, item):
+        # asyncio.Queue.put, except that close ends the wait (item dropped)
+        while self.full():
+            if self.closed:
+                return
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except:
+                putter.cancel()
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    pass
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(item)
+
+    async def get(self):
+        # asyncio.Queue.get, except that close ends the wait
+        while self.empty():
+            if self.closed:
+                raise ChannelClosed()
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if not self.empty() and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except ChannelClosed:
+            raise StopAsyncIteration
@@ -0,0 +1,270 @@
+"""
+NumPy Audio Codec Engine
+Vectorized μ-law / PCM16 conversions and resampling (drop-in for the audioop calls we use)
+
+audioop is deprecated and removed in Python 3.13. Every function here mirrors
+the audioop function of the same name bit-for-bit for mono 16-bit audio,
+including ratecv's linear-interpolation filter and its state tuple, so
+streams can switch backends without audible or numerical differences.
+"""
+import math
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+# audioop.ratecv state: (d, ((prev_sample, cur_sample),)) with samples scaled to 32-bit
+RatecvState = Tuple[int, Tuple[Tuple[int, int], ...]]
+
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    """256-entry G.711 μ-law → PCM16 table"""
+    u = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = (((u & 0x0F) << 3) + 0x84) << ((u & 0x70) >> 4)
+    return np.where(u & 0x80, 0x84 - t, t - 0x84).astype(np.int16)
+
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    """
+    65536-entry PCM16 → μ-law table, indexed by the sample's uint16 bit pattern.
+
+    Same arithmetic as audioop's st_14linear2ulaw, evaluated once for every
+    possible sample so encoding becomes a single gather.
+    """
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    mag = np.minimum(np.abs(pcm), 8159) + 33
+
+    seg_end = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+    seg = np.searchsorted(seg_end, mag)  # first segment whose end >= mag
+
+    uval = (seg << 4) | ((mag >> (seg + 1)) & 0x0F)
+    uval = np.where(seg >= 8, 0x7F, uval)
+    return (uval ^ mask).astype(np.uint8)
+
+
+ULAW_DECODE_TABLE = _build_ulaw_decode_table()
+ULAW_ENCODE_TABLE = _build_ulaw_encode_table()
+
+# 65536-entry table of ratecv's 2x-upsample midpoint between two decoded
+# μ-law samples, indexed by (prev_code << 8) | cur_code
+ULAW_UPSAMPLE_MID_TABLE = (
+    (ULAW_DECODE_TABLE.astype(np.int32)[:, None] + ULAW_DECODE_TABLE[None, :]) >> 1
+).astype(np.int16).ravel()
+
+
+# -----------------------------------------------------------------------------
+# Buffer helpers
+# -----------------------------------------------------------------------------
+def _as_pcm16(data: Any) -> np.ndarray:
+    """View bytes-like PCM16 data as an int16 array (no copy)"""
+    if len(data) % 2:
+        raise ValueError("not a whole number of frames")
+    return np.frombuffer(data, dtype=np.int16)
+
+
+def _as_mulaw(data: Any) -> np.ndarray:
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+# -----------------------------------------------------------------------------
+# μ-law
+# -----------------------------------------------------------------------------
+def ulaw2lin(mulaw_data: Any) -> bytes:
+    """μ-law bytes → PCM16 bytes (256-entry table lookup)"""
+    return ULAW_DECODE_TABLE[_as_mulaw(mulaw_data)].tobytes()
+
+
+def lin2ulaw(pcm_data: Any) -> bytes:
+    """PCM16 bytes → μ-law bytes (65536-entry table lookup)"""
+    return _encode_ulaw(_as_pcm16(pcm_data))
+
+
+def _encode_ulaw(samples: np.ndarray) -> bytes:
+    return ULAW_ENCODE_TABLE[samples.astype(np.int16, copy=False).view(np.uint16)].tobytes()
+
+
+# -----------------------------------------------------------------------------
+# Resampling
+# -----------------------------------------------------------------------------
+_RATECV_BLOCK_SAMPLES = 1 << 16
+
+
+def _ratecv_samples(
+    samples: np.ndarray, from_rate: int, to_rate: int, state: Optional[RatecvState]
+) -> Tuple[np.ndarray, RatecvState]:
+    """
+    Vectorized audioop.ratecv for mono int16 samples.
+
+    audioop walks a counter d that gains to_rate per input sample consumed and
+    loses from_rate per output sample produced. Output q is emitted after
+    input m_q = ceil((q * from_rate - d0) / to_rate) has been consumed, and
+    interpolates between inputs m_q - 1 and m_q with weight d. Both m_q and d
+    repeat with period to_rate (reduced), so one period is computed and
+    broadcast over the chunk.
+    """
+    n = len(samples)
+    if n > _RATECV_BLOCK_SAMPLES:
+        # keep temporaries cache-sized on long buffers; state chains blocks
+        parts = []
+        for i in range(0, n, _RATECV_BLOCK_SAMPLES):
+            part, state = _ratecv_samples(
+                samples[i:i + _RATECV_BLOCK_SAMPLES], from_rate, to_rate, state
+            )
+            parts.append(part)
+        return np.concatenate(parts), state
+
+    g = math.gcd(from_rate, to_rate)
+    inrate, outrate = from_rate // g, to_rate // g
+
+    if state is None:
+        d0, prev_i, cur_i = -outrate, 0, 0
+    else:
+        d0, ((prev_i, cur_i),) = state
+
+    # outputs q = 0..count-1 satisfy m_q <= n  ⇔  q*inrate <= d0 + n*outrate
+    count = max((d0 + n * outrate) // inrate + 1, 0) if n else 0
+    d_end = d0 + n * outrate - count * inrate
+    if n >= 2:
+        new_state = (d_end, ((int(samples[-2]) << 16, int(samples[-1]) << 16),))
+    elif n == 1:
+        new_state = (d_end, ((cur_i, int(samples[0]) << 16),))
+    else:
+        new_state = (d_end, ((prev_i, cur_i),))
+
+    if not count:
+        return np.empty(0, dtype=np.int16), new_state
+
+    if outrate == 1:
+        # integer decimation (e.g. 16k → 8k, 24k → 8k): d is always 0, so
+        # every output is an input sample taken as-is
+        return samples[-d0 - 1::inrate][:count], new_state
+
+    # extended input: index 0 is the last sample of the previous chunk
+    ext = np.empty(n + 1, dtype=np.int32)
+    ext[0] = cur_i >> 16
+    ext[1:] = samples
+
+    if inrate == 1 and outrate == 2:
+        # 2x upsample (8k → 16k): outputs alternate between the floor-average
+        # of two neighbours and the input sample itself; fresh streams
+        # (d0 == -2) skip the leading midpoint
+        grid = np.column_stack(((ext[:-1] + ext[1:]) >> 1, ext[1:])).ravel()
+        return grid[-d0 - 1:].astype(np.int16), new_state
+
+    # general case: one period of (m, d), broadcast over whole periods
+    q = np.arange(outrate, dtype=np.int64)
+    base_m = -((d0 - q * inrate) // outrate)
+    base_d = (d0 + base_m * outrate - q * inrate).astype(np.int32)
+
+    periods = -(-count // outrate)
+    m = (base_m + inrate * np.arange(periods, dtype=np.int64)[:, None]).ravel()[:count]
+    d = np.tile(base_d, periods)[:count]
+
+    weighted = ext[m - 1] * d + ext[m] * (outrate - d)
+    if outrate < 65536:
+        # audioop scales samples by 2**16, truncates the quotient and shifts
+        # back; for outrate < 2**16 that is exactly floor(weighted / outrate)
+        out = np.floor(weighted / outrate)
+    else:
+        out = np.floor(np.trunc(weighted.astype(np.float64) * 65536.0 / outrate) / 65536.0)
+    return out.astype(np.int16), new_state
+
+
+def ratecv(
+    pcm_data: Any, from_rate: int, to_rate: int, state: Optional[RatecvState] = None
+) -> Tuple[bytes, RatecvState]:
+    """Drop-in for audioop.ratecv(data, 2, 1, from_rate, to_rate, state)"""
+    out, new_state = _ratecv_samples(_as_pcm16(pcm_data), from_rate, to_rate, state)
+    return out.tobytes(), new_state
+
+
+# -----------------------------------------------------------------------------
+# Fused telephony transforms
+# -----------------------------------------------------------------------------
+def mulaw8k_to_pcm16_16k(
+    mulaw_data: Any, state: Optional[RatecvState] = None
+) -> Tuple[bytes, RatecvState]:
+    """
+    Twilio μ-law 8kHz → PCM16 16kHz in one pass.
+
+    Each input byte yields two output samples: the midpoint with the previous
+    byte (pair table) and its own decoded value (decode table), so decode and
+    resample collapse into two gathers with no intermediate PCM buffer.
+    """
+    codes = _as_mulaw(mulaw_data)
+    if state is None:
+        d0, prev_i, cur_i = -2, 0, 0
+    else:
+        d0, ((prev_i, cur_i),) = state
+
+    n = len(codes)
+    if not n:
+        return b"", (d0, ((prev_i, cur_i),))
+
+    # previous chunk's last sample re-encoded; μ-law round-trips decoded values
+    pair_index = np.empty(n, dtype=np.uint16)
+    pair_index[0] = ULAW_ENCODE_TABLE[(cur_i >> 16) & 0xFFFF]
+    pair_index[1:] = codes[:-1]
+    pair_index <<= 8
+    pair_index |= codes
+
+    out = np.empty((n, 2), dtype=np.int16)
+    out[:, 0] = ULAW_UPSAMPLE_MID_TABLE[pair_index]
+    out[:, 1] = ULAW_DECODE_TABLE[codes]
+
+    # fresh streams (d0 == -2) start on the first sample, not the midpoint;
+    # either way the stream ends with d == -1 after the last sample
+    last = int(ULAW_DECODE_TABLE[codes[-1]]) << 16
+    prev = int(ULAW_DECODE_TABLE[codes[-2]]) << 16 if n >= 2 else cur_i
+    return out.ravel()[-d0 - 1:].tobytes(), (-1, ((prev, last),))
+
+
+def pcm16_to_mulaw8k(
+    pcm_data: Any, from_rate: int, state: Optional[RatecvState] = None
+) -> Tuple[bytes, RatecvState]:
+    """PCM16 at any rate → Twilio μ-law 8kHz in one pass (resampler output is table-encoded directly)"""
+    samples = _as_pcm16(pcm_data)
+    if from_rate == 8000:
+        return _encode_ulaw(samples), state
+    out, new_state = _ratecv_samples(samples, from_rate, 8000, state)
+    return _encode_ulaw(out), new_state
+
+
+# -----------------------------------------------------------------------------
+# Level / mixing helpers
+# -----------------------------------------------------------------------------
+def rms(pcm_data: Any) -> int:
+    samples = _as_pcm16(pcm_data)
+    if not len(samples):
+        return 0
+    return int(math.sqrt(np.dot(samples.astype(np.float64), samples.astype(np.float64)) / len(samples)))
+
+
+def zero_crossing_rate(pcm_data: Any) -> float:
+    """Fraction of adjacent sample pairs whose sign differs (0.0–1.0)"""
+    samples = _as_pcm16(pcm_data)
+    if len(samples) < 2:
+        return 0.0
+    negative = samples < 0
+    return float(np.count_nonzero(negative[1:] != negative[:-1])) / (len(samples) - 1)
+
+
+def max_abs(pcm_data: Any) -> int:
+    samples = _as_pcm16(pcm_data)
+    if not len(samples):
+        return 0
+    return int(np.abs(samples.astype(np.int32)).max())
+
+
+def mul(pcm_data: Any, factor: float) -> bytes:
+    """Scale samples by factor, saturating at the int16 range"""
+    scaled = np.floor(_as_pcm16(pcm_data).astype(np.float64) * factor)
+    return np.clip(scaled, -32768, 32767).astype(np.int16).tobytes()
+
+
+def add(pcm_a: Any, pcm_b: Any) -> bytes:
+    """Sum two equal-length streams, saturating at the int16 range"""
+    a, b = _as_pcm16(pcm_a), _as_pcm16(pcm_b)
+    if len(a) != len(b):
+        raise ValueError("Lengths should be the same")
+    return np.clip(a.astype(np.int32) + b, -32768, 32767).astype(np.int16).tobytes()
@@ -1,12 +1,16 @@
 """
 Audio Processing Utilities
 Handles audio format conversions between Twilio (μ-law 8kHz) and Sarvam (PCM 16kHz)
+
+All sample conversions go through the NumPy codec engine (audio_codec), which
+matches audioop bit-for-bit and keeps working on Python 3.13+.
 """
-import audioop
 import math
 import io
 import wave
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+import audio_codec
 
 
 class AudioProcessor:
@@ -24,7 +28,7 @@ class AudioProcessor:
         Returns:
             16-bit PCM audio bytes
         """
-        return audioop.ulaw2lin(mulaw_data, 2)
+        return audio_codec.ulaw2lin(mulaw_data)
     
     @staticmethod
     def pcm16_to_mulaw(pcm_data: bytes) -> bytes:
@@ -37,7 +41,7 @@ class AudioProcessor:
         Returns:
             μ-law encoded audio bytes
         """
-        return audioop.lin2ulaw(pcm_data, 2)
+        return audio_codec.lin2ulaw(pcm_data)
     
     @staticmethod
     def resample_audio(audio_data: bytes, from_rate: int, to_rate: int, sample_width: int = 2) -> bytes:
@@ -48,7 +52,7 @@ class AudioProcessor:
             audio_data: Input audio bytes
             from_rate: Source sample rate
             to_rate: Target sample rate
-            sample_width: Sample width in bytes (default 2 for 16-bit)
+            sample_width: Sample width in bytes (only 2 / 16-bit is supported)
             
         Returns:
             Resampled audio bytes
@@ -56,7 +60,7 @@ class AudioProcessor:
         if from_rate == to_rate:
             return audio_data
         
-        return audioop.ratecv(audio_data, sample_width, 1, from_rate, to_rate, None)[0]
+        return audio_codec.ratecv(audio_data, from_rate, to_rate, None)[0]
     
     @staticmethod
     def mulaw_8k_to_pcm16_16k(mulaw_data: bytes) -> bytes:
@@ -69,13 +73,8 @@ class AudioProcessor:
         Returns:
             16-bit PCM audio at 16kHz
         """
-        # Step 1: μ-law to 16-bit PCM at 8kHz
-        pcm_8k = AudioProcessor.mulaw_to_pcm16(mulaw_data, 8000)
-        
-        # Step 2: Resample from 8kHz to 16kHz
-        pcm_16k = AudioProcessor.resample_audio(pcm_8k, 8000, 16000, 2)
-        
-        return pcm_16k
+        # μ-law decode + 8kHz → 16kHz resample in a single pass
+        return audio_codec.mulaw8k_to_pcm16_16k(mulaw_data)[0]
     
     @staticmethod
     def pcm16_16k_to_mulaw_8k(pcm_data: bytes) -> bytes:
@@ -88,13 +87,8 @@ class AudioProcessor:
         Returns:
             μ-law encoded audio at 8kHz
         """
-        # Step 1: Resample from 16kHz to 8kHz
-        pcm_8k = AudioProcessor.resample_audio(pcm_data, 16000, 8000, 2)
-        
-        # Step 2: 16-bit PCM to μ-law
-        mulaw = AudioProcessor.pcm16_to_mulaw(pcm_8k)
-        
-        return mulaw
+        # 16kHz → 8kHz resample + μ-law encode in a single pass
+        return audio_codec.pcm16_to_mulaw8k(pcm_data, 16000)[0]
     @staticmethod
     def wav_to_pcm(wav_bytes: bytes) -> tuple[bytes, int]:
         """
@@ -150,7 +144,7 @@ class AudioProcessor:
             samples.append(value.to_bytes(2, byteorder="little", signed=True))
         
         pcm16 = b"".join(samples)
-        return audioop.lin2ulaw(pcm16, 2)
+        return audio_codec.lin2ulaw(pcm16)
     
     @staticmethod
     def calculate_audio_duration(audio_bytes: bytes, sample_rate: int, sample_width: int = 2, channels: int = 1) -> float:
@@ -182,7 +176,7 @@ class AudioProcessor:
         Returns:
             Volume-adjusted audio bytes
         """
-        return audioop.mul(audio_data, sample_width, factor)
+        return audio_codec.mul(audio_data, factor)
     
     @staticmethod
     def mix_audio(audio1: bytes, audio2: bytes, sample_width: int = 2) -> bytes:
@@ -203,7 +197,7 @@ class AudioProcessor:
         elif len(audio2) < len(audio1):
             audio2 += b'\x00' * (len(audio1) - len(audio2))
         
-        return audioop.add(audio1, audio2, sample_width)
+        return audio_codec.add(audio1, audio2)
     
     @staticmethod
     def detect_silence(audio_data: bytes, threshold: int = 500, sample_width: int = 2) -> bool:
@@ -219,7 +213,7 @@ class AudioProcessor:
             True if audio is mostly silent, False otherwise
         """
         try:
-            rms = audioop.rms(audio_data, sample_width)
+            rms = audio_codec.rms(audio_data)
             return rms < threshold
         except Exception:
             return True
@@ -238,11 +232,90 @@ class AudioProcessor:
             Normalized audio bytes
         """
         try:
-            max_amplitude = audioop.max(audio_data, sample_width)
+            max_amplitude = audio_codec.max_abs(audio_data)
             if max_amplitude == 0:
                 return audio_data
             
             factor = target_peak / max_amplitude
-            return audioop.mul(audio_data, sample_width, factor)
+            return audio_codec.mul(audio_data, factor)
         except Exception:
-            return audio_data
\ No newline at end of file
+            return audio_data
+
+
+class AudioStreamContext:
+    """
+    Per-stream resampler/codec context
+
+    AudioProcessor.resample_audio starts every call with a fresh ratecv
+    filter, so a stream converted frame-by-frame restarts the filter at each
+    20ms boundary. This context keeps the ratecv state between chunks, which
+    makes chunked conversion match converting the whole stream at once.
+
+    One context per direction of one call (transcriber input, synthesizer
+    output); call reset() when the stream is discontinuous (e.g. barge-in).
+    """
+
+    def __init__(self):
+        # ratecv state keyed by (from_rate, to_rate, sample_width)
+        self._states: Dict[Tuple[int, int, int], Any] = {}
+
+    def reset(self):
+        """Forget filter history (start of a new, unrelated stream)"""
+        self._states.clear()
+
+    def resample(self, audio_data: bytes, from_rate: int, to_rate: int, sample_width: int = 2) -> bytes:
+        """
+        Resample audio, continuing from the previous chunk's filter state
+
+        Args:
+            audio_data: Input audio bytes
+            from_rate: Source sample rate
+            to_rate: Target sample rate
+            sample_width: Sample width in bytes (only 2 / 16-bit is supported)
+
+        Returns:
+            Resampled audio bytes
+        """
+        if from_rate == to_rate:
+            return audio_data
+
+        key = (from_rate, to_rate, sample_width)
+        converted, self._states[key] = audio_codec.ratecv(
+            audio_data, from_rate, to_rate, self._states.get(key)
+        )
+        return converted
+
+    def mulaw_8k_to_pcm16_16k(self, mulaw_data: bytes) -> bytes:
+        """
+        Convert one chunk of Twilio μ-law 8kHz to Sarvam PCM 16kHz
+
+        Args:
+            mulaw_data: μ-law encoded audio at 8kHz
+
+        Returns:
+            16-bit PCM audio at 16kHz
+        """
+        key = (8000, 16000, 2)
+        pcm_16k, self._states[key] = audio_codec.mulaw8k_to_pcm16_16k(
+            mulaw_data, self._states.get(key)
+        )
+        return pcm_16k
+
+    def pcm16_to_mulaw_8k(self, pcm_data: bytes, from_rate: int = 16000) -> bytes:
+        """
+        Convert one chunk of 16-bit PCM at any rate to Twilio μ-law 8kHz
+
+        Args:
+            pcm_data: 16-bit PCM audio
+            from_rate: Sample rate of pcm_data
+
+        Returns:
+            μ-law encoded audio at 8kHz
+        """
+        key = (from_rate, 8000, 2)
+        mulaw_8k, state = audio_codec.pcm16_to_mulaw8k(
+            pcm_data, from_rate, self._states.get(key)
+        )
+        if state is not None:
+            self._states[key] = state
+        return mulaw_8k
\ No newline at end of file
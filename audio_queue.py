@@ -0,0 +1,136 @@
+"""
+Bounded Audio Queue
+Closeable queue with a size limit, an overflow policy and per-item age tracking
+"""
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from async_channel import Channel
+
+# producer waits for room (backpressure towards whoever feeds the queue)
+BLOCK = "block"
+# producer never waits; the oldest items make room, and anything older than
+# max_age_sec is dropped on the next put
+DROP_OLDEST = "drop_oldest"
+
+
+class BoundedAudioQueue(Channel):
+    """
+    Audio hand-off between a call's tasks that can't grow without limit
+
+    Items are stamped when queued, so the age of what the consumer gets is
+    known. With BLOCK, put() waits while the queue is full and the time spent
+    waiting is recorded; with DROP_OLDEST, put() never waits and drops from
+    the head instead (stale items first, then the oldest while full).
+
+    Stats (per queue, i.e. per call):
+        depth_high_water   - most items queued at once
+        age_high_water_ms  - oldest item handed to the consumer
+        dropped / dropped_stale - items discarded by DROP_OLDEST (of which
+                             for passing max_age_sec)
+        overflowed         - items put_overflow() queued past maxsize
+        producer_wait_ms   - total time BLOCK producers waited for room
+    """
+
+    def __init__(self, maxsize: int, policy: str = BLOCK, max_age_sec: Optional[float] = None):
+        if policy not in (BLOCK, DROP_OLDEST):
+            raise ValueError(f"unknown overflow policy {policy!r}")
+        super().__init__(maxsize)
+        self.policy = policy
+        self.max_age_sec = max_age_sec
+
+        self.depth_high_water = 0
+        self.age_high_water_sec = 0.0
+        self.dropped = 0
+        self.dropped_stale = 0
+        self.overflowed = 0
+        self.producer_waits = 0
+        self.producer_wait_sec = 0.0
+
+    # asyncio.Queue storage hooks: items are kept as (queued_at, item)
+    def _init(self, maxsize):
+        self._queue = deque()
+
+    def _put(self, item):
+        self._queue.append((time.monotonic(), item))
+        self.depth_high_water = max(self.depth_high_water, len(self._queue))
+
+    def _get(self):
+        queued_at, item = self._queue.popleft()
+        self.age_high_water_sec = max(self.age_high_water_sec, time.monotonic() - queued_at)
+        return item
+
+    def oldest_age_sec(self) -> float:
+        return time.monotonic() - self._queue[0][0] if self._queue else 0.0
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+    def put_nowait(self, item):
+        if self.closed:
+            return
+        if self.policy == DROP_OLDEST:
+            if self.max_age_sec is not None:
+                while self._queue and self.oldest_age_sec() > self.max_age_sec:
+                    self._discard_oldest()
+                    self.dropped_stale += 1
+            while self.full():
+                self._discard_oldest()
+        super().put_nowait(item)
+
+    async def put(self, item):
+        if self.policy == DROP_OLDEST or not self.full():
+            self.put_nowait(item)
+            return
+        started = time.monotonic()
+        self.producer_waits += 1
+        try:
+            await super().put(item)
+        finally:
+            self.producer_wait_sec += time.monotonic() - started
+
+    def put_overflow(self, item):
+        """Queue even when full, for producers that can't wait (counted)"""
+        if self.closed:
+            return
+        if self.full():
+            self.overflowed += 1
+        self._put(item)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    def _discard_oldest(self):
+        self._queue.popleft()
+        self.task_done()
+        self.dropped += 1
+
+    # -------------------------------------------------------------------------
+    # Consumer side
+    # -------------------------------------------------------------------------
+    def clear(self) -> int:
+        """Discard everything queued (not counted as drops); returns how many"""
+        cleared = len(self._queue)
+        self._queue.clear()
+        for _ in range(cleared):
+            self.task_done()
+        # room again for blocked producers
+        for _ in range(cleared):
+            self._wakeup_next(self._putters)
+        return cleared
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "maxsize": self.maxsize,
+            "depth": self.qsize(),
+            "depth_high_water": self.depth_high_water,
+            "oldest_age_ms": round(self.oldest_age_sec() * 1000),
+            "age_high_water_ms": round(self.age_high_water_sec * 1000),
+            "dropped": self.dropped,
+            "dropped_stale": self.dropped_stale,
+            "overflowed": self.overflowed,
+            "producer_waits": self.producer_waits,
+            "producer_wait_ms": round(self.producer_wait_sec * 1000),
+        }
@@ -0,0 +1,819 @@
+"""
+Audio Pipeline Benchmarks
+Compares conversion paths used by the transcriber/synthesizer on synthetic telephony audio
+
+Usage:
+    python benchmarks.py                          # run everything
+    python benchmarks.py resampler                # run a single benchmark
+    python benchmarks.py pipeline --mulaw call.ulaw   # replay a recorded 8k μ-law stream
+    python benchmarks.py tts_output               # per-chunk CPU of each TTS output profile
+    python benchmarks.py stt_input                # upload CPU/bytes per call-minute of each STT input profile
+    python benchmarks.py consumers                # timer wakeups and teardown latency of transcript/audio consumers
+    python benchmarks.py --output new.json --compare old.json
+
+Results are also written as JSON (--output, default
+$TMPDIR/benchmark_results.json) so runs can be diffed across commits with
+--compare.
+"""
+import argparse
+import asyncio
+import base64
+import functools
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+import audio_codec
+from audio_processor import AudioProcessor, AudioStreamContext
+from sarvam_synthesizer import SarvamSynthesizer
+from sarvam_transcriber import SarvamTranscriber
+from stt_message_encoder import STTAudioMessageEncoder
+from twilio_events import loads, media_payload
+from twilio_media_encoder import TwilioMediaEncoder
+from tts_output_profile import audio_kind, to_mulaw_8k
+from stt_input_profile import PROFILES as STT_INPUT_PROFILES
+
+try:
+    import audioop  # removed in Python 3.13; only needed for baseline comparisons
+except ImportError:
+    audioop = None
+
+TWILIO_FRAME_BYTES = 160  # 20ms of μ-law @ 8kHz
+
+
+# -----------------------------------------------------------------------------
+# Synthetic audio
+# -----------------------------------------------------------------------------
+def make_pcm16_tone(duration_sec: float, sample_rate: int, freqs=(300.0, 1200.0, 2900.0)) -> bytes:
+    """Speech-band multi-tone PCM16 signal (deterministic, no randomness)"""
+    n = int(duration_sec * sample_rate)
+    amp = 9000 / len(freqs)
+    samples = bytearray(n * 2)
+    for i in range(n):
+        t = i / sample_rate
+        value = int(sum(amp * math.sin(2 * math.pi * f * t) for f in freqs))
+        samples[2 * i:2 * i + 2] = value.to_bytes(2, "little", signed=True)
+    return bytes(samples)
+
+
+def make_mulaw_8k(duration_sec: float) -> bytes:
+    return AudioProcessor.pcm16_to_mulaw(make_pcm16_tone(duration_sec, 8000))
+
+
+def split_frames(data: bytes, frame_bytes: int) -> List[bytes]:
+    return [data[i:i + frame_bytes] for i in range(0, len(data), frame_bytes)]
+
+
+def _time_per_frame(fn: Callable[[bytes], bytes], frames: List[bytes], repeat: int = 3) -> float:
+    """Best-of-N wall time per frame, in microseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for frame in frames:
+            fn(frame)
+        best = min(best, time.perf_counter() - start)
+    return best / len(frames) * 1e6
+
+
+def _error_stats(reference: bytes, candidate: bytes) -> Dict[str, float]:
+    """Deviation of a chunked conversion from the one-shot reference"""
+    n = min(len(reference), len(candidate)) // 2
+    ref = memoryview(reference).cast("h")[:n]
+    cand = memoryview(candidate).cast("h")[:n]
+    diffs = [abs(a - b) for a, b in zip(ref, cand)]
+    return {
+        "max_abs_error": max(diffs) if diffs else 0,
+        "rms_error": math.sqrt(sum(d * d for d in diffs) / n) if n else 0.0,
+        "length_delta_samples": len(candidate) // 2 - len(reference) // 2,
+    }
+
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+def bench_resampler(duration_sec: float = 10.0) -> Dict[str, Dict[str, float]]:
+    """
+    Stateless AudioProcessor path vs per-stream AudioStreamContext
+
+    Both directions are fed in realistic chunk sizes (20ms Twilio frames
+    inbound, ~90ms TTS chunks outbound) and compared against converting the
+    whole signal in one call. Boundary artifacts show up as error vs
+    that reference.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+
+    # Inbound: Twilio μ-law 8k frames → PCM16 16k
+    mulaw = make_mulaw_8k(duration_sec)
+    frames = split_frames(mulaw, TWILIO_FRAME_BYTES)
+    reference = audio_codec.mulaw8k_to_pcm16_16k(mulaw)[0]
+
+    stateless = b"".join(AudioProcessor.mulaw_8k_to_pcm16_16k(f) for f in frames)
+    ctx = AudioStreamContext()
+    stateful = b"".join(ctx.mulaw_8k_to_pcm16_16k(f) for f in frames)
+
+    results["inbound_stateless"] = {
+        "us_per_frame": _time_per_frame(AudioProcessor.mulaw_8k_to_pcm16_16k, frames),
+        **_error_stats(reference, stateless),
+    }
+    results["inbound_stateful"] = {
+        "us_per_frame": _time_per_frame(AudioStreamContext().mulaw_8k_to_pcm16_16k, frames),
+        **_error_stats(reference, stateful),
+    }
+
+    # Outbound: TTS PCM16 22.05k chunks → μ-law 8k
+    tts_rate = 22050
+    pcm = make_pcm16_tone(duration_sec, tts_rate)
+    chunks = split_frames(pcm, 2000 * 2)  # unaligned with the 8k output grid
+    reference = audio_codec.ratecv(pcm, tts_rate, 8000)[0]
+
+    def stateless_out(chunk: bytes) -> bytes:
+        return AudioProcessor.resample_audio(chunk, tts_rate, 8000, 2)
+
+    ctx = AudioStreamContext()
+    stateless = b"".join(stateless_out(c) for c in chunks)
+    stateful = b"".join(ctx.resample(c, tts_rate, 8000, 2) for c in chunks)
+
+    timing_ctx = AudioStreamContext()
+    results["outbound_stateless"] = {
+        "us_per_frame": _time_per_frame(
+            lambda c: AudioProcessor.pcm16_to_mulaw(stateless_out(c)), chunks
+        ),
+        **_error_stats(reference, stateless),
+    }
+    results["outbound_stateful"] = {
+        "us_per_frame": _time_per_frame(
+            lambda c: timing_ctx.pcm16_to_mulaw_8k(c, tts_rate), chunks
+        ),
+        **_error_stats(reference, stateful),
+    }
+    return results
+
+
+def bench_codec(duration_sec: float = 3600.0) -> Dict[str, Dict[str, float]]:
+    """
+    NumPy codec engine vs audioop on one hour of telephony audio
+
+    "stream" cases convert frame by frame the way a live call does (20ms
+    Twilio frames inbound, 2000-sample TTS chunks outbound); "bulk" cases
+    convert the whole hour in one call and show raw vectorized throughput.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+
+    # build the hour by tiling a short deterministic clip
+    clip_sec = 10.0
+    repeats = int(duration_sec / clip_sec)
+    mulaw = make_mulaw_8k(clip_sec) * repeats
+    frames = split_frames(mulaw, TWILIO_FRAME_BYTES)
+
+    tts_rate = 22050
+    pcm = make_pcm16_tone(clip_sec, tts_rate) * repeats
+    chunks = split_frames(pcm, 2000 * 2)
+
+    def run(name: str, fn: Callable[[bytes], bytes], items: List[bytes]):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "total_sec": elapsed,
+            "us_per_call": elapsed / len(items) * 1e6,
+            "realtime_factor": duration_sec / elapsed,
+        }
+
+    if audioop is not None:
+        state: Dict[str, object] = {"in": None, "out": None}
+
+        def audioop_in(frame: bytes) -> bytes:
+            out, state["in"] = audioop.ratecv(
+                audioop.ulaw2lin(frame, 2), 2, 1, 8000, 16000, state["in"]
+            )
+            return out
+
+        def audioop_out(chunk: bytes) -> bytes:
+            out, state["out"] = audioop.ratecv(chunk, 2, 1, tts_rate, 8000, state["out"])
+            return audioop.lin2ulaw(out, 2)
+
+        run("inbound_stream_audioop", audioop_in, frames)
+        run("outbound_stream_audioop", audioop_out, chunks)
+        run("inbound_bulk_audioop", audioop_in, [mulaw])
+        run("outbound_bulk_audioop", audioop_out, [pcm])
+
+    ctx = AudioStreamContext()
+    run("inbound_stream_numpy", ctx.mulaw_8k_to_pcm16_16k, frames)
+    run("outbound_stream_numpy", lambda c: ctx.pcm16_to_mulaw_8k(c, tts_rate), chunks)
+    ctx.reset()
+    run("inbound_bulk_numpy", ctx.mulaw_8k_to_pcm16_16k, [mulaw])
+    run("outbound_bulk_numpy", lambda c: ctx.pcm16_to_mulaw_8k(c, tts_rate), [pcm])
+    return results
+
+
+def _legacy_stt_message(pcm: bytes, sample_rate: int = 16000) -> str:
+    """STT upload as built before the header template: BytesIO + wave + json.dumps"""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    audio_b64 = base64.b64encode(buf.getvalue()).decode("ascii")
+    return json.dumps(
+        {
+            "audio": {
+                "data": audio_b64,
+                "sample_rate": str(sample_rate),
+                "encoding": "audio/wav",
+            }
+        }
+    )
+
+
+def bench_stt_chunk(chunks: int = 20000, chunk_ms: int = 400) -> Dict[str, Dict[str, float]]:
+    """
+    Per-chunk CPU time to turn buffered PCM into a Sarvam STT text message
+
+    "legacy" wraps with wave/BytesIO and json.dumps a nested dict; "template"
+    uses STTAudioMessageEncoder. Both produce identical strings.
+    """
+    pcm = make_pcm16_tone(chunk_ms / 1000, 16000)
+    encoder = STTAudioMessageEncoder(16000)
+    assert encoder.encode(pcm) == _legacy_stt_message(pcm)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fn in (("legacy", _legacy_stt_message), ("template", encoder.encode)):
+        start = time.process_time()
+        for _ in range(chunks):
+            fn(pcm)
+        cpu = time.process_time() - start
+        results[name] = {"cpu_us_per_chunk": cpu / chunks * 1e6}
+
+    results["template"]["speedup"] = (
+        results["legacy"]["cpu_us_per_chunk"] / results["template"]["cpu_us_per_chunk"]
+    )
+    return results
+
+
+def bench_stt_input(duration_sec: float = 60.0, chunk_ms: int = 400) -> Dict[str, Dict[str, float]]:
+    """
+    Upload cost of each STT input profile per call-minute
+
+    Replays Twilio frames through SarvamTranscriber._to_upload and the
+    profile's message encoder (local VAD and adaptive chunking off, fixed
+    chunk_ms uploads), best of 3; mulaw8k is then a passthrough of Twilio's
+    bytes. Accuracy is not measured here; compare
+    transcripts before switching a language/model to an 8k profile.
+    """
+    mulaw = make_mulaw_8k(duration_sec)
+    frames = split_frames(mulaw, TWILIO_FRAME_BYTES)
+    results: Dict[str, Dict[str, float]] = {}
+    for profile in STT_INPUT_PROFILES:
+        transcriber = SarvamTranscriber(input_profile=profile, local_vad=False, adaptive_chunking=False)
+        chunk_bytes = transcriber._bytes_per_ms * chunk_ms
+
+        best_cpu = float("inf")
+        wire_bytes = 0
+        for _ in range(3):
+            pcm = bytearray()
+            wire_bytes = 0
+            start = time.process_time()
+            for frame in frames:
+                pcm += transcriber._to_upload(frame)
+                if len(pcm) >= chunk_bytes:
+                    wire_bytes += len(transcriber._message_encoder.encode(pcm))
+                    pcm.clear()
+            best_cpu = min(best_cpu, time.process_time() - start)
+
+        per_min = 60 / duration_sec
+        results[profile] = {
+            "cpu_ms_per_call_min": best_cpu * 1000 * per_min,
+            "wire_bytes_per_call_min": wire_bytes * per_min,
+        }
+
+    baseline = results["wav16k"]
+    for profile, metrics in results.items():
+        if profile != "wav16k":
+            metrics["cpu_saving_pct"] = (1 - metrics["cpu_ms_per_call_min"] / baseline["cpu_ms_per_call_min"]) * 100
+            metrics["bytes_saving_pct"] = (1 - metrics["wire_bytes_per_call_min"] / baseline["wire_bytes_per_call_min"]) * 100
+    return results
+
+
+async def _legacy_transcripts(transcriber: SarvamTranscriber):
+    """transcripts() as it was: 1s timed get while connected"""
+    while transcriber.is_connected:
+        event = await transcriber.get_transcript(timeout=1.0)
+        if event:
+            yield event
+
+
+async def _legacy_audio_stream(synthesizer: SarvamSynthesizer):
+    """audio_stream() as it was: 1s timed get while connected or non-empty"""
+    while synthesizer.is_connected or not synthesizer.audio_queue.empty():
+        audio = await synthesizer.get_audio(timeout=1.0)
+        if audio:
+            yield audio
+        elif not synthesizer.is_connected:
+            break
+
+
+def bench_consumers(duration_sec: float = 5.5) -> Dict[str, Dict[str, float]]:
+    """
+    Timer wakeups and teardown latency of one call's stream consumers
+
+    A transcriber and a synthesizer (not connected) each get one consumer,
+    as VoiceAgent runs them; one event/chunk flows through, then the call
+    sits idle for duration_sec and is stopped. "legacy" consumes with the
+    old 1s timed polls on plain queues, "event_driven" with
+    transcripts()/audio_stream(). Wakeups are loop timers that fired while
+    idle; teardown is from stopping (legacy: clearing is_connected, which is
+    all the old stop() did for consumers) until both consumers returned.
+    Legacy teardown is 0-1000ms depending on where in the poll the stop
+    lands; the default duration stops mid-poll.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for name, transcripts, audio_stream in (
+        ("legacy", _legacy_transcripts, _legacy_audio_stream),
+        ("event_driven", SarvamTranscriber.transcripts, SarvamSynthesizer.audio_stream),
+    ):
+        loop = asyncio.new_event_loop()
+        fired = [0]
+        call_at = loop.call_at
+
+        def counting_call_at(when, callback, *args, context=None):
+            def run(*a):
+                fired[0] += 1
+                callback(*a)
+            return call_at(when, run, *args, context=context)
+
+        loop.call_at = counting_call_at
+
+        async def call():
+            transcriber = SarvamTranscriber()
+            synthesizer = SarvamSynthesizer()
+            transcriber.is_connected = synthesizer.is_connected = True
+            if name == "legacy":
+                transcriber.transcript_queue = asyncio.Queue()
+                synthesizer.audio_queue = asyncio.Queue()
+            received = []
+
+            async def consume(stream):
+                async for item in stream:
+                    received.append(item)
+
+            consumers = [
+                asyncio.create_task(consume(transcripts(transcriber))),
+                asyncio.create_task(consume(audio_stream(synthesizer))),
+            ]
+            await transcriber.transcript_queue.put({"type": "transcript"})
+            await synthesizer.audio_queue.put({"type": "audio", "data": b"\xff" * 160})
+            await asyncio.sleep(0)
+
+            fired[0] = 0
+            await asyncio.sleep(duration_sec)
+            wakeups = fired[0] - 1  # the sleep itself
+
+            start = time.perf_counter()
+            if name == "legacy":
+                transcriber.is_connected = synthesizer.is_connected = False
+            else:
+                await asyncio.gather(transcriber.stop(), synthesizer.stop())
+            await asyncio.gather(*consumers)
+            teardown_ms = (time.perf_counter() - start) * 1000
+            assert len(received) == 2
+            return wakeups, teardown_ms
+
+        try:
+            wakeups, teardown_ms = loop.run_until_complete(call())
+        finally:
+            loop.close()
+        results[name] = {
+            "timer_wakeups_per_call_sec": wakeups / duration_sec,
+            "teardown_ms": teardown_ms,
+        }
+    return results
+
+
+def _legacy_twilio_message(mulaw: bytes, stream_sid: str) -> str:
+    """Outbound media message as built before the encoder: dict + b64encode + send_json"""
+    audio_b64 = base64.b64encode(mulaw).decode("utf-8")
+    message = {
+        "event": "media",
+        "streamSid": stream_sid,
+        "media": {
+            "payload": audio_b64
+        }
+    }
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def bench_twilio_media(frames: int = 200000, batch_frames: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Outbound Twilio media messages per second per core
+
+    "legacy" rebuilds and serializes the message dict for every 20ms frame;
+    "encoder" splices the payload into TwilioMediaEncoder's pre-built JSON;
+    "encoder_batched" sends batch_frames frames per message. calls_per_core
+    is how many calls' outbound framing (50 frames/s each) one core sustains.
+    """
+    stream_sid = "MZ" + "0" * 32
+    frame = make_mulaw_8k(TWILIO_FRAME_BYTES / 8000)[:TWILIO_FRAME_BYTES]
+    batch = frame * batch_frames
+    encoder = TwilioMediaEncoder(stream_sid)
+    assert encoder.encode(frame) == _legacy_twilio_message(frame, stream_sid)
+
+    cases = (
+        ("legacy", lambda: _legacy_twilio_message(frame, stream_sid), frames, 1),
+        ("encoder", lambda: encoder.encode(frame), frames, 1),
+        ("encoder_batched", lambda: encoder.encode(batch), frames // batch_frames, batch_frames),
+    )
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fn, messages, per_message in cases:
+        start = time.process_time()
+        for _ in range(messages):
+            fn()
+        cpu = time.process_time() - start
+        results[name] = {
+            "cpu_us_per_message": cpu / messages * 1e6,
+            "messages_per_sec_per_core": messages / cpu,
+            "calls_per_core": messages * per_message / cpu / 50,
+        }
+
+    for name in ("encoder", "encoder_batched"):
+        results[name]["speedup_per_frame"] = (
+            results[name]["calls_per_core"] / results["legacy"]["calls_per_core"]
+        )
+    return results
+
+
+def _twilio_inbound_media(sequence: int, mulaw: bytes) -> str:
+    """Inbound media event as Twilio sends it"""
+    return json.dumps(
+        {
+            "event": "media",
+            "sequenceNumber": str(sequence),
+            "media": {
+                "track": "inbound",
+                "chunk": str(sequence),
+                "timestamp": str(sequence * 20),
+                "payload": base64.b64encode(mulaw).decode("ascii"),
+            },
+            "streamSid": "MZ" + "0" * 32,
+        },
+        separators=(",", ":"),
+    )
+
+
+def bench_twilio_inbound(events: int = 50000) -> Dict[str, Dict[str, float]]:
+    """
+    Inbound media events handled per second by one stream_handler loop
+
+    "legacy" parses every message with json.loads in a thread-pool hop (the
+    old asyncio.to_thread path); "fast_path" slices the payload out with
+    media_payload() on the loop thread. "general_parser" is the full parse
+    still used for control events (orjson when installed).
+    """
+    frame = make_mulaw_8k(TWILIO_FRAME_BYTES / 8000)[:TWILIO_FRAME_BYTES]
+    messages = [_twilio_inbound_media(i, frame) for i in range(events)]
+    assert media_payload(messages[0]) == loads(messages[0])["media"]["payload"]
+
+    async def process_audio(payload: str):
+        pass
+
+    async def legacy():
+        for message in messages:
+            data = await asyncio.to_thread(lambda: __import__("json").loads(message))
+            if data.get("event") == "media":
+                await process_audio(data["media"]["payload"])
+
+    async def fast_path():
+        for message in messages:
+            payload = media_payload(message)
+            if payload is not None:
+                await process_audio(payload)
+
+    async def general_parser():
+        for message in messages:
+            data = loads(message)
+            if data.get("event") == "media":
+                await process_audio(data["media"]["payload"])
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, handler in (("legacy", legacy), ("fast_path", fast_path), ("general_parser", general_parser)):
+        start = time.perf_counter()
+        asyncio.run(handler())
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "us_per_event": elapsed / events * 1e6,
+            "events_per_sec": events / elapsed,
+            "calls_per_worker": events / elapsed / 50,
+        }
+
+    for name in ("fast_path", "general_parser"):
+        results[name]["speedup"] = results[name]["events_per_sec"] / results["legacy"]["events_per_sec"]
+    return results
+
+
+def _sarvam_tts_message(pcm: bytes, sample_rate: int) -> str:
+    """TTS audio message as Sarvam streams it: base64 WAV inside JSON"""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return json.dumps(
+        {
+            "type": "audio",
+            "data": {
+                "content_type": "audio/wav",
+                "audio": base64.b64encode(buf.getvalue()).decode("ascii"),
+            },
+        }
+    )
+
+
+def _sarvam_tts_raw_message(payload: bytes, content_type: str) -> str:
+    """TTS audio message carrying headerless audio (pcm8k / mulaw8k profiles)"""
+    return json.dumps(
+        {
+            "type": "audio",
+            "data": {"content_type": content_type, "audio": base64.b64encode(payload).decode("ascii")},
+        }
+    )
+
+
+def bench_tts_output(
+    duration_sec: float = 60.0, chunk_ms: int = 100, model_rate: int = 22050
+) -> Dict[str, Dict[str, float]]:
+    """
+    Per-chunk CPU of each TTS output profile, Sarvam message in → μ-law 8k out
+
+    Each case runs what SarvamSynthesizer._receiver does per audio message:
+    JSON parse, base64 decode, then the stages that format needs ("wav" is
+    the original path at the model's native rate). cpu_us_per_call_sec is
+    the cost of one second of bot speech.
+    """
+    pcm_model = make_pcm16_tone(duration_sec, model_rate)
+    pcm_8k = make_pcm16_tone(duration_sec, 8000)
+    cases = {
+        "wav": [
+            _sarvam_tts_message(c, model_rate)
+            for c in split_frames(pcm_model, model_rate * 2 * chunk_ms // 1000)
+        ],
+        "pcm8k": [
+            _sarvam_tts_raw_message(c, "audio/l16; rate=8000")
+            for c in split_frames(pcm_8k, 16 * chunk_ms)
+        ],
+        "mulaw8k": [
+            _sarvam_tts_raw_message(audio_codec.lin2ulaw(c), "audio/x-mulaw; rate=8000")
+            for c in split_frames(pcm_8k, 16 * chunk_ms)
+        ],
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    for profile, messages in cases.items():
+        context = AudioStreamContext()
+
+        def receive(message: str, profile: str = profile, context: AudioStreamContext = context) -> bytes:
+            inner = json.loads(message)["data"]
+            raw = base64.b64decode(inner["audio"])
+            return to_mulaw_8k(raw, audio_kind(raw, inner["content_type"], profile), context)
+
+        us_per_chunk = _time_per_frame(receive, messages)
+        results[profile] = {
+            "us_per_chunk": us_per_chunk,
+            "cpu_us_per_call_sec": us_per_chunk * 1000 / chunk_ms,
+            "message_bytes": sum(len(m) for m in messages) / len(messages),
+        }
+
+    for profile in ("pcm8k", "mulaw8k"):
+        results[profile]["speedup"] = results["wav"]["us_per_chunk"] / results[profile]["us_per_chunk"]
+    return results
+
+
+def _allocations_per_frame(fn: Callable[[Any], Any], items: List[Any]) -> Dict[str, float]:
+    """
+    tracemalloc view of one stage: memory blocks still alive per call
+    (outputs and carried state, kept referenced here) and the peak of
+    short-lived allocations a single call makes
+    """
+    sample = items[: min(len(items), 500)]
+    outputs = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        peak_total = 0
+        for item in sample:
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            outputs.append(fn(item))
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "allocs_per_frame": blocks / len(sample),
+        "peak_bytes_per_frame": peak_total / len(sample),
+    }
+
+
+def bench_pipeline(
+    duration_sec: float = 30.0,
+    mulaw_path: Optional[str] = None,
+    stt_chunk_ms: int = 400,
+    tts_chunk_ms: int = 100,
+    tts_rate: int = 16000,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Every per-call audio conversion, stage by stage, on replayed streams
+
+    Inbound replays a μ-law 8k stream (a recording via mulaw_path, else a
+    synthetic tone) as Twilio media events; outbound replays Sarvam-style
+    base64 WAV messages. Each stage reports ns and allocations per unit
+    ("frame": a 20ms Twilio frame, an STT upload or a TTS message) and how
+    many units one second of call produces. Stages marked in_call_path are
+    the ones the live code runs; their sum gives per-call CPU and
+    "max_calls_per_core" in the "call" row.
+    """
+    if mulaw_path:
+        with open(mulaw_path, "rb") as f:
+            mulaw = f.read()
+        if not mulaw:
+            raise ValueError(f"{mulaw_path} is empty")
+    else:
+        mulaw = make_mulaw_8k(duration_sec)
+    frames = [f for f in split_frames(mulaw, TWILIO_FRAME_BYTES) if len(f) == TWILIO_FRAME_BYTES]
+    media_events = [_twilio_inbound_media(i, f) for i, f in enumerate(frames)]
+    payloads = [media_payload(m) for m in media_events]
+
+    stt_rate = 16000
+    stt_pcm = AudioStreamContext().mulaw_8k_to_pcm16_16k(b"".join(frames))
+    stt_chunks = [
+        c for c in split_frames(stt_pcm, stt_rate * 2 * stt_chunk_ms // 1000)
+        if len(c) == stt_rate * 2 * stt_chunk_ms // 1000
+    ]
+    transcriber = SarvamTranscriber()
+    wav_chunks = [transcriber._pcm16_to_wav(c, stt_rate) for c in stt_chunks]
+
+    tts_pcm = make_pcm16_tone(min(duration_sec, 10.0), tts_rate)
+    tts_pcm_chunks = split_frames(tts_pcm, tts_rate * 2 * tts_chunk_ms // 1000)
+    tts_messages = [_sarvam_tts_message(c, tts_rate) for c in tts_pcm_chunks]
+    tts_b64 = [json.loads(m)["data"]["audio"] for m in tts_messages]
+    tts_wavs = [base64.b64decode(a) for a in tts_b64]
+
+    inbound_ctx = AudioStreamContext()
+    outbound_ctx = AudioStreamContext()
+    media_encoder = TwilioMediaEncoder("MZ" + "0" * 32)
+
+    frames_per_sec = 1000 / 20
+    stt_per_sec = 1000 / stt_chunk_ms
+    tts_per_sec = 1000 / tts_chunk_ms
+
+    # name, fn, inputs, units per call-second, in_call_path
+    stages = (
+        ("twilio_in_json_framing", media_payload, media_events, frames_per_sec, True),
+        ("twilio_in_base64", base64.b64decode, payloads, frames_per_sec, True),
+        ("mulaw_8k_to_pcm16_16k", AudioProcessor.mulaw_8k_to_pcm16_16k, frames, frames_per_sec, False),
+        ("mulaw_8k_to_pcm16_16k_ctx", inbound_ctx.mulaw_8k_to_pcm16_16k, frames, frames_per_sec, True),
+        ("stt_pcm16_to_wav", lambda c: transcriber._pcm16_to_wav(c, stt_rate), stt_chunks, stt_per_sec, False),
+        ("stt_base64", base64.b64encode, wav_chunks, stt_per_sec, False),
+        ("stt_message", transcriber._message_encoder.encode, stt_chunks, stt_per_sec, True),
+        ("tts_json_framing", json.loads, tts_messages, tts_per_sec, True),
+        ("tts_base64", base64.b64decode, tts_b64, tts_per_sec, True),
+        ("wav_to_pcm", AudioProcessor.wav_to_pcm, tts_wavs, tts_per_sec, True),
+        ("pcm16_16k_to_mulaw_8k", AudioProcessor.pcm16_16k_to_mulaw_8k, tts_pcm_chunks, tts_per_sec, False),
+        (
+            "pcm16_16k_to_mulaw_8k_ctx",
+            lambda c: outbound_ctx.pcm16_to_mulaw_8k(c, tts_rate),
+            tts_pcm_chunks, tts_per_sec, True,
+        ),
+        ("twilio_out_message", media_encoder.encode, frames, frames_per_sec, True),
+    )
+
+    results: Dict[str, Dict[str, float]] = {}
+    call_ns_per_sec = 0.0
+    for name, fn, items, per_sec, in_call_path in stages:
+        ns_per_frame = _time_per_frame(fn, items) * 1000
+        results[name] = {
+            "ns_per_frame": ns_per_frame,
+            **_allocations_per_frame(fn, items),
+            "frames_per_call_sec": per_sec,
+            "in_call_path": in_call_path,
+        }
+        if in_call_path:
+            call_ns_per_sec += ns_per_frame * per_sec
+
+    results["call"] = {
+        "cpu_us_per_call_sec": call_ns_per_sec / 1000,
+        "max_calls_per_core": 1e9 / call_ns_per_sec,
+    }
+    return results
+
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, Dict[str, float]]]] = {
+    "resampler": bench_resampler,
+    "codec": bench_codec,
+    "stt_chunk": bench_stt_chunk,
+    "twilio_media": bench_twilio_media,
+    "twilio_inbound": bench_twilio_inbound,
+    "pipeline": bench_pipeline,
+    "tts_output": bench_tts_output,
+    "stt_input": bench_stt_input,
+    "consumers": bench_consumers,
+}
+
+
+def _run_metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]):
+    """Print the relative change of every numeric metric present in both runs"""
+    print(f"\n=== compare {baseline['meta'].get('git_commit')} -> {current['meta'].get('git_commit')} ===")
+    for name, cases in current["benchmarks"].items():
+        old_cases = baseline["benchmarks"].get(name, {})
+        for case, metrics in cases.items():
+            old_metrics = old_cases.get(case, {})
+            for key, value in metrics.items():
+                old = old_metrics.get(key)
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                if not isinstance(old, (int, float)) or not old:
+                    continue
+                change = (value - old) / abs(old) * 100
+                metric = f"{name}.{case}.{key}"
+                print(f"{metric:<60} {old:>14.2f} -> {value:>14.2f} ({change:+.1f}%)")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Audio pipeline benchmarks")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run ({', '.join(BENCHMARKS)})")
+    parser.add_argument(
+        "--output",
+        default=os.path.join(tempfile.gettempdir(), "benchmark_results.json"),
+        help="machine-readable results file",
+    )
+    parser.add_argument("--compare", metavar="BASELINE", help="results file from an earlier run to diff against")
+    parser.add_argument("--mulaw", metavar="PATH", help="raw 8kHz μ-law recording to replay in 'pipeline'")
+    args = parser.parse_args(argv)
+
+    benchmarks = dict(BENCHMARKS)
+    if args.mulaw:
+        benchmarks["pipeline"] = functools.partial(bench_pipeline, mulaw_path=args.mulaw)
+
+    names = args.names or list(benchmarks)
+    for name in names:
+        if name not in benchmarks:
+            print(f"Unknown benchmark: {name} (choose from {', '.join(benchmarks)})")
+            return 1
+
+    report: Dict[str, Any] = {"meta": _run_metadata(), "benchmarks": {}}
+    for name in names:
+        print(f"\n=== {name} ===")
+        results = benchmarks[name]()
+        report["benchmarks"][name] = results
+        for case, metrics in results.items():
+            formatted = ", ".join(
+                f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}"
+                for k, v in metrics.items()
+            )
+            print(f"{case:<24} {formatted}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""
+Clause Segmentation
+Splits a streaming LLM reply into speakable clauses for incremental TTS
+"""
+from typing import List, Optional
+
+from config import Config
+
+# sentence enders (incl. Devanagari danda) always close a clause; soft
+# punctuation only once the clause is long enough to be worth a TTS request
+HARD_BOUNDARIES = ".!?।॥"
+SOFT_BOUNDARIES = ",;:"
+
+
+class ClauseSegmenter:
+    """
+    Accumulates LLM tokens and cuts them into clauses as they arrive
+
+    A clause ends at sentence punctuation followed by whitespace (so "3.5"
+    and "Mr.Smith" are not split), at a newline, at a comma/semicolon/colon
+    once it is at least min_chars long, or at the last space before
+    max_chars when the model produces a long run without punctuation.
+    Words are never cut, so control tokens like HANGUP_NOW always end up
+    whole inside one clause.
+    """
+
+    def __init__(
+        self,
+        min_chars: int = Config.LLM_CLAUSE_MIN_CHARS,
+        max_chars: int = Config.LLM_CLAUSE_MAX_CHARS,
+    ):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+
+    def _find_cut(self) -> Optional[int]:
+        buf = self._buffer
+        for i in range(len(buf) - 1):
+            ch = buf[i]
+            if ch == "\n":
+                return i + 1
+            if not buf[i + 1].isspace():
+                continue
+            if ch in HARD_BOUNDARIES:
+                return i + 1
+            if ch in SOFT_BOUNDARIES and i + 1 >= self.min_chars:
+                return i + 1
+
+        if len(buf) >= self.max_chars:
+            space = buf.rfind(" ", self.min_chars, self.max_chars)
+            if space > 0:
+                return space + 1
+        return None
+
+    def feed(self, text: str) -> List[str]:
+        """Add a token; returns any clauses that are now complete"""
+        self._buffer += text
+        clauses = []
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                break
+            clause = self._buffer[:cut].strip()
+            self._buffer = self._buffer[cut:].lstrip()
+            if clause:
+                clauses.append(clause)
+        return clauses
+
+    def flush(self) -> Optional[str]:
+        """Whatever is left once the stream ends"""
+        clause = self._buffer.strip()
+        self._buffer = ""
+        return clause or None
@@ -16,6 +16,17 @@ class Config:
     AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
     AZURE_OPENAI_VERSION = os.getenv("AZURE_OPENAI_VERSION", "2024-02-01")
     AZURE_OPENAI_DEPLOYMENT = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4")
+    LLM_POOL_MAX_CONNECTIONS = int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "100"))  # shared across all calls
+    LLM_POOL_MAX_KEEPALIVE = int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "20"))
+    LLM_POOL_KEEPALIVE_EXPIRY_SEC = float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY_SEC", "120"))
+    LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() == "true"  # used only if the h2 package is installed
+    LLM_PREWARM_CONNECTIONS = int(os.getenv("LLM_PREWARM_CONNECTIONS", "2"))  # 0 disables pre-warming
+    LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"  # backup request on a late first token; enable with a secondary deployment
+    LLM_HEDGE_DEPLOYMENT = os.getenv("LLM_HEDGE_DEPLOYMENT_NAME", "")  # same Azure resource; defaults to the primary deployment
+    LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))  # first-token deadline = this percentile of recent latency
+    LLM_HEDGE_MIN_DEADLINE_MS = float(os.getenv("LLM_HEDGE_MIN_DEADLINE_MS", "400"))
+    LLM_HEDGE_MAX_DEADLINE_MS = float(os.getenv("LLM_HEDGE_MAX_DEADLINE_MS", "2500"))
+    LLM_HEDGE_MAX_RATIO = float(os.getenv("LLM_HEDGE_MAX_RATIO", "0.1"))  # sustained hedges per request (caps extra TPM)
     
     TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
     TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
@@ -34,6 +45,28 @@ class Config:
     TRANSCRIBER_LANGUAGE = os.getenv("TRANSCRIBER_LANGUAGE", "en-IN")  # Hindi
     TRANSCRIBER_VAD_SENSITIVITY = os.getenv("TRANSCRIBER_VAD_SENSITIVITY", "true")
     
+    # Local VAD gate (drops silence before it is uploaded to Sarvam STT)
+    STT_LOCAL_VAD_ENABLED = os.getenv("STT_LOCAL_VAD_ENABLED", "false").lower() == "true"
+    STT_VAD_RMS_THRESHOLD = int(os.getenv("STT_VAD_RMS_THRESHOLD", "300"))
+    STT_VAD_MAX_ZCR = float(os.getenv("STT_VAD_MAX_ZCR", "0.45"))
+    STT_VAD_HANGOVER_MS = int(os.getenv("STT_VAD_HANGOVER_MS", "800"))
+    STT_VAD_PREROLL_MS = int(os.getenv("STT_VAD_PREROLL_MS", "300"))
+    STT_VAD_KEEPALIVE_MS = int(os.getenv("STT_VAD_KEEPALIVE_MS", "2000"))
+    
+    # Adaptive STT chunking (small uploads at utterance edges)
+    STT_ADAPTIVE_CHUNKING = os.getenv("STT_ADAPTIVE_CHUNKING", "false").lower() == "true"  # opt-in; LLM_SPECULATIVE needs it
+    STT_EDGE_CHUNK_MS = int(os.getenv("STT_EDGE_CHUNK_MS", "100"))
+    STT_ONSET_WINDOW_MS = int(os.getenv("STT_ONSET_WINDOW_MS", "300"))
+    STT_POST_SPEECH_WAIT_MS = int(os.getenv("STT_POST_SPEECH_WAIT_MS", "400"))  # after END_SPEECH, wait this long for words after an early transcript
+    STT_INPUT_PROFILE = os.getenv("STT_INPUT_PROFILE", "wav16k")  # wav16k | pcm8k | mulaw8k (see stt_input_profile)
+    STT_INPUT_PROFILE_OVERRIDES = os.getenv("STT_INPUT_PROFILE_OVERRIDES", "")  # e.g. "hi-IN=pcm8k,en-IN/saarika:v2.5=mulaw8k"
+    STT_AUDIO_QUEUE_MAX_MS = int(os.getenv("STT_AUDIO_QUEUE_MAX_MS", "10000"))  # memory cap for inbound audio (~80KB); oldest dropped past this
+    STT_AUDIO_QUEUE_MAX_AGE_MS = int(os.getenv("STT_AUDIO_QUEUE_MAX_AGE_MS", "2000"))  # queued frames older than this are dropped
+    STT_POOL_ENABLED = os.getenv("STT_POOL_ENABLED", "true").lower() == "true"  # warm STT websockets for call start
+    STT_POOL_SIZE = int(os.getenv("STT_POOL_SIZE", "2"))  # idle sockets kept per URL
+    STT_POOL_MAX_AGE_SEC = float(os.getenv("STT_POOL_MAX_AGE_SEC", "120"))  # idle sockets older than this are replaced
+    STT_POOL_PING_INTERVAL_SEC = float(os.getenv("STT_POOL_PING_INTERVAL_SEC", "10"))
+    
     # Synthesizer Settings
     SYNTHESIZER_MODEL = os.getenv("SYNTHESIZER_MODEL", "bulbul:v2")
     SYNTHESIZER_VOICE = os.getenv("SYNTHESIZER_VOICE", "manisha")
@@ -42,16 +75,50 @@ class Config:
     SYNTHESIZER_PITCH = float(os.getenv("SYNTHESIZER_PITCH", "0"))
     SYNTHESIZER_LOUDNESS = float(os.getenv("SYNTHESIZER_LOUDNESS", "1.0"))
     SYNTHESIZER_BUFFER_SIZE = int(os.getenv("SYNTHESIZER_BUFFER_SIZE", "100"))
+    TTS_OUTPUT_PROFILE = os.getenv("TTS_OUTPUT_PROFILE", "wav")  # wav | pcm8k | mulaw8k (opt-in until verified live); falls back to wav if rejected
+    TTS_AUDIO_QUEUE_MAX_CHUNKS = int(os.getenv("TTS_AUDIO_QUEUE_MAX_CHUNKS", "64"))  # receiver waits (backpressure to Sarvam) past this
+    TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"  # reuse audio for repeated phrases
+    TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "")  # disk tier, opt-in; empty = memory only
+    TTS_CACHE_MEMORY_MB = int(os.getenv("TTS_CACHE_MEMORY_MB", "32"))  # in-process LRU tier
+    TTS_CACHE_DISK_MB = int(os.getenv("TTS_CACHE_DISK_MB", "512"))  # mmap'd disk tier, oldest trimmed first
+    TTS_CACHE_MAX_CHARS = int(os.getenv("TTS_CACHE_MAX_CHARS", "200"))  # longer utterances are not cached
+    TTS_CACHE_PREWARM = os.getenv("TTS_CACHE_PREWARM", "true").lower() == "true"  # synthesize fixed phrases at startup
+    TTS_POOL_ENABLED = os.getenv("TTS_POOL_ENABLED", "true").lower() == "true"  # pre-connected TTS websockets
+    TTS_POOL_MIN_IDLE = int(os.getenv("TTS_POOL_MIN_IDLE", "1"))  # per voice/language/model
+    TTS_POOL_MAX_IDLE = int(os.getenv("TTS_POOL_MAX_IDLE", "8"))
+    TTS_POOL_MAX_AGE_SEC = float(os.getenv("TTS_POOL_MAX_AGE_SEC", "300"))  # connections older than this are replaced
+    TTS_POOL_REFILL_HORIZON_SEC = float(os.getenv("TTS_POOL_REFILL_HORIZON_SEC", "10"))  # idle target = call rate x this
     
     # Audio Settings
     TWILIO_SAMPLE_RATE = 8000  # Twilio uses 8kHz μ-law
     SARVAM_SAMPLE_RATE = 16000  # Sarvam uses 16kHz linear PCM
     AUDIO_CHUNK_SIZE = int(os.getenv("AUDIO_CHUNK_SIZE", "640"))  # bytes
+    PLAYOUT_LEAD_MS = int(os.getenv("PLAYOUT_LEAD_MS", "60"))  # how far ahead of real time Twilio frames are sent
+    PLAYOUT_BATCH_FRAMES = int(os.getenv("PLAYOUT_BATCH_FRAMES", "1"))  # max 20ms frames per Twilio media message
     
     # Agent Settings
     MAX_QUESTIONS = int(os.getenv("MAX_QUESTIONS", "15"))
     INTERRUPTION_MIN_LENGTH = int(os.getenv("INTERRUPTION_MIN_LENGTH", "3"))
     VAD_TIMEOUT_MS = int(os.getenv("VAD_TIMEOUT_MS", "1200"))
+    LLM_SPECULATIVE = os.getenv("LLM_SPECULATIVE", "false").lower() == "true"  # start the LLM turn on an early STT transcript (needs STT_ADAPTIVE_CHUNKING)
+    LLM_SPECULATIVE_CONFIRM_SEC = float(os.getenv("LLM_SPECULATIVE_CONFIRM_SEC", "3.0"))  # max wait for the final transcript
+    LLM_STREAMING_TTS = os.getenv("LLM_STREAMING_TTS", "true").lower() == "true"  # speak LLM clauses as they stream in
+    LLM_CLAUSE_MIN_CHARS = int(os.getenv("LLM_CLAUSE_MIN_CHARS", "30"))  # min clause length before splitting at , ; :
+    LLM_CLAUSE_MAX_CHARS = int(os.getenv("LLM_CLAUSE_MAX_CHARS", "120"))  # force a split at a space past this length
+    CONTEXT_KEEP_TURNS = int(os.getenv("CONTEXT_KEEP_TURNS", "6"))  # recent messages always sent verbatim
+    CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1500"))  # cap on history (summary + turns) per request
+    CONTEXT_SUMMARY_MAX_TOKENS = int(os.getenv("CONTEXT_SUMMARY_MAX_TOKENS", "200"))
+    CONTEXT_SUMMARY_BATCH = int(os.getenv("CONTEXT_SUMMARY_BATCH", "6"))  # messages past keep_turns before a fold (sooner if over budget)
+    PROMPT_BRIEF_ENABLED = os.getenv("PROMPT_BRIEF_ENABLED", "true").lower() == "true"  # condense resume/JD once per document
+    PROMPT_BRIEF_MEMORY_ENTRIES = int(os.getenv("PROMPT_BRIEF_MEMORY_ENTRIES", "256"))  # in-process LRU
+    PROMPT_BRIEF_CACHE_DIR = os.getenv("PROMPT_BRIEF_CACHE_DIR", "")  # disk tier holds resume summaries: opt-in, empty = memory only
+    PROMPT_BRIEF_CACHE_TTL_HOURS = float(os.getenv("PROMPT_BRIEF_CACHE_TTL_HOURS", "24"))  # disk entries older than this are deleted
+    PROMPT_BRIEF_CACHE_MAX_MB = int(os.getenv("PROMPT_BRIEF_CACHE_MAX_MB", "16"))  # disk tier, oldest trimmed first
+    PROMPT_BRIEF_MIN_TOKENS = int(os.getenv("PROMPT_BRIEF_MIN_TOKENS", "300"))  # shorter documents are used as-is
+    PROMPT_BRIEF_MAX_TOKENS = int(os.getenv("PROMPT_BRIEF_MAX_TOKENS", "300"))
+    PROMPT_BRIEF_WAIT_SEC = float(os.getenv("PROMPT_BRIEF_WAIT_SEC", "2.0"))  # max wait on the first turn before using raw text
+    
+    TURN_TRACE_WINDOW = int(os.getenv("TURN_TRACE_WINDOW", "2000"))  # recent turns kept for latency percentiles
     
     # Debug Settings
     ENABLE_TEST_TONE = os.getenv("ENABLE_TEST_TONE", "false").lower() == "true"
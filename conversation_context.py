@@ -0,0 +1,180 @@
+"""
+Conversation Context
+Bounded LLM history: recent turns verbatim, older turns folded into a rolling summary
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from config import Config
+from llm_client import llm_client_manager
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken  # optional, exact counts for OpenAI models
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count_tokens(text: str) -> int:
+        return len(_encoding.encode(text))
+except ImportError:
+    def count_tokens(text: str) -> int:
+        # ~4 bytes per token holds for English and for UTF-8 Devanagari
+        return (len(text.encode("utf-8")) + 3) // 4
+
+# role/formatting overhead the chat format adds per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a phone conversation between an AI "
+    "caller (assistant) and a person (user). Update the summary with the new "
+    "turns. Keep every fact the person stated, every question already asked "
+    "and any commitments made. Be terse; no preamble."
+)
+
+
+def _message_tokens(message: Dict[str, str]) -> int:
+    return count_tokens(message.get("content", "")) + MESSAGE_OVERHEAD_TOKENS
+
+
+class ConversationContext:
+    """
+    Builds the message list sent to the LLM for each turn
+
+    Works on the agent's conversation list in place (it stays the complete
+    record). The last keep_turns messages always go out verbatim; anything
+    older is folded into a running summary by a background LLM call, so the
+    turn that triggers it does not wait. Folds are batched: one runs once
+    fold_batch messages beyond keep_turns have built up, or earlier if the
+    history would no longer fit token_budget. Until a fold completes, unsummarized
+    messages are still sent verbatim, oldest dropped first if the history
+    (summary + messages) would exceed token_budget. The system prompt is not
+    counted against the budget; it is fixed for the call.
+    """
+
+    def __init__(
+        self,
+        conversation: List[Dict[str, str]],
+        keep_turns: int = Config.CONTEXT_KEEP_TURNS,
+        token_budget: int = Config.CONTEXT_TOKEN_BUDGET,
+        summary_max_tokens: int = Config.CONTEXT_SUMMARY_MAX_TOKENS,
+        fold_batch: int = Config.CONTEXT_SUMMARY_BATCH,
+    ):
+        self.conversation = conversation
+        self.keep_turns = keep_turns
+        self.token_budget = token_budget
+        self.summary_max_tokens = summary_max_tokens
+        self.fold_batch = max(1, fold_batch)
+
+        self.summary = ""
+        # conversation[:summarized_upto] is covered by the summary
+        self.summarized_upto = 0
+        self._summary_task: Optional[asyncio.Task] = None
+
+        # Stats
+        self.prompt_tokens_per_turn: List[int] = []
+        self.summaries_made = 0
+        self.messages_dropped = 0
+
+    def build_messages(
+        self, system_prompt: str, pending: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        System prompt + summary + recent turns, within the token budget
+
+        pending messages (not yet in the conversation) are appended as-is.
+        """
+        self._maybe_summarize()
+
+        history: List[Dict[str, str]] = []
+        used = 0
+        if self.summary:
+            summary_message = {
+                "role": "system",
+                "content": f"Summary of the conversation so far:\n{self.summary}",
+            }
+            history.append(summary_message)
+            used += _message_tokens(summary_message)
+
+        recent = self.conversation[self.summarized_upto:]
+        tokens = [_message_tokens(m) for m in recent]
+        # drop oldest unsummarized messages if over budget; always keep the latest
+        start = 0
+        while start < len(recent) - 1 and used + sum(tokens[start:]) > self.token_budget:
+            start += 1
+        if start:
+            self.messages_dropped += start
+            logger.debug(f"✂️ Context over budget, {start} old messages left out")
+        history.extend(recent[start:])
+        if pending:
+            history.extend(pending)
+
+        messages = [{"role": "system", "content": system_prompt}] + history
+        prompt_tokens = sum(_message_tokens(m) for m in messages)
+        self.prompt_tokens_per_turn.append(prompt_tokens)
+        return messages
+
+    # -------------------------------------------------------------------------
+    # Rolling summary
+    # -------------------------------------------------------------------------
+    def _maybe_summarize(self):
+        fold_upto = len(self.conversation) - self.keep_turns
+        if fold_upto <= self.summarized_upto:
+            return
+        if self._summary_task and not self._summary_task.done():
+            return
+        if fold_upto - self.summarized_upto < self.fold_batch and not self._over_budget():
+            return
+        self._summary_task = asyncio.create_task(self._summarize(fold_upto))
+
+    def _over_budget(self) -> bool:
+        used = sum(_message_tokens(m) for m in self.conversation[self.summarized_upto:])
+        if self.summary:
+            used += count_tokens(self.summary) + MESSAGE_OVERHEAD_TOKENS
+        return used > self.token_budget
+
+    async def _summarize(self, fold_upto: int):
+        turns = self.conversation[self.summarized_upto:fold_upto]
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in turns)
+        try:
+            response = await llm_client_manager.get_client().chat.completions.create(
+                model=Config.AZURE_OPENAI_DEPLOYMENT,
+                messages=[
+                    {"role": "system", "content": SUMMARY_INSTRUCTIONS},
+                    {
+                        "role": "user",
+                        "content": f"Current summary:\n{self.summary or '(none)'}\n\nNew turns:\n{transcript}",
+                    },
+                ],
+                temperature=0.2,
+                max_tokens=self.summary_max_tokens,
+            )
+            summary = (response.choices[0].message.content or "").strip()
+            if not summary:
+                return
+            self.summary = summary
+            self.summarized_upto = fold_upto
+            self.summaries_made += 1
+            logger.info(f"🗜️ Folded {len(turns)} messages into summary ({count_tokens(summary)} tokens)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # older turns stay verbatim; the next turn retries
+            logger.warning(f"⚠️ Context summarization failed: {e}")
+
+    def close(self):
+        if self._summary_task and not self._summary_task.done():
+            self._summary_task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        per_turn = self.prompt_tokens_per_turn
+        return {
+            "messages": len(self.conversation),
+            "summarized_messages": self.summarized_upto,
+            "summary_tokens": count_tokens(self.summary) if self.summary else 0,
+            "summaries_made": self.summaries_made,
+            "messages_dropped": self.messages_dropped,
+            "prompt_tokens_per_turn": per_turn,
+            "avg_prompt_tokens": round(sum(per_turn) / len(per_turn)) if per_turn else None,
+        }
@@ -0,0 +1,210 @@
+"""
+Document Briefs
+Condenses resumes and job descriptions into short structured briefs, cached by content hash
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config import Config
+from conversation_context import count_tokens
+from llm_client import llm_client_manager
+
+logger = logging.getLogger(__name__)
+
+BRIEF_INSTRUCTIONS = {
+    "resume": (
+        "Condense this resume into a brief for a phone interviewer. Use short "
+        "labelled lines: Current role, Total experience, Key skills, Notable "
+        "projects, Education, Other. Keep names of technologies, employers and "
+        "numbers exactly; drop everything else. No preamble."
+    ),
+    "job_description": (
+        "Condense this job description into a brief for a phone interviewer. "
+        "Use short labelled lines: Role, Seniority, Must-have skills, "
+        "Nice-to-have skills, Key responsibilities, Other requirements. Keep "
+        "technologies and numbers exactly; drop boilerplate. No preamble."
+    ),
+}
+
+
+class DocumentBriefCache:
+    """
+    Resume/JD condensation shared by every call in the process
+
+    Briefs are keyed by a hash of the document kind and text and kept in a
+    bounded in-process LRU, so repeat candidates and shared job descriptions
+    are condensed once. With a cache_dir, briefs are also stored as one JSON
+    file each so they survive restarts; since resume briefs are personal
+    data, that tier is opt-in, entries expire after ttl_sec and the oldest
+    are trimmed past disk_bytes. Concurrent calls asking for the same
+    document share one in-flight LLM request. Documents already under
+    min_tokens are used as-is.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = Config.PROMPT_BRIEF_CACHE_DIR,
+        min_tokens: int = Config.PROMPT_BRIEF_MIN_TOKENS,
+        max_tokens: int = Config.PROMPT_BRIEF_MAX_TOKENS,
+        memory_entries: int = Config.PROMPT_BRIEF_MEMORY_ENTRIES,
+        ttl_sec: float = Config.PROMPT_BRIEF_CACHE_TTL_HOURS * 3600,
+        disk_bytes: int = Config.PROMPT_BRIEF_CACHE_MAX_MB * 1024 * 1024,
+    ):
+        self.cache_dir = cache_dir
+        self.min_tokens = min_tokens
+        self.max_tokens = max_tokens
+        self.memory_entries = memory_entries
+        self.ttl_sec = ttl_sec
+        self.disk_bytes = disk_bytes
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self.evictions = 0
+        self.expired = 0
+
+    @staticmethod
+    def key(kind: str, text: str) -> str:
+        return hashlib.sha256(f"{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key: str, brief: str):
+        self._memory[key] = brief
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _recall(self, key: str) -> Optional[str]:
+        brief = self._memory.get(key)
+        if brief is not None:
+            self._memory.move_to_end(key)
+        return brief
+
+    def _load(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["created"] > self.ttl_sec:
+                self.expired += 1
+                os.remove(path)
+                return None
+            return entry["brief"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, key: str, kind: str, brief: str):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"kind": kind, "brief": brief, "created": time.time()}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+            self._trim_disk()
+        except OSError as e:
+            logger.warning(f"⚠️ Could not persist {kind} brief: {e}")
+
+    def _trim_disk(self):
+        # mtime is the write time: drop expired entries, then oldest past the size cap
+        now = time.time()
+        entries = sorted(
+            (e for e in os.scandir(self.cache_dir) if e.name.endswith(".json")),
+            key=lambda e: e.stat().st_mtime,
+        )
+        used = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            expired = now - entry.stat().st_mtime > self.ttl_sec
+            if not expired and used <= self.disk_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            used -= size
+            if expired:
+                self.expired += 1
+            else:
+                self.evictions += 1
+
+    async def get_brief(self, kind: str, text: str) -> str:
+        """Condensed text for a document (the document itself if short or on failure)"""
+        if not text or count_tokens(text) < self.min_tokens:
+            return text
+
+        key = self.key(kind, text)
+        brief = self._recall(key) or self._load(key)
+        if brief:
+            self.hits += 1
+            self._remember(key, brief)
+            return brief
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._condense(kind, text))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        brief = await asyncio.shield(task)
+        if not brief:
+            return text
+        self._remember(key, brief)
+        return brief
+
+    async def _condense(self, kind: str, text: str) -> Optional[str]:
+        start = time.perf_counter()
+        try:
+            response = await llm_client_manager.get_client().chat.completions.create(
+                model=Config.AZURE_OPENAI_DEPLOYMENT,
+                messages=[
+                    {"role": "system", "content": BRIEF_INSTRUCTIONS[kind]},
+                    {"role": "user", "content": text},
+                ],
+                temperature=0.0,
+                max_tokens=self.max_tokens,
+            )
+            brief = (response.choices[0].message.content or "").strip()
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"⚠️ {kind} condensation failed, using full text: {e}")
+            return None
+
+        if not brief:
+            return None
+        self._store(self.key(kind, text), kind, brief)
+        logger.info(
+            f"📄 Condensed {kind}: {count_tokens(text)} → {count_tokens(brief)} tokens "
+            f"in {round((time.perf_counter() - start) * 1000)}ms"
+        )
+        return brief
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "failures": self.failures,
+            "in_memory": len(self._memory),
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "disk": bool(self.cache_dir),
+        }
+
+
+document_brief_cache = DocumentBriefCache()
@@ -0,0 +1,157 @@
+"""
+LLM Hedging Harness
+Runs LLMHedger against a local fake Azure OpenAI server that injects first-token latency spikes
+
+Usage:
+    python hedging_harness.py                    # 120 turns, 8% spikes
+    python hedging_harness.py --turns 500 --spike-rate 0.15 --spike-ms 4000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+HOST, PORT = "127.0.0.1", 18089
+
+# point the shared client at the fake server before config is imported
+os.environ["AZURE_OPENAI_API_KEY"] = "harness"
+os.environ["AZURE_OPENAI_ENDPOINT"] = f"http://{HOST}:{PORT}"
+os.environ["LLM_HTTP2"] = "false"
+
+from aiohttp import web  # noqa: E402
+
+from llm_client import llm_client_manager  # noqa: E402
+from llm_hedging import LLMHedger, LatencyHistogram  # noqa: E402
+
+
+class FakeAzureOpenAI:
+    """Streams a canned reply; the first token is delayed, sometimes by a spike"""
+
+    def __init__(self, base_ms: float, jitter_ms: float, spike_rate: float, spike_ms: float, seed: int):
+        self.base_ms = base_ms
+        self.jitter_ms = jitter_ms
+        self.spike_rate = spike_rate
+        self.spike_ms = spike_ms
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.completed = 0
+        self.abandoned = 0
+
+    def first_token_delay(self) -> float:
+        delay = self.base_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        if self.random.random() < self.spike_rate:
+            delay += self.spike_ms
+        return delay / 1000
+
+    async def chat(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        await request.json()
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        try:
+            await asyncio.sleep(self.first_token_delay())
+            for piece in ["Thanks for sharing.", " Could you", " tell me more", " about that project?"]:
+                chunk = {
+                    "id": "harness", "object": "chat.completion.chunk", "created": 0, "model": "fake",
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                await asyncio.sleep(0.02)
+            await response.write(b"data: [DONE]\n\n")
+            self.completed += 1
+        except (ConnectionResetError, asyncio.CancelledError):
+            # the hedger closed the losing stream
+            self.abandoned += 1
+        return response
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/openai/deployments/{deployment}/chat/completions", self.chat)
+        return app
+
+
+async def run_turns(hedger: LLMHedger, turns: int) -> LatencyHistogram:
+    """Sequential turns; returns end-to-end first-token latency as seen by the caller"""
+    observed = LatencyHistogram(window=turns)
+    messages = [{"role": "user", "content": "I built a payments service."}]
+    for _ in range(turns):
+        start = time.perf_counter()
+        pieces = hedger.stream(messages, temperature=0.7, max_tokens=150)
+        first = True
+        try:
+            async for _piece in pieces:
+                if first:
+                    observed.record((time.perf_counter() - start) * 1000)
+                    first = False
+        finally:
+            await pieces.aclose()
+    return observed
+
+
+async def main(argv) -> int:
+    parser = argparse.ArgumentParser(description="LLM hedging harness")
+    parser.add_argument("--turns", type=int, default=120)
+    parser.add_argument("--base-ms", type=float, default=350)
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--spike-rate", type=float, default=0.08)
+    parser.add_argument("--spike-ms", type=float, default=3000)
+    parser.add_argument("--max-hedge-ratio", type=float, default=0.15)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    server = FakeAzureOpenAI(args.base_ms, args.jitter_ms, args.spike_rate, args.spike_ms, args.seed)
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+    await llm_client_manager.start()
+
+    results = {}
+    try:
+        for name, enabled in (("unhedged", False), ("hedged", True)):
+            hedger = LLMHedger(
+                primary_deployment="primary",
+                hedge_deployment="secondary",
+                enabled=enabled,
+                max_hedge_ratio=args.max_hedge_ratio,
+            )
+            observed = await run_turns(hedger, args.turns)
+            stats = hedger.get_stats()
+            results[name] = {
+                "first_token_p50_ms": round(observed.percentile(50)),
+                "first_token_p95_ms": round(observed.percentile(95)),
+                "first_token_p99_ms": round(observed.percentile(99)),
+                "first_token_max_ms": round(max(observed.recent)),
+                "hedge_rate": stats["hedge_rate"],
+                "hedge_wins": stats["hedge_wins"],
+                "hedges_rate_limited": stats["hedges_rate_limited"],
+                "deadline_ms": stats["deadline_ms"],
+            }
+        # let the server notice closed losers before reporting
+        await asyncio.sleep(0.2)
+    finally:
+        await llm_client_manager.close()
+        await runner.cleanup()
+
+    for name, metrics in results.items():
+        formatted = ", ".join(f"{k}={v}" for k, v in metrics.items())
+        print(f"{name:<10} {formatted}")
+    print(
+        f"server     requests={server.requests}, completed={server.completed}, "
+        f"abandoned={server.abandoned}"
+    )
+
+    # hedging must cut the tail without exceeding the hedge budget
+    hedged, unhedged = results["hedged"], results["unhedged"]
+    ok = (
+        hedged["first_token_p99_ms"] < unhedged["first_token_p99_ms"]
+        and hedged["hedge_rate"] <= args.max_hedge_ratio + 3 / args.turns
+    )
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,15 @@
+"""
+Latency Stats
+Percentiles shared by the pools, the LLM client, hedging and turn tracing
+"""
+import math
+from typing import Iterable, Optional
+
+
+def percentile(values: Iterable[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (a value that was actually observed); None if empty"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(len(ordered) - 1, max(0, rank - 1))]
@@ -0,0 +1,206 @@
+"""
+Shared LLM Client
+Process-wide Azure OpenAI client with a tuned, instrumented connection pool
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from openai import AsyncAzureOpenAI
+
+from config import Config
+from latency_stats import percentile
+
+logger = logging.getLogger(__name__)
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body wrapper that reports when a request releases its connection"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class _TrackingTransport(httpx.AsyncHTTPTransport):
+    """Counts requests holding a pooled connection (streamed bodies included)"""
+
+    def __init__(self, manager: "LLMClientManager", **kwargs):
+        super().__init__(**kwargs)
+        self._manager = manager
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._manager._request_started()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self._manager._request_finished()
+            raise
+        response.stream = _TrackedStream(response.stream, self._manager._request_finished)
+        return response
+
+    def open_connections(self) -> int:
+        # httpcore's pool is not public API; treat it as best effort
+        pool = getattr(self, "_pool", None)
+        return len(getattr(pool, "connections", []) or [])
+
+
+class LLMClientManager:
+    """
+    One AsyncAzureOpenAI client shared by every call in the process
+
+    Calls borrow the client instead of building their own, so TLS and
+    HTTP/2 setup is paid once and kept-alive connections are reused across
+    turns and across concurrent calls. start() runs in the FastAPI lifespan
+    and optionally pre-warms a few connections so the first caller does not
+    pay the handshake either.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = Config.LLM_POOL_MAX_CONNECTIONS,
+        max_keepalive: int = Config.LLM_POOL_MAX_KEEPALIVE,
+        keepalive_expiry_sec: float = Config.LLM_POOL_KEEPALIVE_EXPIRY_SEC,
+        http2: bool = Config.LLM_HTTP2,
+        prewarm_connections: int = Config.LLM_PREWARM_CONNECTIONS,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry_sec = keepalive_expiry_sec
+        self.http2 = http2 and _h2_available()
+        self.prewarm_connections = prewarm_connections
+
+        self.client: Optional[AsyncAzureOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[_TrackingTransport] = None
+
+        # Stats
+        self.active_requests = 0
+        self.peak_active_requests = 0
+        self.total_requests = 0
+        self.prewarm_ms: Optional[int] = None
+        self.first_turn_latencies_ms: List[int] = []
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    def _build(self):
+        self._transport = _TrackingTransport(
+            self,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=self.keepalive_expiry_sec,
+            ),
+        )
+        self._http_client = httpx.AsyncClient(
+            transport=self._transport,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        self.client = AsyncAzureOpenAI(
+            api_key=Config.AZURE_OPENAI_API_KEY,
+            api_version=Config.AZURE_OPENAI_VERSION,
+            azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
+            http_client=self._http_client,
+        )
+        logger.info(
+            f"🔗 LLM client pool ready (max={self.max_connections}, "
+            f"keepalive={self.max_keepalive}, http2={self.http2})"
+        )
+
+    async def start(self):
+        if self.client is None:
+            self._build()
+        if self.prewarm_connections > 0:
+            await self.prewarm(self.prewarm_connections)
+
+    async def prewarm(self, connections: int):
+        """Open connections to the endpoint so real requests skip the handshake"""
+        start = time.perf_counter()
+
+        async def touch():
+            try:
+                # any response will do; only the connection matters
+                await self._http_client.get(Config.AZURE_OPENAI_ENDPOINT)
+            except Exception as e:
+                logger.warning(f"⚠️ LLM pre-warm request failed: {e}")
+
+        # over HTTP/2 one connection multiplexes all streams
+        await asyncio.gather(*(touch() for _ in range(1 if self.http2 else connections)))
+        self.prewarm_ms = round((time.perf_counter() - start) * 1000)
+        logger.info(f"🔥 LLM pool pre-warmed in {self.prewarm_ms}ms")
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+            self._http_client = None
+            self._transport = None
+
+    def get_client(self) -> AsyncAzureOpenAI:
+        """Shared client; built lazily if the app lifespan has not started it"""
+        if self.client is None:
+            self._build()
+        return self.client
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+    def _request_started(self):
+        self.active_requests += 1
+        self.total_requests += 1
+        self.peak_active_requests = max(self.peak_active_requests, self.active_requests)
+
+    def _request_finished(self):
+        self.active_requests -= 1
+
+    def record_first_turn(self, latency_ms: int):
+        """Time to first token of a call's first LLM turn"""
+        self.first_turn_latencies_ms.append(latency_ms)
+        # keep a bounded window
+        if len(self.first_turn_latencies_ms) > 1000:
+            del self.first_turn_latencies_ms[:-1000]
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = self.first_turn_latencies_ms
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "open_connections": self._transport.open_connections() if self._transport else 0,
+            "active_requests": self.active_requests,
+            "peak_active_requests": self.peak_active_requests,
+            "utilization": round(self.active_requests / self.max_connections, 3),
+            "peak_utilization": round(self.peak_active_requests / self.max_connections, 3),
+            "total_requests": self.total_requests,
+            "prewarm_ms": self.prewarm_ms,
+            "first_turn_ms_p50": percentile(latencies, 50),
+            "first_turn_ms_p95": percentile(latencies, 95),
+            "first_turn_samples": len(latencies),
+        }
+
+
+llm_client_manager = LLMClientManager()
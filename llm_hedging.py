@@ -0,0 +1,247 @@
+"""
+Hedged LLM Streaming
+Fires a backup request when the first token is late; the first stream to produce a token wins
+"""
+import asyncio
+import bisect
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from config import Config
+from latency_stats import percentile
+from llm_client import llm_client_manager
+
+logger = logging.getLogger(__name__)
+
+# first-token latency histogram bucket upper bounds (ms); last bucket is open
+HISTOGRAM_BUCKETS_MS = [100, 200, 300, 400, 500, 650, 800, 1000, 1300, 1600, 2000, 2500, 3000, 4000, 5000, 7500, 10000]
+
+
+class LatencyHistogram:
+    """
+    First-token latency for one deployment
+
+    Fixed buckets for export, plus a window of recent samples that the
+    hedge deadline percentile is computed from (so it tracks current load).
+    Only observed first tokens are samples; requests cancelled before one
+    (hedge losers, barge-in) are just counted as censored, since their
+    elapsed time would drag the deadline down.
+    """
+
+    def __init__(self, window: int = 200):
+        self.bucket_counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.censored = 0
+
+    def record(self, latency_ms: float):
+        self.bucket_counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, latency_ms)] += 1
+        self.recent.append(latency_ms)
+        self.count += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        return percentile(self.recent, pct)
+
+    def get_stats(self) -> Dict[str, Any]:
+        buckets = {f"le_{b}": c for b, c in zip(HISTOGRAM_BUCKETS_MS, self.bucket_counts)}
+        buckets["inf"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "censored": self.censored,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+class _Contender:
+    """One streaming request, read until its first content token"""
+
+    def __init__(self, deployment: str, params: Dict[str, Any]):
+        self.deployment = deployment
+        self.params = params
+        self.started_at = time.perf_counter()
+        self.stream = None
+        self.pieces: Optional[AsyncIterator[str]] = None
+        self.first_token_ms: Optional[float] = None
+
+    async def first_token(self) -> str:
+        self.stream = await llm_client_manager.get_client().chat.completions.create(
+            model=self.deployment, stream=True, **self.params
+        )
+        self.pieces = self._content_pieces()
+        try:
+            piece = await self.pieces.__anext__()
+        except StopAsyncIteration:
+            return ""
+        self.first_token_ms = (time.perf_counter() - self.started_at) * 1000
+        return piece
+
+    async def _content_pieces(self) -> AsyncIterator[str]:
+        async for chunk in self.stream:
+            # 🔐 Some chunks may have no choices (control / final chunks)
+            if not getattr(chunk, "choices", None):
+                continue
+            delta = chunk.choices[0].delta
+            content_piece = getattr(delta, "content", None) if delta else None
+            if content_piece:
+                yield content_piece
+
+    async def close(self):
+        if self.stream is not None:
+            try:
+                await self.stream.close()
+            except Exception:
+                pass
+
+
+class LLMHedger:
+    """
+    Streams a chat completion, hedging slow first tokens
+
+    The deadline is the hedge_percentile of the primary deployment's recent
+    first-token latencies (clamped to [min_deadline_ms, max_deadline_ms];
+    max_deadline_ms until enough samples exist). If the primary hasn't
+    produced a token by then, an identical request goes to hedge_deployment
+    and whichever produces a token first is streamed; the other is cancelled
+    and its connection closed.
+
+    Hedges are rate-limited by a token bucket: each request earns
+    max_hedge_ratio of a hedge (up to hedge_burst), so sustained hedging
+    cannot exceed that fraction of extra TPM.
+    """
+
+    def __init__(
+        self,
+        primary_deployment: str = Config.AZURE_OPENAI_DEPLOYMENT,
+        hedge_deployment: str = Config.LLM_HEDGE_DEPLOYMENT,
+        enabled: bool = Config.LLM_HEDGE_ENABLED,
+        hedge_percentile: float = Config.LLM_HEDGE_PERCENTILE,
+        min_deadline_ms: float = Config.LLM_HEDGE_MIN_DEADLINE_MS,
+        max_deadline_ms: float = Config.LLM_HEDGE_MAX_DEADLINE_MS,
+        max_hedge_ratio: float = Config.LLM_HEDGE_MAX_RATIO,
+        hedge_burst: float = 3.0,
+        min_samples: int = 20,
+    ):
+        self.primary_deployment = primary_deployment
+        self.hedge_deployment = hedge_deployment or primary_deployment
+        self.enabled = enabled
+        self.hedge_percentile = hedge_percentile
+        self.min_deadline_ms = min_deadline_ms
+        self.max_deadline_ms = max_deadline_ms
+        self.max_hedge_ratio = max_hedge_ratio
+        self.hedge_burst = hedge_burst
+        self.min_samples = min_samples
+
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._hedge_tokens = hedge_burst
+
+        # Stats
+        self.requests = 0
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+        self.hedges_rate_limited = 0
+
+    def _histogram(self, deployment: str) -> LatencyHistogram:
+        if deployment not in self.histograms:
+            self.histograms[deployment] = LatencyHistogram()
+        return self.histograms[deployment]
+
+    def deadline_ms(self) -> float:
+        histogram = self._histogram(self.primary_deployment)
+        if len(histogram.recent) < self.min_samples:
+            return self.max_deadline_ms
+        deadline = histogram.percentile(self.hedge_percentile)
+        return min(self.max_deadline_ms, max(self.min_deadline_ms, deadline))
+
+    def _take_hedge_token(self) -> bool:
+        if self._hedge_tokens >= 1.0:
+            self._hedge_tokens -= 1.0
+            return True
+        self.hedges_rate_limited += 1
+        return False
+
+    async def stream(self, messages: List[Dict[str, str]], **params) -> AsyncIterator[str]:
+        """Content pieces of the winning completion"""
+        self.requests += 1
+        self._hedge_tokens = min(self.hedge_burst, self._hedge_tokens + self.max_hedge_ratio)
+        params = dict(params, messages=messages)
+
+        contenders: Dict[asyncio.Task, _Contender] = {}
+        primary = _Contender(self.primary_deployment, params)
+        contenders[asyncio.create_task(primary.first_token())] = primary
+
+        winner: Optional[Tuple[_Contender, str]] = None
+        try:
+            timeout = self.deadline_ms() / 1000 if self.enabled else None
+            while winner is None and contenders:
+                done, _ = await asyncio.wait(
+                    contenders, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # deadline passed with no token: hedge once, if the budget allows
+                    timeout = None
+                    if self._take_hedge_token():
+                        self.hedges_fired += 1
+                        hedge = _Contender(self.hedge_deployment, params)
+                        contenders[asyncio.create_task(hedge.first_token())] = hedge
+                        logger.info(
+                            f"🪁 LLM first token late (> {round(self.deadline_ms())}ms), "
+                            f"hedging to {self.hedge_deployment}"
+                        )
+                    continue
+
+                for task in done:
+                    contender = contenders.pop(task)
+                    if task.exception() is not None:
+                        logger.warning(f"⚠️ LLM request to {contender.deployment} failed: {task.exception()}")
+                        await contender.close()
+                        if not contenders:
+                            raise task.exception()
+                        continue
+                    if winner is None:
+                        winner = (contender, task.result())
+                    else:
+                        # tied: its first token was observed too
+                        if contender.first_token_ms is not None:
+                            self._histogram(contender.deployment).record(contender.first_token_ms)
+                        await contender.close()
+        finally:
+            # cancel the losers (or everything, if our consumer went away);
+            # no first token was observed, so no latency sample
+            for task, contender in contenders.items():
+                task.cancel()
+                self._histogram(contender.deployment).censored += 1
+                await contender.close()
+
+        contender, first_piece = winner
+        if contender.first_token_ms is not None:
+            self._histogram(contender.deployment).record(contender.first_token_ms)
+        if contender is not primary:
+            self.hedge_wins += 1
+
+        try:
+            if first_piece:
+                yield first_piece
+                async for piece in contender.pieces:
+                    yield piece
+        finally:
+            await contender.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "deadline_ms": round(self.deadline_ms()),
+            "requests": self.requests,
+            "hedges_fired": self.hedges_fired,
+            "hedge_wins": self.hedge_wins,
+            "hedges_rate_limited": self.hedges_rate_limited,
+            "hedge_rate": round(self.hedges_fired / self.requests, 3) if self.requests else None,
+            "deployments": {name: h.get_stats() for name, h in self.histograms.items()},
+        }
+
+
+llm_hedger = LLMHedger()
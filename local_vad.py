@@ -0,0 +1,128 @@
+"""
+Local Voice Activity Detection
+Energy / zero-crossing speech gate used to skip uploading silence to Sarvam STT
+"""
+from collections import deque
+from typing import Deque, List, Optional
+
+import audio_codec
+from config import Config
+
+
+class EnergyVAD:
+    """
+    Frame-level speech gate for 16-bit mono PCM
+
+    A frame is voiced when its RMS clears both a fixed floor and a multiple of
+    the tracked background level, and its zero-crossing rate is below the
+    hiss/noise range. Speech starts after min_speech_ms of voiced frames and
+    continues for hangover_ms after the last voiced frame, so trailing
+    syllables and the silence Sarvam's own VAD needs to close a turn still go
+    out. While gated, the most recent preroll_ms of audio is held back and
+    released on onset so word beginnings are not clipped.
+
+    process() returns the frames to forward (empty while gated).
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = Config.SARVAM_SAMPLE_RATE,
+        rms_threshold: int = Config.STT_VAD_RMS_THRESHOLD,
+        max_zcr: float = Config.STT_VAD_MAX_ZCR,
+        hangover_ms: int = Config.STT_VAD_HANGOVER_MS,
+        preroll_ms: int = Config.STT_VAD_PREROLL_MS,
+        min_speech_ms: int = 40,
+        noise_factor: float = 3.0,
+    ):
+        self.sample_rate = sample_rate
+        self.rms_threshold = rms_threshold
+        self.max_zcr = max_zcr
+        self.hangover_ms = hangover_ms
+        self.preroll_ms = preroll_ms
+        self.min_speech_ms = min_speech_ms
+        self.noise_factor = noise_factor
+
+        self.is_speech = False
+        self.last_voiced = False
+        self.noise_floor: Optional[float] = None
+        self._voiced_ms = 0.0
+        self._hangover_left_ms = 0.0
+
+        self._preroll: Deque[bytes] = deque()
+        self._preroll_ms = 0.0
+
+        # Stats
+        self.bytes_in = 0
+        self.bytes_dropped = 0
+        self.speech_segments = 0
+
+    def _frame_ms(self, frame: bytes) -> float:
+        return len(frame) / 2 / self.sample_rate * 1000
+
+    def _is_voiced(self, frame: bytes) -> bool:
+        rms = audio_codec.rms(frame)
+        threshold = self.rms_threshold
+        if self.noise_floor is not None:
+            threshold = max(threshold, self.noise_floor * self.noise_factor)
+
+        voiced = rms >= threshold and audio_codec.zero_crossing_rate(frame) <= self.max_zcr
+
+        # track background level only while nobody is talking
+        if not voiced and not self.is_speech:
+            if self.noise_floor is None:
+                self.noise_floor = float(rms)
+            else:
+                self.noise_floor = 0.95 * self.noise_floor + 0.05 * rms
+        return voiced
+
+    def process(self, frame: bytes) -> List[bytes]:
+        """Feed one PCM frame; returns the frames that should be uploaded"""
+        frame_ms = self._frame_ms(frame)
+        self.bytes_in += len(frame)
+        voiced = self._is_voiced(frame)
+        self.last_voiced = voiced
+
+        if self.is_speech:
+            if voiced:
+                self._hangover_left_ms = self.hangover_ms
+                return [frame]
+            self._hangover_left_ms -= frame_ms
+            if self._hangover_left_ms > 0:
+                return [frame]
+            # hangover expired: gate closes with this frame held as pre-roll
+            self.is_speech = False
+            self._voiced_ms = 0.0
+
+        self._voiced_ms = self._voiced_ms + frame_ms if voiced else 0.0
+        self._hold(frame, frame_ms)
+
+        if self._voiced_ms >= self.min_speech_ms:
+            self.is_speech = True
+            self.speech_segments += 1
+            self._hangover_left_ms = self.hangover_ms
+            released = list(self._preroll)
+            self._preroll.clear()
+            self._preroll_ms = 0.0
+            return released
+        return []
+
+    def _hold(self, frame: bytes, frame_ms: float):
+        self._preroll.append(frame)
+        self._preroll_ms += frame_ms
+        while self._preroll and self._preroll_ms - self._frame_ms(self._preroll[0]) >= self.preroll_ms:
+            dropped = self._preroll.popleft()
+            self._preroll_ms -= self._frame_ms(dropped)
+            self.bytes_dropped += len(dropped)
+
+    @property
+    def bytes_held(self) -> int:
+        """Bytes currently buffered as pre-roll (not yet forwarded)"""
+        return sum(len(f) for f in self._preroll)
+
+    def reset(self):
+        self.is_speech = False
+        self.last_voiced = False
+        self._voiced_ms = 0.0
+        self._hangover_left_ms = 0.0
+        self._preroll.clear()
+        self._preroll_ms = 0.0
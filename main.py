@@ -10,7 +10,17 @@ from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse, Connect
 from pydantic import BaseModel
 from config import Config
-from voice_agent import VoiceAgent
+from voice_agent import VoiceAgent, PREWARM_PHRASES
+from twilio_events import loads, media_payload
+from llm_client import llm_client_manager
+from llm_hedging import llm_hedger
+from turn_trace import turn_trace_recorder
+from document_brief import document_brief_cache
+from tts_audio_cache import tts_audio_cache
+from sarvam_synthesizer import prewarm_tts_cache
+from tts_pool import tts_pool
+from stt_pool import stt_pool
+from stt_input_profile import profile_usage
 
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -38,11 +48,27 @@ async def lifespan(app: FastAPI):
     except ValueError as e:
         logger.error(f"❌ Configuration error: {e}")
         raise
+
+    # Shared LLM connection pool, warmed before the first call arrives
+    await llm_client_manager.start()
+    # TTS/STT websockets connected ahead of calls
+    await tts_pool.start()
+    await stt_pool.start()
+
+    # Fixed phrases synthesized in the background; calls before it finishes just miss
+    prewarm_task = None
+    if Config.TTS_CACHE_ENABLED and Config.TTS_CACHE_PREWARM:
+        prewarm_task = asyncio.create_task(prewarm_tts_cache(PREWARM_PHRASES))
     
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down...")
+    if prewarm_task and not prewarm_task.done():
+        prewarm_task.cancel()
+    await stt_pool.close()
+    await tts_pool.close()
+    await llm_client_manager.close()
 
 class CallRequest(BaseModel):
     phone: str
@@ -88,10 +114,23 @@ async def health():
     return {
         "healthy": True,
         "active_calls": len(active_calls),
-        "call_ids": list(active_calls.keys())
+        "call_ids": list(active_calls.keys()),
+        "llm_pool": llm_client_manager.get_stats(),
+        "llm_hedging": llm_hedger.get_stats(),
+        "document_briefs": document_brief_cache.get_stats(),
+        "tts_cache": tts_audio_cache.get_stats(),
+        "tts_pool": tts_pool.get_stats(),
+        "stt_pool": stt_pool.get_stats(),
+        "stt_input_profiles": profile_usage.get_stats(),
     }
 
 
+@app.get("/api/latency")
+async def latency_percentiles():
+    """Per-stage turn latency percentiles over recent turns (all calls)"""
+    return turn_trace_recorder.get_percentiles()
+
+
 @app.post("/voice/incoming")
 async def incoming_call():
     """
@@ -128,7 +167,14 @@ async def stream_handler(websocket: WebSocket):
     
     try:
         async for message in websocket.iter_text():
-            data = await asyncio.to_thread(lambda: __import__('json').loads(message))
+            # Fast path: ~50 media events/s per call, payload sliced out inline
+            payload = media_payload(message)
+            if payload is not None:
+                if agent:
+                    await agent.process_audio(payload)
+                continue
+
+            data = loads(message)
             event = data.get("event")
             
             # Connection handshake
@@ -363,6 +409,13 @@ async def list_active_calls():
             "responses": agent.total_responses,
             "is_speaking": agent.is_speaking,
             "awaiting_response": agent.awaiting_response,
+            "playout": agent.get_playout_stats(),
+            "time_to_first_audio_ms": agent.first_audio_latencies_ms,
+            "context": agent.context.get_stats(),
+            "system_prompt": agent.prompt_stats,
+            "speculation": agent.speculation_stats.get_stats(),
+            "stt": agent.transcriber.get_stats() if agent.transcriber else None,
+            "tts": agent.synthesizer.get_stats() if agent.synthesizer else None,
         })
 
     return {
@@ -0,0 +1,222 @@
+"""
+Twilio Playout Scheduler
+Reframes outbound μ-law into exact 20ms frames and paces them on a monotonic clock
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+FRAME_BYTES = 160  # 20ms of μ-law @ 8kHz
+FRAME_SEC = 0.02
+MULAW_SILENCE = b"\xff"
+
+
+class PlayoutScheduler:
+    """
+    Clock-driven sender for outbound Twilio media
+
+    Audio of any chunk size is appended with enqueue(); run() slices it into
+    160-byte frames and sends frame k when the playout timeline reaches
+    start + k * 20ms, up to lead_ms ahead of real time so Twilio's jitter
+    buffer never runs dry. Deadlines come from time.monotonic(), so pacing
+    does not drift with send latency, and after an event-loop stall the
+    overdue frames go out back-to-back until the timeline is caught up.
+
+    With batch_frames > 1, frames that are already buffered are coalesced
+    into one message (at most lead_ms worth), cutting per-message overhead
+    without sending further ahead than the configured lead.
+
+    If the timeline drains (nothing left to send) and new audio arrives
+    within underrun_window_ms, that gap happened inside speech and is counted
+    as an underrun; longer gaps are treated as a new utterance.
+
+    enqueue() can tag audio (the agent passes the synthesizer epoch); while
+    send_frame runs, frame_tag is the tag of the first byte being sent.
+    """
+
+    def __init__(
+        self,
+        send_frame: Callable[[bytes], Awaitable[Any]],
+        lead_ms: int = Config.PLAYOUT_LEAD_MS,
+        underrun_window_ms: int = 500,
+        batch_frames: int = Config.PLAYOUT_BATCH_FRAMES,
+    ):
+        self.send_frame = send_frame
+        self.lead_sec = lead_ms / 1000
+        self.batch_frames = max(1, min(batch_frames, lead_ms // int(FRAME_SEC * 1000)))
+        self.underrun_window_sec = underrun_window_ms / 1000
+
+        self._buffer = bytearray()
+        # [bytes left, tag] per enqueued run of audio, oldest first
+        self._tags: Deque[List[Any]] = deque()
+        self.frame_tag: Any = None
+        self._data_ready = asyncio.Event()
+        self._closed = False
+
+        # monotonic time at which the next frame starts playing at Twilio
+        self._play_clock: Optional[float] = None
+        # when the current timeline was (re)started; frames inside the
+        # initial lead burst are due immediately, not "late"
+        self._anchor_time = 0.0
+
+        # Stats
+        self.frames_sent = 0
+        self.messages_sent = 0
+        self.padded_frames = 0
+        self.underruns = 0
+        self.resyncs = 0
+        self.late_frames = 0
+        self._jitter_total_ms = 0.0
+        self.max_jitter_ms = 0.0
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+    def enqueue(self, mulaw: bytes, tag: Any = None):
+        if self._closed or not mulaw:
+            return
+        self._buffer += mulaw
+        if self._tags and self._tags[-1][1] == tag:
+            self._tags[-1][0] += len(mulaw)
+        else:
+            self._tags.append([len(mulaw), tag])
+        self._data_ready.set()
+
+    def clear(self):
+        """Drop everything not yet sent (barge-in) and restart the timeline"""
+        self._buffer.clear()
+        self._tags.clear()
+        self._play_clock = None
+
+    def close(self):
+        self._closed = True
+        self._buffer.clear()
+        self._tags.clear()
+        self._data_ready.set()
+
+    def _take(self, n: int) -> bytes:
+        """Remove n bytes from the head of the buffer (tags follow)"""
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        while n > 0 and self._tags:
+            head = self._tags[0]
+            used = min(n, head[0])
+            head[0] -= used
+            n -= used
+            if head[0] == 0:
+                self._tags.popleft()
+        return data
+
+    @property
+    def buffered_ms(self) -> float:
+        return len(self._buffer) / FRAME_BYTES * FRAME_SEC * 1000
+
+    # -------------------------------------------------------------------------
+    # Pacing loop
+    # -------------------------------------------------------------------------
+    async def _next_frame(self) -> Optional[bytes]:
+        """Wait for a full frame; a partial tail is padded once it falls due"""
+        while not self._closed:
+            if len(self._buffer) >= FRAME_BYTES:
+                self.frame_tag = self._tags[0][1] if self._tags else None
+                return self._take(FRAME_BYTES)
+
+            self._data_ready.clear()
+            if self._buffer and self._play_clock is not None:
+                # partial tail: give the producer until the frame is due
+                timeout = max(0.0, self._play_clock - self.lead_sec - time.monotonic())
+                try:
+                    await asyncio.wait_for(self._data_ready.wait(), timeout)
+                except asyncio.TimeoutError:
+                    self.frame_tag = self._tags[0][1] if self._tags else None
+                    tail = self._take(len(self._buffer))
+                    self.padded_frames += 1
+                    return tail + MULAW_SILENCE * (FRAME_BYTES - len(tail))
+            else:
+                await self._data_ready.wait()
+        return None
+
+    def _take_batch(self, frame: bytes) -> bytes:
+        """Append already-buffered full frames to frame, up to batch_frames"""
+        extra = min(self.batch_frames - 1, len(self._buffer) // FRAME_BYTES)
+        if extra <= 0:
+            return frame
+        return frame + self._take(extra * FRAME_BYTES)
+
+    def _anchor(self, now: float):
+        """Place the next frame on the timeline, detecting drained playout"""
+        if self._play_clock is None:
+            self._play_clock = now
+            self._anchor_time = now
+        elif now > self._play_clock:
+            # Twilio has played everything we sent: restart the timeline
+            if now - self._play_clock <= self.underrun_window_sec:
+                self.underruns += 1
+            self.resyncs += 1
+            self._play_clock = now
+            self._anchor_time = now
+
+    async def run(self):
+        try:
+            while True:
+                frame = await self._next_frame()
+                if frame is None:
+                    break
+                try:
+                    await self._play(frame)
+                except Exception as e:
+                    # one bad frame must not silence the rest of the call
+                    logger.error(f"❌ Playout scheduler error: {e}")
+                    self._play_clock = None
+
+        except asyncio.CancelledError:
+            logger.info("🛑 Playout scheduler cancelled")
+
+    async def _play(self, frame: bytes):
+        self._anchor(time.monotonic())
+        send_at = self._play_clock - self.lead_sec
+
+        delay = send_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            if self._play_clock is None:
+                # cleared while waiting; this frame is stale
+                return
+
+        due = max(send_at, self._anchor_time)
+        lateness_ms = max(0.0, (time.monotonic() - due) * 1000)
+        self._jitter_total_ms += lateness_ms
+        self.max_jitter_ms = max(self.max_jitter_ms, lateness_ms)
+        if lateness_ms > FRAME_SEC * 1000:
+            self.late_frames += 1
+
+        frame = self._take_batch(frame)
+        frames = len(frame) // FRAME_BYTES
+        await self.send_frame(frame)
+        self.frames_sent += frames
+        self.messages_sent += 1
+        if self._play_clock is not None:
+            # else cleared (barge-in) during the send: next frame re-anchors
+            self._play_clock += FRAME_SEC * frames
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "frames_sent": self.frames_sent,
+            "messages_sent": self.messages_sent,
+            "padded_frames": self.padded_frames,
+            "underruns": self.underruns,
+            "resyncs": self.resyncs,
+            "late_frames": self.late_frames,
+            "avg_jitter_ms": (
+                round(self._jitter_total_ms / self.messages_sent, 2)
+                if self.messages_sent else None
+            ),
+            "max_jitter_ms": round(self.max_jitter_ms, 2),
+            "buffered_ms": round(self.buffered_ms),
+        }
@@ -0,0 +1,94 @@
+"""
+PCM Ring Buffer
+Preallocated byte ring for accumulating streamed audio without per-frame reallocation
+"""
+from typing import Optional
+
+
+class PCMRingBuffer:
+    """
+    Fixed-capacity byte ring backed by a single bytearray
+
+    write() copies into the preallocated storage; peek() returns a memoryview
+    of the oldest bytes so callers can encode straight from the ring. The
+    readable region is only made contiguous (one in-place copy) when it wraps
+    around the end, which never happens if callers drain it completely.
+
+    Allocation counters:
+        allocations   - bytearrays created (1 at construction + any growth)
+        linearizations - in-place copies needed to hand out a contiguous view
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._size = 0
+
+        self.allocations = 1
+        self.linearizations = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+
+    def write(self, data) -> None:
+        """Append bytes-like data, growing (doubling) only if it doesn't fit"""
+        n = len(data)
+        if not n:
+            return
+        if self._size + n > self.capacity:
+            self._grow(self._size + n)
+
+        cap = self.capacity
+        end = (self._start + self._size) % cap
+        first = min(n, cap - end)
+        self._view[end:end + first] = data[:first] if first < n else data
+        if first < n:
+            self._view[:n - first] = data[first:]
+        self._size += n
+
+    def peek(self, nbytes: Optional[int] = None) -> memoryview:
+        """
+        Contiguous read-only view of the oldest nbytes (default: everything).
+
+        The view aliases the ring's storage: use it before the next write().
+        """
+        n = self._size if nbytes is None else min(nbytes, self._size)
+        if self._start + n > self.capacity:
+            self._linearize()
+        return self._view[self._start:self._start + n].toreadonly()
+
+    def consume(self, nbytes: int) -> None:
+        """Drop the oldest nbytes"""
+        nbytes = min(nbytes, self._size)
+        self._size -= nbytes
+        # an empty ring restarts at 0 so full drains never wrap
+        self._start = 0 if not self._size else (self._start + nbytes) % self.capacity
+
+    def _linearize(self):
+        """Rotate storage so the readable region starts at offset 0"""
+        self._buf[:] = self._buf[self._start:] + self._buf[:self._start]
+        self._start = 0
+        self.linearizations += 1
+
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        data = bytes(self.peek())
+        # outstanding peek() views keep the old storage alive on their own
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._view[:len(data)] = data
+        self._start = 0
+        self.allocations += 1
@@ -8,16 +8,50 @@ import base64
 import json
 import logging
 import time
-from typing import Optional, AsyncGenerator, Dict, Any
+from collections import deque
+from typing import Optional, AsyncGenerator, Callable, Deque, Dict, Any, List
 
 import websockets
 from websockets.exceptions import InvalidHandshake
 
-from audio_processor import AudioProcessor
+from async_channel import ChannelClosed
+from audio_processor import AudioProcessor, AudioStreamContext
+from audio_queue import BLOCK, BoundedAudioQueue
 from config import Config
+from tts_audio_cache import tts_audio_cache
+from tts_output_profile import (
+    BYTES_PER_MS,
+    FALLBACK_PROFILE,
+    PROFILES,
+    audio_kind,
+    choose_profile,
+    reject_profile,
+    to_mulaw_8k,
+)
 
 logger = logging.getLogger(__name__)
 
+# a flushed utterance with no audio or final for this long is given up on
+FINAL_TIMEOUT_SEC = 10.0
+
+
+class _Utterance:
+    """Text sent to Sarvam up to (and including) one flush, until its final event"""
+
+    def __init__(self, epoch: int, cache_key: Optional[str] = None):
+        # synthesizer epoch it was sent in; an interrupt makes it stale
+        self.epoch = epoch
+        # set when the utterance is one whole cacheable phrase
+        self.cache_key = cache_key
+        self.chunks: List[bytes] = []
+        # cached audio that must play after this utterance
+        self.then: List[bytes] = []
+        self.flushed = False
+        # text sent so far, to send again if the server rejects the config
+        self.texts: List[str] = []
+        # last text sent or audio received, for FINAL_TIMEOUT_SEC
+        self.last_activity = time.monotonic()
+
 
 class SarvamSynthesizer:
     """
@@ -43,6 +77,7 @@ class SarvamSynthesizer:
         pitch: float = Config.SYNTHESIZER_PITCH,
         loudness: float = Config.SYNTHESIZER_LOUDNESS,
         buffer_size: int = Config.SYNTHESIZER_BUFFER_SIZE,
+        output_profile: str = Config.TTS_OUTPUT_PROFILE,
     ):
         self.api_key = api_key or Config.SARVAM_API_KEY
         self.model = model
@@ -53,6 +88,11 @@ class SarvamSynthesizer:
         self.loudness = loudness
         # clamp buffer_size to 30–200 chars as per docs suggestion range
         self.buffer_size = max(30, min(200, buffer_size))
+        # format asked of Sarvam (see tts_output_profile); WAV if rejected before
+        self.output_profile = choose_profile(output_profile)
+        # set once audio arrives in the requested format on this connection
+        self._profile_confirmed = False
+        self.chunks_by_format: Dict[str, int] = {}
 
         # WebSocket config
         self.api_host = Config.SARVAM_API_HOST
@@ -65,9 +105,12 @@ class SarvamSynthesizer:
         self.websocket = None
         self.is_connected = False
         self.connection_time_ms: Optional[int] = None
+        self.connected_at: Optional[float] = None
 
         # Audio processing
         self.audio_processor = AudioProcessor()
+        # keeps TTS-rate→8k resampler state across streamed chunks
+        self.audio_context = AudioStreamContext()
 
         # Synthesis state
         self.is_speaking = False
@@ -77,6 +120,9 @@ class SarvamSynthesizer:
         self.audio_chunks_received = 0
         self.first_audio_latency_ms: Optional[int] = None
         self.turn_start_time: Optional[float] = None
+        # called with the utterance's epoch after each text message goes out
+        # (turn latency tracing)
+        self.on_text_sent: Optional[Callable[[int], None]] = None
 
         # Tasks
         self.sender_task: Optional[asyncio.Task] = None
@@ -85,11 +131,33 @@ class SarvamSynthesizer:
 
         # Queues
         self.text_queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
-        self.audio_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        # bounded: when the consumer falls behind, the receiver waits, which
+        # stops reading the socket and pushes back on Sarvam
+        self.audio_queue = BoundedAudioQueue(maxsize=Config.TTS_AUDIO_QUEUE_MAX_CHUNKS, policy=BLOCK)
 
         # Has config been sent once per connection
         self.config_sent = False
 
+        # Utterances at Sarvam awaiting their final event, oldest first; audio
+        # belongs to the head (Sarvam answers flushes in order)
+        self._in_flight: Deque[_Utterance] = deque()
+        # producer side: text queued since the last flush
+        self._unflushed = False
+        # keeps a config change + resend from interleaving with the sender
+        self._send_lock = asyncio.Lock()
+        self.cache_hits = 0
+        self.utterances_resent = 0
+        self.utterances_abandoned = 0
+
+        # bumped by interrupt(); audio for older utterances is stale
+        self.epoch = 0
+        self.stale_chunks_dropped = 0
+        self.stale_audio_ms_dropped = 0.0
+        self._stale_b64_chars = 0
+        # CPU spent decoding + resampling live audio, per base64 char in
+        self._decode_cpu_sec = 0.0
+        self._decoded_b64_chars = 0
+
     # -------------------------------------------------------------------------
     # Connection management
     # -------------------------------------------------------------------------
@@ -111,6 +179,7 @@ class SarvamSynthesizer:
                 self.connection_time_ms = round(
                     (time.perf_counter() - start_time) * 1000
                 )
+                self.connected_at = time.monotonic()
                 self.is_connected = True
                 logger.info(
                     f"✅ Connected to Sarvam TTS in {self.connection_time_ms}ms"
@@ -160,13 +229,13 @@ class SarvamSynthesizer:
                 "loudness": self.loudness,
                 "min_buffer_size": self.buffer_size,
                 "max_chunk_length": 250,
-                "output_audio_codec": "wav",
-                "output_audio_bitrate": "32k",
+                **PROFILES[self.output_profile],
             }
         }
         logger.info(
     f"TTS config -> model={self.model}, speaker={self.voice}, "
-    f"lang={self.language}, pitch={self.pitch}, pace={self.speed}, loudness={self.loudness}"
+    f"lang={self.language}, pitch={self.pitch}, pace={self.speed}, loudness={self.loudness}, "
+    f"output={self.output_profile}"
 )
 
         await self.websocket.send(json.dumps(config_message))
@@ -180,10 +249,59 @@ class SarvamSynthesizer:
                 try:
                     await self.websocket.ping()
                 except Exception:
+                    # dead connection; tasks wind down and a pool drops it
+                    self.is_connected = False
                     break
         except asyncio.CancelledError:
             pass
 
+    def start_heartbeat(self):
+        if not self.heartbeat_task or self.heartbeat_task.done():
+            self.heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    @property
+    def is_open(self) -> bool:
+        return bool(self.is_connected and self.websocket and getattr(self.websocket, "open", False))
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self.connected_at if self.connected_at else 0.0
+
+    async def detach(self) -> Optional["SarvamSynthesizer"]:
+        """
+        Stop this instance and hand its connection to a fresh one
+
+        Only an idle connection (no utterance awaiting audio) is handed over;
+        returns None otherwise. This instance is left disconnected, so late
+        calls from its old owner can't reach the new one.
+        """
+        websocket = self.websocket
+        reusable = self.is_open and not self._in_flight and not self._unflushed
+        if reusable:
+            # keep stop() from closing it
+            self.websocket = None
+        await self.stop()
+        if not reusable:
+            return None
+
+        fresh = SarvamSynthesizer(
+            api_key=self.api_key,
+            model=self.model,
+            voice=self.voice,
+            language=self.language,
+            speed=self.speed,
+            pitch=self.pitch,
+            loudness=self.loudness,
+            buffer_size=self.buffer_size,
+            output_profile=self.output_profile,
+        )
+        fresh.websocket = websocket
+        fresh.is_connected = True
+        fresh.config_sent = True
+        fresh.connection_time_ms = self.connection_time_ms
+        fresh.connected_at = self.connected_at
+        return fresh
+
     # -------------------------------------------------------------------------
     # Lifecycle used by VoiceAgent
     # -------------------------------------------------------------------------
@@ -195,7 +313,8 @@ class SarvamSynthesizer:
 
         self.sender_task = asyncio.create_task(self._sender())
         self.receiver_task = asyncio.create_task(self._receiver())
-        self.heartbeat_task = asyncio.create_task(self._heartbeat())
+        # already running for a pooled connection
+        self.start_heartbeat()
 
         logger.info("✅ TTS synthesis tasks started")
 
@@ -204,6 +323,8 @@ class SarvamSynthesizer:
 
         self.is_connected = False
         await self.text_queue.put(None)  # stop signal
+        # ends audio_stream() once what's queued has been consumed
+        self.audio_queue.close()
 
         for task in [self.sender_task, self.receiver_task, self.heartbeat_task]:
             if task and not task.done():
@@ -225,14 +346,98 @@ class SarvamSynthesizer:
     # -------------------------------------------------------------------------
     # Sending text
     # -------------------------------------------------------------------------
-    async def synthesize(self, text: str, flush: bool = True):
+    def cache_key(self, text: str) -> str:
+        return tts_audio_cache.key(
+            text, self.voice, self.language, self.speed, self.pitch, self.loudness, self.model
+        )
+
+    async def synthesize(self, text: str, flush: bool = True, cache: bool = True):
         """
         Called by VoiceAgent.speak()
 
         text: text to synthesize
         flush: whether to send a flush signal after the text (end of utterance)
+        cache: serve a whole utterance from the TTS audio cache when possible,
+            and record it there on a miss (pass False for one-off text)
+        """
+        if cache and flush and not self._unflushed and tts_audio_cache.cacheable(text):
+            key = self.cache_key(text)
+            audio = tts_audio_cache.get(key)
+            if audio is None:
+                await self.text_queue.put(
+                    {"text": text, "flush": True, "cache_key": key, "epoch": self.epoch}
+                )
+            elif self.text_queue.empty() and not self._in_flight:
+                self.cache_hits += 1
+                self._serve_cached(audio)
+            else:
+                # must not overtake audio still coming from Sarvam
+                self.cache_hits += 1
+                await self.text_queue.put({"cached_audio": audio, "epoch": self.epoch})
+            return
+
+        if flush:
+            self._unflushed = False
+        elif text:
+            self._unflushed = True
+        await self.text_queue.put({"text": text, "flush": flush, "epoch": self.epoch})
+
+    async def flush(self):
+        """End the current utterance after text sent with flush=False"""
+        self._unflushed = False
+        await self.text_queue.put({"text": "", "flush": True, "epoch": self.epoch})
+
+    def _serve_cached(self, audio: bytes):
+        if self.on_text_sent:
+            self.on_text_sent(self.epoch)
+        # one item, queued from code that can't wait; may exceed the bound
+        self.audio_queue.put_overflow(
+            {"type": "audio", "data": audio, "timestamp": time.time(), "cached": True, "epoch": self.epoch}
+        )
+
+    def _current_utterance(self, cache_key: Optional[str]) -> _Utterance:
+        if not self._in_flight or self._in_flight[-1].flushed:
+            # nothing recorded while interrupted audio is still draining
+            if any(u.epoch != self.epoch for u in self._in_flight):
+                cache_key = None
+            self._in_flight.append(_Utterance(self.epoch, cache_key))
+        return self._in_flight[-1]
+
+    def _finish_utterance(self, completed: bool = True):
         """
-        await self.text_queue.put({"text": text, "flush": flush})
+        Retire the head utterance: on its final event (completed), or
+        abandoned after an error or FINAL_TIMEOUT_SEC without one. Only a
+        completed utterance is cached; an abandoned one may hold audio that
+        wasn't its own.
+        """
+        if not self._in_flight:
+            return
+        utterance = self._in_flight.popleft()
+        if utterance.epoch != self.epoch:
+            return
+        if completed and utterance.cache_key and utterance.chunks:
+            tts_audio_cache.put(utterance.cache_key, b"".join(utterance.chunks))
+        for audio in utterance.then:
+            self._serve_cached(audio)
+
+    def _abandon_utterance(self, reason: str):
+        if not self._in_flight:
+            return
+        logger.warning(f"⚠️ Giving up on TTS utterance: {reason}")
+        self.utterances_abandoned += 1
+        # which utterance later audio belongs to is no longer certain
+        for utterance in self._in_flight:
+            utterance.cache_key = None
+        self._finish_utterance(completed=False)
+        if not self._in_flight:
+            self.is_speaking = False
+
+    def _head_timed_out(self) -> bool:
+        head = self._in_flight[0] if self._in_flight else None
+        return bool(
+            head and head.flushed
+            and time.monotonic() - head.last_activity >= FINAL_TIMEOUT_SEC
+        )
 
     async def _sender(self):
         try:
@@ -244,31 +449,45 @@ class SarvamSynthesizer:
                     if item is None:
                         # stop
                         break
+                    if item.get("epoch", self.epoch) != self.epoch:
+                        # queued before an interrupt
+                        continue
+
+                    cached_audio = item.get("cached_audio")
+                    if cached_audio is not None:
+                        if self._in_flight:
+                            self._in_flight[-1].then.append(cached_audio)
+                        else:
+                            self._serve_cached(cached_audio)
+                        continue
 
                     text = item.get("text", "")
                     flush = item.get("flush", True)
 
-                    if not text:
+                    if not text and not flush:
                         continue
 
-                    # track start of synthesis
-                    if self.text_chunks_sent == 0:
-                        self.turn_start_time = time.perf_counter()
-                        self.is_speaking = True
+                    async with self._send_lock:
+                        utterance = self._current_utterance(item.get("cache_key"))
+
+                        if text:
+                            # track start of synthesis
+                            if self.text_chunks_sent == 0:
+                                self.turn_start_time = time.perf_counter()
+                                self.is_speaking = True
 
-                    text_message = {
-                        "type": "text",
-                        "data": {"text": text},
-                    }
-                    await self.websocket.send(json.dumps(text_message))
-                    self.text_chunks_sent += 1
+                            utterance.texts.append(text)
+                            await self._send_text(text)
+                            self.text_chunks_sent += 1
+                            if self.on_text_sent:
+                                self.on_text_sent(utterance.epoch)
 
-                    logger.debug(f"📤 TTS text sent: {text[:60]}")
+                            logger.debug(f"📤 TTS text sent: {text[:60]}")
 
-                    if flush:
-                        flush_message = {"type": "flush"}
-                        await self.websocket.send(json.dumps(flush_message))
-                        logger.debug("📤 TTS flush sent")
+                        utterance.last_activity = time.monotonic()
+                        if flush:
+                            utterance.flushed = True
+                            await self._send_flush()
 
                 except asyncio.TimeoutError:
                     continue
@@ -297,8 +516,10 @@ class SarvamSynthesizer:
         try:
             while self.is_connected and self.websocket:
                 try:
+                    # short wait while an utterance awaits its final
+                    timeout = FINAL_TIMEOUT_SEC if self._in_flight else 30.0
                     message = await asyncio.wait_for(
-                        self.websocket.recv(), timeout=30.0
+                        self.websocket.recv(), timeout=timeout
                     )
                     data = json.loads(message)
                     msg_type = data.get("type")
@@ -309,8 +530,17 @@ class SarvamSynthesizer:
 
                         if not audio_b64:
                             continue
+                        if self._in_flight:
+                            self._in_flight[0].last_activity = time.monotonic()
+
+                        # Sarvam answers flushes in order, so audio belongs
+                        # to the oldest utterance still in flight
+                        if self._in_flight and self._in_flight[0].epoch != self.epoch:
+                            self._drop_stale_audio(audio_b64)
+                            continue
 
-                        wav_bytes = base64.b64decode(audio_b64)
+                        decode_start = time.thread_time()
+                        raw = base64.b64decode(audio_b64)
 
                         # first audio latency
                         if (
@@ -329,25 +559,24 @@ class SarvamSynthesizer:
                                 f"{self.first_audio_latency_ms}ms"
                             )
 
-                    # Extract PCM + actual sample rate from WAV
-                        pcm_data, sample_rate = self.audio_processor.wav_to_pcm(wav_bytes)
-
-                        # Resample from actual sample rate → 8kHz (telephony)
-                        pcm_8k = self.audio_processor.resample_audio(
-                            pcm_data,
-                            from_rate=sample_rate,
-                            to_rate=8000,
-                            sample_width=2,  # 16-bit
-                        )
-
-                        # Convert 16-bit PCM → μ-law for Twilio
-                        mulaw_8k = self.audio_processor.pcm16_to_mulaw(pcm_8k)
-
+                        # only the stages this chunk's format needs (μ-law 8k:
+                        # none; PCM 8k: encode; WAV: parse + resample + encode)
+                        kind = audio_kind(raw, inner.get("content_type"), self.output_profile)
+                        mulaw_8k = to_mulaw_8k(raw, kind, self.audio_context)
+                        self._note_format(kind)
+                        self._decode_cpu_sec += time.thread_time() - decode_start
+                        self._decoded_b64_chars += len(audio_b64)
+                        if self._in_flight and self._in_flight[0].cache_key:
+                            self._in_flight[0].chunks.append(mulaw_8k)
+
+                        # may wait for room; tagged so that audio an interrupt
+                        # overtakes meanwhile is still recognised as stale
                         await self.audio_queue.put(
                             {
                                "type": "audio",
                                "data": mulaw_8k,
                                "timestamp": time.time(),
+                               "epoch": self._in_flight[0].epoch if self._in_flight else self.epoch,
                            }
                         )
                        
@@ -360,11 +589,26 @@ class SarvamSynthesizer:
                         event_data = data.get("data") or {}
                         if event_data.get("event_type") == "final":
                             self.is_speaking = False
+                            self._finish_utterance()
 
                     elif msg_type == "error":
                         logger.error(f"❌ TTS error from Sarvam: {data}")
+                        if self.output_profile != FALLBACK_PROFILE and not self._profile_confirmed:
+                            await self._fall_back_to_wav()
+                        elif self.utterances_resent and not self._profile_confirmed:
+                            # more rejections of what was sent before the
+                            # fallback; the resent utterances are still due
+                            pass
+                        else:
+                            # no final will come for the failed utterance
+                            self._abandon_utterance("error from Sarvam")
+
+                    if self._head_timed_out():
+                        self._abandon_utterance(f"no final event in {FINAL_TIMEOUT_SEC:.0f}s")
 
                 except asyncio.TimeoutError:
+                    if self._head_timed_out():
+                        self._abandon_utterance(f"no final event in {FINAL_TIMEOUT_SEC:.0f}s")
                     continue
                 except json.JSONDecodeError as e:
                     logger.error(f"❌ TTS JSON decode error: {e}")
@@ -376,11 +620,77 @@ class SarvamSynthesizer:
             logger.info("🛑 TTS receiver task cancelled")
         finally:
             self.is_speaking = False
+            self.audio_queue.close()
             logger.info(
                 f"📥 TTS receiver finished "
                 f"({self.audio_chunks_received} audio chunks)"
             )
     
+    def _note_format(self, kind: str):
+        self.chunks_by_format[kind] = self.chunks_by_format.get(kind, 0) + 1
+        if kind == self.output_profile:
+            self._profile_confirmed = True
+        elif kind == FALLBACK_PROFILE and not self._profile_confirmed:
+            # server ignored the requested codec; decoding follows the data
+            logger.warning(f"⚠️ Sarvam TTS sent WAV instead of {self.output_profile}")
+            self._profile_confirmed = True
+
+    async def _send_text(self, text: str):
+        text_message = {
+            "type": "text",
+            "data": {"text": text},
+        }
+        await self.websocket.send(json.dumps(text_message))
+
+    async def _send_flush(self):
+        flush_message = {"type": "flush"}
+        await self.websocket.send(json.dumps(flush_message))
+        logger.debug("📤 TTS flush sent")
+
+    async def _fall_back_to_wav(self):
+        """
+        The server rejected the output profile: reconfigure for WAV
+
+        Nothing sent under the rejected config will be answered, so the
+        in-flight utterances are sent again, in order, before anything the
+        sender has queued (stale ones are just dropped).
+        """
+        logger.warning(f"⚠️ TTS output profile {self.output_profile} rejected, falling back to WAV")
+        reject_profile(self.output_profile)
+        self.output_profile = FALLBACK_PROFILE
+        async with self._send_lock:
+            rejected = [u for u in self._in_flight if u.epoch == self.epoch]
+            self._in_flight.clear()
+            try:
+                await self._send_config()
+                for utterance in rejected:
+                    retry = _Utterance(utterance.epoch, utterance.cache_key)
+                    retry.texts = utterance.texts
+                    retry.then = utterance.then
+                    self._in_flight.append(retry)
+                    for text in utterance.texts:
+                        await self._send_text(text)
+                    if utterance.flushed:
+                        retry.flushed = True
+                        await self._send_flush()
+                self.utterances_resent += len(rejected)
+            except Exception as e:
+                logger.error(f"❌ Could not resend TTS config: {e}")
+
+    def _drop_stale_audio(self, audio_b64: str):
+        """Count an interrupted utterance's chunk without decoding it"""
+        self.stale_chunks_dropped += 1
+        self._stale_b64_chars += len(audio_b64)
+        # duration from the WAV header's byte rate (first 48 bytes)
+        header = base64.b64decode(audio_b64[:64])
+        if header[:4] == b"RIFF" and len(header) >= 32:
+            byte_rate = int.from_bytes(header[28:32], "little")
+            if byte_rate:
+                pcm_bytes = max(0, len(audio_b64) * 3 // 4 - 44)
+                self.stale_audio_ms_dropped += pcm_bytes / byte_rate * 1000
+        elif self.output_profile in BYTES_PER_MS:
+            self.stale_audio_ms_dropped += len(audio_b64) * 3 // 4 / BYTES_PER_MS[self.output_profile]
+
     # async def _receiver(self):
     #     """
     #     Receives:
@@ -494,17 +804,23 @@ class SarvamSynthesizer:
             else:
                 item = await self.audio_queue.get()
 
-            return item.get("data") if item else None
-        except asyncio.TimeoutError:
+            return self._live_audio(item)
+        except (asyncio.TimeoutError, ChannelClosed):
             return None
 
     async def audio_stream(self) -> AsyncGenerator[bytes, None]:
-        while self.is_connected or not self.audio_queue.empty():
-            audio = await self.get_audio(timeout=1.0)
+        """Audio as it arrives; ends once the receiver has stopped and it's drained"""
+        async for item in self.audio_queue:
+            audio = self._live_audio(item)
             if audio:
                 yield audio
-            elif not self.is_connected:
-                break
+
+    def _live_audio(self, item: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        if item and item.get("epoch", self.epoch) != self.epoch:
+            # put by a receiver that was waiting for room at interrupt
+            self.stale_chunks_dropped += 1
+            return None
+        return item.get("data") if item else None
 
     async def interrupt(self ):
         """
@@ -520,11 +836,7 @@ class SarvamSynthesizer:
                 self.text_queue.get_nowait()
              except asyncio.QueueEmpty:
                 break
-        while not self.audio_queue.empty():
-             try:
-                self.audio_queue.get_nowait()
-             except asyncio.QueueEmpty:
-                break
+        self.audio_queue.clear()
 
         
 
@@ -535,6 +847,20 @@ class SarvamSynthesizer:
         #         break
 
       
+        # next utterance is unrelated audio; don't carry the old filter tail
+        self.audio_context.reset()
+
+        # Sarvam's streaming API has no cancel: interrupted utterances still
+        # stream audio and a final event. They stay in line, now stale, so
+        # their audio is dropped undecoded and attribution holds.
+        self.epoch += 1
+        for utterance in self._in_flight:
+            utterance.then.clear()
+        self._unflushed = False
+        if self._in_flight and not self._in_flight[-1].flushed:
+            # don't let half a reply prefix the next one at Sarvam
+            await self.text_queue.put({"text": "", "flush": True, "epoch": self.epoch})
+
         self.is_speaking = False
         self.text_chunks_sent = 0
         self.audio_chunks_received = 0
@@ -549,4 +875,67 @@ class SarvamSynthesizer:
             "audio_chunks_received": self.audio_chunks_received,
             "first_audio_latency_ms": self.first_audio_latency_ms,
             "is_speaking": self.is_speaking,
+            "cache_hits": self.cache_hits,
+            "utterances_abandoned": self.utterances_abandoned,
+            "utterances_resent": self.utterances_resent,
+            "output_profile": self.output_profile,
+            "chunks_by_format": self.chunks_by_format,
+            "audio_queue": self.audio_queue.get_stats(),
+            **self._stale_audio_stats(),
+        }
+
+    def _stale_audio_stats(self) -> Dict[str, Any]:
+        cpu_per_char = (
+            self._decode_cpu_sec / self._decoded_b64_chars if self._decoded_b64_chars else 0.0
+        )
+        return {
+            "epoch": self.epoch,
+            "stale_chunks_dropped": self.stale_chunks_dropped,
+            "stale_audio_ms_dropped": round(self.stale_audio_ms_dropped),
+            "decode_cpu_ms": round(self._decode_cpu_sec * 1000, 2),
+            "decode_cpu_us_per_chunk": (
+                round(self._decode_cpu_sec * 1e6 / sum(self.chunks_by_format.values()), 1)
+                if self.chunks_by_format else None
+            ),
+            # estimated from the measured cost of live chunks
+            "decode_cpu_ms_avoided": round(self._stale_b64_chars * cpu_per_char * 1000, 2),
         }
+
+
+async def prewarm_tts_cache(phrases: List[str], timeout: float = 60.0) -> int:
+    """
+    Synthesize fixed phrases missing from the TTS audio cache
+
+    Uses one short-lived connection with the default voice settings; returns
+    how many phrases were added.
+    """
+    synthesizer = SarvamSynthesizer()
+    missing = [
+        p for p in dict.fromkeys(phrases)
+        if tts_audio_cache.cacheable(p) and not tts_audio_cache.contains(synthesizer.cache_key(p))
+    ]
+    if not missing:
+        return 0
+
+    stores_before = tts_audio_cache.stores
+    try:
+        await synthesizer.start()
+        for phrase in missing:
+            await synthesizer.synthesize(phrase)
+        deadline = time.perf_counter() + timeout
+        while synthesizer._in_flight or not synthesizer.text_queue.empty():
+            # nobody plays this audio; keep the bounded queue from stalling the receiver
+            synthesizer.audio_queue.clear()
+            if time.perf_counter() > deadline:
+                logger.warning("⚠️ TTS cache prewarm timed out")
+                break
+            await asyncio.sleep(0.1)
+    except Exception as e:
+        logger.warning(f"⚠️ TTS cache prewarm failed: {e}")
+    finally:
+        await synthesizer.stop()
+
+    added = tts_audio_cache.stores - stores_before
+    tts_audio_cache.prewarmed += added
+    logger.info(f"🔥 Prewarmed TTS cache with {added}/{len(missing)} phrases")
+    return added
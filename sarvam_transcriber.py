@@ -4,22 +4,30 @@ Real-time transcription via WebSocket API (docs-compliant)
 """
 
 import asyncio
-import base64
-import io
 import json
 import logging
 import time
-import wave
-from typing import Optional, AsyncGenerator, Dict, Any
+from typing import Optional, AsyncGenerator, Dict, Any, List
 
 import websockets
 from websockets.exceptions import InvalidHandshake
 
-from audio_processor import AudioProcessor
+import audio_codec
+from async_channel import Channel, ChannelClosed
+from audio_processor import AudioProcessor, AudioStreamContext
+from audio_queue import DROP_OLDEST, BoundedAudioQueue
 from config import Config
+from local_vad import EnergyVAD
+from ring_buffer import PCMRingBuffer
+from stt_chunk_policy import AdaptiveChunkPolicy
+from stt_input_profile import PROFILES, choose_profile, profile_usage
+from stt_message_encoder import STTAudioMessageEncoder, WavHeaderTemplate
 
 logger = logging.getLogger(__name__)
 
+# how long stop() lets the sender flush queued audio before cancelling it
+STOP_FLUSH_TIMEOUT_SEC = 1.0
+
 
 class SarvamTranscriber:
     """
@@ -46,13 +54,26 @@ class SarvamTranscriber:
         high_vad_sensitivity: bool = True,
         vad_signals: bool = True,
         chunk_duration_ms: int = 400,  # how much audio to batch per STT send
+        local_vad: bool = Config.STT_LOCAL_VAD_ENABLED,
+        vad_keepalive_ms: int = Config.STT_VAD_KEEPALIVE_MS,
+        adaptive_chunking: bool = Config.STT_ADAPTIVE_CHUNKING,
+        input_profile: Optional[str] = None,
+        early_transcripts: bool = Config.LLM_SPECULATIVE,
     ):
         self.api_key = api_key or Config.SARVAM_API_KEY
         self.model = model
         self.language = language
+        # upload format (see stt_input_profile); 8k profiles skip the upsample
+        self.input_profile = input_profile or choose_profile(language, model)
+        self._profile = PROFILES[self.input_profile]
+        self.sample_rate = self._profile["sample_rate"]
         self.high_vad_sensitivity = high_vad_sensitivity
         self.vad_signals = vad_signals
         self.chunk_duration_ms = chunk_duration_ms
+        # ask Sarvam for the transcript at the local energy drop, ahead of its
+        # own END_SPEECH; it is emitted as interim (is_final=False) text for
+        # speculative turns and made final at END_SPEECH
+        self.early_transcripts = early_transcripts and vad_signals and adaptive_chunking
 
         # WebSocket config
         self.api_host = Config.SARVAM_API_HOST
@@ -62,27 +83,96 @@ class SarvamTranscriber:
         self.websocket = None
         self.is_connected = False
         self.connection_time_ms: Optional[int] = None
+        # socket came pre-connected from the STT pool
+        self.pooled = False
 
         # Audio processing
         self.audio_processor = AudioProcessor()
-        self._pcm_buffer = b""  # PCM 16kHz mono
-        # bytes per ms for 16kHz, 16-bit mono: 16000 samples/s * 2 bytes / 1000ms
-        self._bytes_per_ms = int(Config.SARVAM_SAMPLE_RATE * 2 / 1000)
+        # keeps 8k→16k resampler state across 20ms Twilio frames
+        self.audio_context = AudioStreamContext()
+        # mulaw8k without the local VAD uploads Twilio's bytes untouched;
+        # nothing needs PCM except an adaptive-chunking speech detector
+        self._mulaw_passthrough = self._profile["payload"] == "mulaw" and not local_vad
+        # bytes per ms of buffered audio: 16-bit mono PCM at the upload rate
+        # (32 at 16kHz), or 8 for passed-through μ-law
+        self._bytes_per_ms = 8 if self._mulaw_passthrough else int(self.sample_rate * 2 / 1000)
+        # audio to upload (PCM, or μ-law when passed through), preallocated
+        # for two chunks so a flush never grows it
+        self._pcm_buffer = PCMRingBuffer(
+            2 * self._bytes_per_ms * self.chunk_duration_ms
+        )
+        # pre-serialized JSON framing + reusable WAV header for uploads
+        self._message_encoder = STTAudioMessageEncoder(
+            self.sample_rate,
+            self._profile["encoding"],
+            "raw" if self._mulaw_passthrough else self._profile["payload"],
+        )
+        # zero-crossing rate per sample doubles when the same audio is at 8k
+        vad_max_zcr = min(1.0, Config.STT_VAD_MAX_ZCR * Config.SARVAM_SAMPLE_RATE / self.sample_rate)
+
+        # Optional local VAD gate: silence is not uploaded except for
+        # periodic keepalive frames
+        self.vad: Optional[EnergyVAD] = (
+            EnergyVAD(sample_rate=self.sample_rate, max_zcr=vad_max_zcr) if local_vad else None
+        )
+        self.vad_keepalive_ms = vad_keepalive_ms
+        self._last_upload_time: Optional[float] = None
+        self.vad_keepalives_sent = 0
+
+        # Speech-state-driven chunk sizing; needs a local detector even when
+        # the gate itself is off (preroll 0: it only classifies frames)
+        self._speech_detector: Optional[EnergyVAD] = self.vad
+        self.chunk_policy: Optional[AdaptiveChunkPolicy] = None
+        if adaptive_chunking:
+            if self._speech_detector is None:
+                self._speech_detector = EnergyVAD(
+                    sample_rate=self.sample_rate, max_zcr=vad_max_zcr, preroll_ms=0
+                )
+            self.chunk_policy = AdaptiveChunkPolicy(
+                self._bytes_per_ms, mid_chunk_ms=chunk_duration_ms
+            )
+        # when the user stopped talking (the earliest of the chunk policy's
+        # energy drop, the local VAD closing and Sarvam's END_SPEECH), for
+        # stop → final latency
+        self._speech_end_time: Optional[float] = None
+        self.turn_final_latencies_ms: List[int] = []
+
+        # Early transcripts: Sarvam's VAD state, an unanswered early flush,
+        # and interim text awaiting END_SPEECH (then, until _interim_deadline,
+        # the transcript of anything said after the early flush)
+        self._server_speech = False
+        self._early_pending = False
+        self._interim_text = ""
+        self._interim_deadline: Optional[float] = None
+        self.early_flushes = 0
+        self.interim_transcripts = 0
 
         # Performance tracking
         self.audio_chunks_sent = 0
+        self.wire_bytes_sent = 0
+        self.mulaw_bytes_in = 0
+        # conversion + encoding CPU on the upload path
+        self.encode_cpu_sec = 0.0
         self.transcripts_received = 0
         self.first_transcript_latency_ms: Optional[int] = None
         self.turn_start_time: Optional[float] = None
+        self.stream_start_time: Optional[float] = None
 
         # Tasks
         self.sender_task: Optional[asyncio.Task] = None
         self.receiver_task: Optional[asyncio.Task] = None
         self.heartbeat_task: Optional[asyncio.Task] = None
 
-        # Queues
-        self.audio_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
-        self.transcript_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        # Queues; inbound audio is only worth sending while fresh, so a
+        # stalled sender drops the oldest 20ms Twilio frames instead of
+        # building latency (and memory) without limit
+        self.audio_queue = BoundedAudioQueue(
+            maxsize=max(1, Config.STT_AUDIO_QUEUE_MAX_MS // 20),
+            policy=DROP_OLDEST,
+            max_age_sec=Config.STT_AUDIO_QUEUE_MAX_AGE_MS / 1000,
+        )
+        # closed when the receiver ends, which ends transcripts()
+        self.transcript_queue: Channel = Channel()
 
     # -------------------------------------------------------------------------
     # WebSocket URL construction (per API reference)
@@ -93,8 +183,8 @@ class SarvamTranscriber:
         params = {
             "language-code": self.language,
             "model": self.model,
-            "sample_rate": str(Config.SARVAM_SAMPLE_RATE),  # 16000
-            "input_audio_codec": "wav",  # we send WAV chunks
+            "sample_rate": str(self.sample_rate),
+            "input_audio_codec": self._profile["input_audio_codec"],
         }
 
         if self.high_vad_sensitivity:
@@ -103,6 +193,9 @@ class SarvamTranscriber:
         if self.vad_signals:
             params["vad_signals"] = "true"
 
+        if self.early_transcripts:
+            params["flush_signal"] = "true"
+
         query = "&".join(f"{k}={v}" for k, v in params.items())
         return f"{base_url}?{query}"
 
@@ -155,6 +248,14 @@ class SarvamTranscriber:
 
         return False
 
+    def adopt(self, websocket, connection_time_ms: Optional[float] = None):
+        """Use an already-open socket (same ws_url) instead of connecting"""
+        self.websocket = websocket
+        self.connection_time_ms = connection_time_ms
+        self.is_connected = True
+        self.pooled = True
+        logger.info("✅ Using pre-connected Sarvam STT socket")
+
     async def _heartbeat(self, interval: float = 10.0):
         try:
             while self.is_connected and self.websocket:
@@ -175,6 +276,7 @@ class SarvamTranscriber:
             if not ok:
                 raise ConnectionError("Failed to connect to Sarvam STT")
 
+        self.stream_start_time = time.perf_counter()
         self.sender_task = asyncio.create_task(self._sender())
         self.receiver_task = asyncio.create_task(self._receiver())
         self.heartbeat_task = asyncio.create_task(self._heartbeat())
@@ -184,8 +286,22 @@ class SarvamTranscriber:
     async def stop(self):
         logger.info("🛑 Stopping transcriber")
 
+        if self.is_connected and self.mulaw_bytes_in:
+            profile_usage.record(
+                self.input_profile, self._audio_sec(), self.wire_bytes_sent, self.encode_cpu_sec
+            )
+        # sender drains what's queued, flushes the tail to Sarvam and exits;
+        # bounded so a stalled socket can't hold up teardown
+        self.audio_queue.close()
+        if self.sender_task and not self.sender_task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self.sender_task), STOP_FLUSH_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ STT sender did not flush in time, cancelling")
+            except Exception:
+                pass
         self.is_connected = False
-        await self.audio_queue.put(None)  # stop signal
+        self.transcript_queue.close()
 
         # cancel tasks
         for task in [self.sender_task, self.receiver_task, self.heartbeat_task]:
@@ -213,48 +329,46 @@ class SarvamTranscriber:
         Called by VoiceAgent.process_audio().
 
         audio_data: μ-law 8kHz audio bytes from Twilio.
+        Never waits: if the sender has stalled, the oldest audio is dropped.
         """
+        dropped = self.audio_queue.dropped
         await self.audio_queue.put(audio_data)
+        if self.audio_queue.dropped > dropped and dropped == 0:
+            logger.warning("⚠️ STT sender stalled, dropping stale inbound audio")
 
-    def _pcm16_to_wav(self, pcm_data: bytes, sample_rate: int) -> bytes:
+    def _pcm16_to_wav(self, pcm_data, sample_rate: int) -> bytes:
         """Wrap raw PCM 16-bit mono into a WAV container."""
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_data)
-        return buf.getvalue()
+        template = self._message_encoder.wav_template
+        if template.sample_rate != sample_rate:
+            template = WavHeaderTemplate(sample_rate)
+        return template.wrap(pcm_data)
 
     async def _flush_buffer_to_sarvam(self):
         """Send buffered PCM as one STT audio message to Sarvam."""
         if not self._pcm_buffer or not self.websocket:
             return
 
-        wav_bytes = self._pcm16_to_wav(
-            self._pcm_buffer, Config.SARVAM_SAMPLE_RATE
-        )
-        audio_b64 = base64.b64encode(wav_bytes).decode("ascii")
-
-        msg = {
-            "audio": {
-                "data": audio_b64,
-                "sample_rate": str(Config.SARVAM_SAMPLE_RATE),
-                "encoding": "audio/wav",
-            }
-        }
+        # view straight into the ring; WAV header + PCM are base64'd in one
+        # pass and spliced into the pre-built JSON before the next write
+        encode_start = time.thread_time()
+        pcm_view = self._pcm_buffer.peek()
+        pcm_len = len(pcm_view)
+        message = self._message_encoder.encode(pcm_view)
+        self._pcm_buffer.consume(pcm_len)
+        self.encode_cpu_sec += time.thread_time() - encode_start
 
-        await self.websocket.send(json.dumps(msg))
+        await self.websocket.send(message)
         self.audio_chunks_sent += 1
+        self.wire_bytes_sent += len(message)
+        self._last_upload_time = time.perf_counter()
 
         if self.audio_chunks_sent == 1:
             self.turn_start_time = time.perf_counter()
 
         logger.debug(
             f"📤 Sent STT audio chunk "
-            f"({len(self._pcm_buffer)} bytes PCM -> WAV)"
+            f"({pcm_len} bytes -> {self.input_profile})"
         )
-        self._pcm_buffer = b""
 
     async def _sender(self):
         try:
@@ -262,17 +376,37 @@ class SarvamTranscriber:
 
             while self.is_connected and self.websocket:
                 try:
-                    mulaw = await asyncio.wait_for(
-                        self.audio_queue.get(), timeout=5.0
-                    )
-                    if mulaw is None:
+                    # with adaptive chunking, a stalled stream still gets its
+                    # leftovers out after one edge chunk instead of 5s
+                    timeout = 5.0
+                    if self.chunk_policy and self._pcm_buffer:
+                        timeout = self.chunk_policy.edge_chunk_ms / 1000
+
+                    try:
+                        mulaw = await asyncio.wait_for(
+                            self.audio_queue.get(), timeout=timeout
+                        )
+                    except ChannelClosed:
                         # final flush and exit
                         await self._flush_buffer_to_sarvam()
                         break
 
-                    # Twilio μ-law 8k → PCM16 16k
-                    pcm_16k = self.audio_processor.mulaw_8k_to_pcm16_16k(mulaw)
-                    self._pcm_buffer += pcm_16k
+                    audio = self._to_upload(mulaw)
+                    if self.vad is None:
+                        self._pcm_buffer.write(audio)
+                        if self._speech_detector:
+                            # passed-through μ-law is decoded for the detector only
+                            pcm = audio_codec.ulaw2lin(audio) if self._mulaw_passthrough else audio
+                            self._speech_detector.process(pcm)
+                    else:
+                        await self._gate_frame(audio)
+
+                    if self.chunk_policy:
+                        if self._update_chunk_policy(len(audio)):
+                            await self._flush_buffer_to_sarvam()
+                            await self._request_early_transcript()
+                            continue
+                        min_bytes = self.chunk_policy.chunk_bytes
 
                     if len(self._pcm_buffer) >= min_bytes:
                         await self._flush_buffer_to_sarvam()
@@ -294,6 +428,79 @@ class SarvamTranscriber:
                 f"({self.audio_chunks_sent} chunks sent)"
             )
 
+    async def _request_early_transcript(self):
+        """User likely stopped (local energy drop): have Sarvam transcribe now"""
+        if not self.early_transcripts or not self._server_speech or self._early_pending:
+            return
+        await self.websocket.send(json.dumps({"type": "flush"}))
+        self._early_pending = True
+        self.early_flushes += 1
+
+    def _to_upload(self, mulaw: bytes) -> bytes:
+        """Twilio μ-law as buffered for upload: as-is when passed through, else PCM"""
+        if self._mulaw_passthrough:
+            self.mulaw_bytes_in += len(mulaw)
+            return mulaw
+        return self._to_pcm(mulaw)
+
+    def _to_pcm(self, mulaw: bytes) -> bytes:
+        """Twilio μ-law 8k → PCM16 at the upload rate"""
+        convert_start = time.thread_time()
+        self.mulaw_bytes_in += len(mulaw)
+        if self.sample_rate == 8000:
+            # native rate: table decode only, no resampler
+            pcm = audio_codec.ulaw2lin(mulaw)
+        else:
+            pcm = self.audio_context.mulaw_8k_to_pcm16_16k(mulaw)
+        self.encode_cpu_sec += time.thread_time() - convert_start
+        return pcm
+
+    async def _gate_frame(self, pcm: bytes):
+        """Buffer a frame only if the local VAD considers it (near) speech."""
+        was_speech = self.vad.is_speech
+        frames = self.vad.process(pcm)
+        if self.vad.is_speech and not was_speech:
+            self._speech_end_time = None
+        for frame in frames:
+            self._pcm_buffer.write(frame)
+        if frames:
+            return
+
+        if was_speech:
+            # gate just closed: send the utterance tail now instead of
+            # waiting for a full chunk
+            if self._speech_end_time is None:
+                # the last voiced frame, before the hangover
+                self._speech_end_time = time.perf_counter() - self.vad.hangover_ms / 1000
+            await self._flush_buffer_to_sarvam()
+            return
+
+        now = time.perf_counter()
+        last = self._last_upload_time or self.stream_start_time or now
+        if (now - last) * 1000 >= self.vad_keepalive_ms:
+            # short silent frame keeps the STT session from idling out
+            self._pcm_buffer.write(bytes(len(pcm)))
+            self.vad_keepalives_sent += 1
+            await self._flush_buffer_to_sarvam()
+
+    def _update_chunk_policy(self, frame_bytes: int) -> bool:
+        """Feed the latest speech state to the chunk policy; True = flush now."""
+        detector = self._speech_detector
+        flush_now = self.chunk_policy.update(
+            detector.is_speech,
+            detector.last_voiced,
+            frame_bytes / self._bytes_per_ms,
+        )
+        if flush_now:
+            # local estimate of when the user stopped talking: the last
+            # voiced frame, before the confirmation window
+            self._speech_end_time = (
+                time.perf_counter() - self.chunk_policy.unvoiced_ms / 1000
+            )
+        elif detector.last_voiced:
+            self._speech_end_time = None
+        return flush_now
+
     # -------------------------------------------------------------------------
     # Receiving transcripts
     # -------------------------------------------------------------------------
@@ -311,8 +518,11 @@ class SarvamTranscriber:
         try:
             while self.is_connected and self.websocket:
                 try:
+                    timeout = 30.0
+                    if self._interim_deadline is not None:
+                        timeout = max(0.0, self._interim_deadline - time.perf_counter())
                     message = await asyncio.wait_for(
-                        self.websocket.recv(), timeout=30.0
+                        self.websocket.recv(), timeout=timeout
                     )
                     data = json.loads(message)
 
@@ -352,19 +562,38 @@ class SarvamTranscriber:
                                     f"{self.first_transcript_latency_ms}ms"
                                 )
 
-                            await self.transcript_queue.put(
-                                {
-                                    "type": "transcript",
-                                    "text": transcript_text,
-                                    "is_final": True,  # Sarvam generally sends final in this style
-                                    "timestamp": time.time(),
-                                }
-                            )
-                            logger.info(f"📝 Final: {transcript_text}")
+                            early, self._early_pending = self._early_pending, False
+                            text = f"{self._interim_text} {transcript_text}".strip()
+                            if early and self._server_speech:
+                                # answer to our early flush while Sarvam's VAD
+                                # still hears speech: final at END_SPEECH
+                                self._interim_text = text
+                                self.interim_transcripts += 1
+                                await self.transcript_queue.put(
+                                    {
+                                        "type": "transcript",
+                                        "text": text,
+                                        "is_final": False,
+                                        "timestamp": time.time(),
+                                    }
+                                )
+                                logger.debug(f"📝 Interim: {text}")
+                                continue
+
+                            # includes the words after an early transcript
+                            self._interim_text = ""
+                            self._interim_deadline = None
+                            await self._emit_final(text)
                             continue
 
                     # 2) VAD / speech signals (from streaming guide)
                     if msg_type in ("speech_start", "START_SPEECH"):
+                        if self._interim_deadline is not None:
+                            # a new utterance: the last one ended with its interim
+                            await self._emit_interim()
+                        self._server_speech = True
+                        # an end with no final (nothing transcribed) doesn't count
+                        self._speech_end_time = None
                         await self.transcript_queue.put(
                             {
                                 "type": "vad",
@@ -377,6 +606,9 @@ class SarvamTranscriber:
                         continue
 
                     if msg_type in ("speech_end", "END_SPEECH"):
+                        self._server_speech = False
+                        if self._speech_end_time is None:
+                            self._speech_end_time = time.perf_counter()
                         await self.transcript_queue.put(
                             {
                                 "type": "vad",
@@ -385,6 +617,12 @@ class SarvamTranscriber:
                             }
                         )
                         logger.debug("🔇 Speech ended")
+                        if self._interim_text:
+                            # Sarvam transcribes what was said after the early
+                            # flush now; merged with the interim when it comes
+                            self._interim_deadline = (
+                                time.perf_counter() + Config.STT_POST_SPEECH_WAIT_MS / 1000
+                            )
                         continue
 
                     # 3) Error messages
@@ -393,6 +631,12 @@ class SarvamTranscriber:
                         continue
 
                 except asyncio.TimeoutError:
+                    if (
+                        self._interim_deadline is not None
+                        and time.perf_counter() >= self._interim_deadline
+                    ):
+                        # nothing was said after the early transcript
+                        await self._emit_interim()
                     continue
                 except json.JSONDecodeError as e:
                     logger.error(f"❌ STT JSON decode error: {e}")
@@ -403,11 +647,40 @@ class SarvamTranscriber:
         except asyncio.CancelledError:
             logger.info("🛑 STT receiver task cancelled")
         finally:
+            self.transcript_queue.close()
             logger.info(
                 f"📥 STT receiver finished "
                 f"({self.transcripts_received} transcripts)"
             )
 
+    async def _emit_interim(self):
+        text, self._interim_text = self._interim_text, ""
+        self._interim_deadline = None
+        await self._emit_final(text)
+
+    async def _emit_final(self, transcript_text: str):
+        event = {
+            "type": "transcript",
+            "text": transcript_text,
+            "is_final": True,  # Sarvam generally sends final in this style
+            "timestamp": time.time(),
+        }
+
+        if self._speech_end_time is not None:
+            stop_to_final_ms = round(
+                (time.perf_counter() - self._speech_end_time) * 1000
+            )
+            self._speech_end_time = None
+            self.turn_final_latencies_ms.append(stop_to_final_ms)
+            event["speech_end_to_final_ms"] = stop_to_final_ms
+            logger.info(
+                "⏱️ User stop → final transcript in "
+                f"{stop_to_final_ms}ms"
+            )
+
+        await self.transcript_queue.put(event)
+        logger.info(f"📝 Final: {transcript_text}")
+
     # -------------------------------------------------------------------------
     # Public consumption API for VoiceAgent
     # -------------------------------------------------------------------------
@@ -420,19 +693,84 @@ class SarvamTranscriber:
                     self.transcript_queue.get(), timeout=timeout
                 )
             return await self.transcript_queue.get()
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, ChannelClosed):
             return None
 
     async def transcripts(self) -> AsyncGenerator[Dict[str, Any], None]:
-        while self.is_connected:
-            event = await self.get_transcript(timeout=1.0)
-            if event:
-                yield event
+        """Events as they arrive; ends once the receiver has stopped and they're drained"""
+        async for event in self.transcript_queue:
+            yield event
 
     def get_stats(self) -> Dict[str, Any]:
+        buffer_allocations = (
+            self._pcm_buffer.allocations + self._pcm_buffer.linearizations
+        )
+        allocations_per_min = None
+        if self.stream_start_time:
+            minutes = (time.perf_counter() - self.stream_start_time) / 60
+            if minutes > 0:
+                allocations_per_min = round(buffer_allocations / minutes, 2)
+
         return {
             "connection_time_ms": self.connection_time_ms,
+            "pooled_connection": self.pooled,
+            **self._profile_stats(),
+            "audio_queue": self.audio_queue.get_stats(),
             "audio_chunks_sent": self.audio_chunks_sent,
             "transcripts_received": self.transcripts_received,
             "first_transcript_latency_ms": self.first_transcript_latency_ms,
+            "pcm_buffer_capacity": self._pcm_buffer.capacity,
+            "pcm_buffer_allocations": buffer_allocations,
+            "pcm_buffer_allocations_per_min": allocations_per_min,
+            **self._latency_stats(),
+            **self._vad_stats(),
+            **self._chunking_stats(),
+        }
+
+    def _audio_sec(self) -> float:
+        # Twilio input is μ-law 8kHz: one byte per sample
+        return self.mulaw_bytes_in / 8000
+
+    def _profile_stats(self) -> Dict[str, Any]:
+        minutes = self._audio_sec() / 60
+        return {
+            "input_profile": self.input_profile,
+            "wire_bytes_sent": self.wire_bytes_sent,
+            "wire_bytes_per_min": round(self.wire_bytes_sent / minutes) if minutes else None,
+            "encode_cpu_ms_per_min": round(self.encode_cpu_sec * 1000 / minutes, 2) if minutes else None,
+        }
+
+    def _latency_stats(self) -> Dict[str, Any]:
+        latencies = self.turn_final_latencies_ms
+        return {
+            "speech_end_to_final_ms": list(latencies),
+            "avg_speech_end_to_final_ms": (
+                round(sum(latencies) / len(latencies)) if latencies else None
+            ),
+        }
+
+    def _chunking_stats(self) -> Dict[str, Any]:
+        if self.chunk_policy is None:
+            return {"adaptive_chunking": False}
+
+        return {
+            "adaptive_chunking": True,
+            "energy_drop_flushes": self.chunk_policy.energy_drop_flushes,
+            "early_flushes": self.early_flushes,
+            "interim_transcripts": self.interim_transcripts,
+        }
+
+    def _vad_stats(self) -> Dict[str, Any]:
+        if self.vad is None:
+            return {"local_vad": False}
+
+        chunk_bytes = self._bytes_per_ms * self.chunk_duration_ms
+        bytes_saved = self.vad.bytes_dropped + self.vad.bytes_held
+        return {
+            "local_vad": True,
+            "vad_speech_segments": self.vad.speech_segments,
+            "vad_pcm_bytes_in": self.vad.bytes_in,
+            "vad_pcm_bytes_saved": bytes_saved,
+            "vad_chunks_saved": bytes_saved // chunk_bytes,
+            "vad_keepalives_sent": self.vad_keepalives_sent,
         }
@@ -0,0 +1,75 @@
+"""
+Adaptive STT Chunk Sizing
+Chooses how much PCM to batch per Sarvam upload from the local speech state
+"""
+from config import Config
+
+
+class AdaptiveChunkPolicy:
+    """
+    Small uploads at utterance edges, large ones mid-utterance
+
+    Near speech onset (first onset_window_ms) and after the energy drops at
+    the end of an utterance, latency matters more than per-message overhead,
+    so chunks shrink to edge_chunk_ms. In the middle of an utterance and in
+    silence the usual mid_chunk_ms batching applies.
+
+    update() is called once per frame with the detector's state and returns
+    True when the buffered audio should be flushed immediately: the frame at
+    which energy has stayed low for drop_confirm_ms, which filters out the
+    short dips between syllables.
+    """
+
+    def __init__(
+        self,
+        bytes_per_ms: int,
+        edge_chunk_ms: int = Config.STT_EDGE_CHUNK_MS,
+        mid_chunk_ms: int = 400,
+        onset_window_ms: int = Config.STT_ONSET_WINDOW_MS,
+        drop_confirm_ms: int = 60,
+    ):
+        self.bytes_per_ms = bytes_per_ms
+        self.edge_chunk_ms = edge_chunk_ms
+        self.mid_chunk_ms = mid_chunk_ms
+        self.onset_window_ms = onset_window_ms
+        self.drop_confirm_ms = drop_confirm_ms
+
+        self._was_speech = False
+        self._speech_ms = 0.0
+        # length of the current low-energy run inside speech
+        self.unvoiced_ms = 0.0
+        self.chunk_ms = mid_chunk_ms
+
+        # Stats
+        self.energy_drop_flushes = 0
+
+    @property
+    def chunk_bytes(self) -> int:
+        return self.bytes_per_ms * self.chunk_ms
+
+    def update(self, is_speech: bool, voiced: bool, frame_ms: float) -> bool:
+        flush_now = False
+
+        if is_speech:
+            self._speech_ms = self._speech_ms + frame_ms if self._was_speech else frame_ms
+            if voiced:
+                self.unvoiced_ms = 0.0
+            else:
+                before = self.unvoiced_ms
+                self.unvoiced_ms += frame_ms
+                if before < self.drop_confirm_ms <= self.unvoiced_ms:
+                    # energy has dropped: the user may have stopped talking
+                    flush_now = True
+                    self.energy_drop_flushes += 1
+
+            if not voiced or self._speech_ms <= self.onset_window_ms:
+                self.chunk_ms = self.edge_chunk_ms
+            else:
+                self.chunk_ms = self.mid_chunk_ms
+        else:
+            self._speech_ms = 0.0
+            self.unvoiced_ms = 0.0
+            self.chunk_ms = self.mid_chunk_ms
+
+        self._was_speech = is_speech
+        return flush_now
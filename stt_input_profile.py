@@ -0,0 +1,81 @@
+"""
+STT Input Profiles
+Audio format uploaded to Sarvam STT, chosen per language/model, with per-profile cost tallies
+"""
+import logging
+from typing import Any, Dict
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# profile -> how audio is declared in the ws URL and each message
+PROFILES: Dict[str, Dict[str, Any]] = {
+    # original path: Twilio 8k upsampled 2x, WAV-wrapped
+    "wav16k": {"sample_rate": 16000, "input_audio_codec": "wav", "encoding": "audio/wav", "payload": "wav"},
+    # native rate, headerless 16-bit PCM: no upsample, no WAV header
+    "pcm8k": {"sample_rate": 8000, "input_audio_codec": "pcm_s16le", "encoding": "audio/x-raw", "payload": "pcm"},
+    # native rate μ-law, half the bytes of pcm8k
+    "mulaw8k": {"sample_rate": 8000, "input_audio_codec": "pcm_mulaw", "encoding": "audio/x-mulaw", "payload": "mulaw"},
+}
+
+DEFAULT_PROFILE = "wav16k"
+
+
+def _parse_overrides(spec: str) -> Dict[str, str]:
+    """'hi-IN=pcm8k,en-IN/saarika:v2.5=mulaw8k' -> {key: profile}"""
+    overrides = {}
+    for entry in filter(None, (e.strip() for e in spec.split(","))):
+        key, _, profile = entry.partition("=")
+        if profile.strip() not in PROFILES:
+            logger.warning(f"⚠️ Ignoring STT input profile override {entry!r}")
+            continue
+        overrides[key.strip()] = profile.strip()
+    return overrides
+
+
+_overrides = _parse_overrides(Config.STT_INPUT_PROFILE_OVERRIDES)
+
+
+def choose_profile(language: str, model: str) -> str:
+    """language/model override, then language override, then STT_INPUT_PROFILE"""
+    profile = (
+        _overrides.get(f"{language}/{model}")
+        or _overrides.get(language)
+        or Config.STT_INPUT_PROFILE
+    )
+    if profile not in PROFILES:
+        logger.warning(f"⚠️ Unknown STT input profile {profile!r}, using {DEFAULT_PROFILE}")
+        return DEFAULT_PROFILE
+    return profile
+
+
+class ProfileUsage:
+    """Process-wide cost per profile (finished streams), to compare them on real traffic"""
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def record(self, profile: str, audio_sec: float, wire_bytes: int, cpu_sec: float):
+        totals = self._totals.setdefault(
+            profile, {"streams": 0, "audio_sec": 0.0, "wire_bytes": 0, "cpu_sec": 0.0}
+        )
+        totals["streams"] += 1
+        totals["audio_sec"] += audio_sec
+        totals["wire_bytes"] += wire_bytes
+        totals["cpu_sec"] += cpu_sec
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {}
+        for profile, totals in self._totals.items():
+            minutes = totals["audio_sec"] / 60
+            stats[profile] = {
+                "streams": totals["streams"],
+                "audio_minutes": round(minutes, 2),
+                "wire_bytes_per_min": round(totals["wire_bytes"] / minutes) if minutes else None,
+                "cpu_ms_per_min": round(totals["cpu_sec"] * 1000 / minutes, 2) if minutes else None,
+            }
+        return stats
+
+
+profile_usage = ProfileUsage()
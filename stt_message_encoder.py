@@ -0,0 +1,121 @@
+"""
+STT Upload Encoding
+WAV header templating and pre-built JSON framing for Sarvam STT audio messages
+"""
+import binascii
+import json
+import struct
+from typing import Tuple
+
+import audio_codec
+
+WAV_HEADER_SIZE = 44
+# PCM bytes encoded together with the header so the rest starts on a
+# base64 group boundary (44 + 1 is a multiple of 3)
+_HEADER_PAD = -WAV_HEADER_SIZE % 3
+
+# RIFF/WAVE header for PCM; only the two length fields vary per chunk
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_RIFF_SIZE_OFFSET = 4
+_DATA_SIZE_OFFSET = 40
+
+
+class WavHeaderTemplate:
+    """
+    44-byte PCM WAV header packed once per stream format
+
+    header() patches the RIFF and data length fields in place and returns a
+    view of the reusable buffer, replacing a BytesIO + wave.Wave_write per
+    chunk.
+    """
+
+    def __init__(self, sample_rate: int, channels: int = 1, sample_width: int = 2):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+
+        block_align = channels * sample_width
+        self._header = bytearray(WAV_HEADER_SIZE)
+        _WAV_HEADER.pack_into(
+            self._header, 0,
+            b"RIFF", 36, b"WAVE",
+            b"fmt ", 16, 1, channels, sample_rate,
+            sample_rate * block_align, block_align, sample_width * 8,
+            b"data", 0,
+        )
+
+    def header(self, data_len: int) -> memoryview:
+        """Header for data_len bytes of PCM (view of the shared buffer)"""
+        struct.pack_into("<I", self._header, _RIFF_SIZE_OFFSET, 36 + data_len)
+        struct.pack_into("<I", self._header, _DATA_SIZE_OFFSET, data_len)
+        return memoryview(self._header)
+
+    def wrap(self, pcm_data) -> bytes:
+        """Complete WAV file bytes for pcm_data"""
+        return bytes(self.header(len(pcm_data))) + bytes(pcm_data)
+
+
+class STTAudioMessageEncoder:
+    """
+    Builds Sarvam STT audio messages without a per-chunk json.dumps
+
+    The JSON around the base64 payload never changes for a stream, so it is
+    serialized once into a prefix and suffix. Per chunk, the WAV header plus
+    the first PCM byte go through a 45-byte scratch buffer (a whole number
+    of base64 groups), and the rest of the PCM is base64-encoded straight
+    from the caller's memoryview, so the PCM itself is never copied before
+    encoding. Output is identical to json.dumps of:
+
+        {"audio": {"data": "<base64 wav>", "sample_rate": "<rate>", "encoding": "audio/wav"}}
+
+    payload "pcm" sends the PCM without a WAV header and "mulaw" sends it
+    μ-law encoded (see stt_input_profile); "raw" sends chunks that are
+    already in the wire format (Twilio μ-law passed straight through).
+    """
+
+    def __init__(self, sample_rate: int, encoding: str = "audio/wav", payload: str = "wav"):
+        self.wav_template = WavHeaderTemplate(sample_rate)
+        self.payload = payload
+
+        marker = "__audio_payload__"
+        template = json.dumps(
+            {
+                "audio": {
+                    "data": marker,
+                    "sample_rate": str(sample_rate),
+                    "encoding": encoding,
+                }
+            }
+        )
+        self._prefix, self._suffix = template.split(marker)
+
+        self._head = bytearray(WAV_HEADER_SIZE + _HEADER_PAD)
+        self._head_view = memoryview(self._head)
+
+    def _wav_base64_parts(self, pcm_data) -> Tuple[str, str]:
+        """Base64 of the header (+ pad bytes) and of the remaining PCM"""
+        pcm = memoryview(pcm_data)
+        pad = min(_HEADER_PAD, len(pcm))
+        head = self._head_view[:WAV_HEADER_SIZE + pad]
+        head[:WAV_HEADER_SIZE] = self.wav_template.header(len(pcm))
+        head[WAV_HEADER_SIZE:] = pcm[:pad]
+        return (
+            binascii.b2a_base64(head, newline=False).decode("ascii"),
+            binascii.b2a_base64(pcm[pad:], newline=False).decode("ascii"),
+        )
+
+    def encode_wav_base64(self, pcm_data) -> str:
+        """Base64 of the WAV-wrapped chunk"""
+        return "".join(self._wav_base64_parts(pcm_data))
+
+    def encode(self, pcm_data) -> str:
+        """Complete JSON text message for one chunk (PCM, or μ-law for "raw")"""
+        if self.payload == "wav":
+            head, body = self._wav_base64_parts(pcm_data)
+            return f"{self._prefix}{head}{body}{self._suffix}"
+        elif self.payload == "mulaw":
+            data = binascii.b2a_base64(audio_codec.lin2ulaw(pcm_data), newline=False).decode("ascii")
+        else:
+            # "pcm" / "raw": the buffered bytes are the payload
+            data = binascii.b2a_base64(pcm_data, newline=False).decode("ascii")
+        return f"{self._prefix}{data}{self._suffix}"
@@ -0,0 +1,233 @@
+"""
+STT Connection Pool
+Warm Sarvam STT websockets handed to a transcriber at call start
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import websockets
+
+from config import Config
+from latency_stats import percentile
+from sarvam_transcriber import SarvamTranscriber
+
+logger = logging.getLogger(__name__)
+
+
+class _WarmSocket:
+    def __init__(self, websocket, connect_ms: float):
+        self.websocket = websocket
+        self.connect_ms = connect_ms
+        self.connected_at = time.monotonic()
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self.connected_at
+
+    @property
+    def is_open(self) -> bool:
+        return bool(getattr(self.websocket, "open", False))
+
+
+class STTConnectionPool:
+    """
+    Connected STT websockets, keyed by the transcriber's full ws_url
+
+    The URL carries language, model, sample rate, codec and VAD flags, so a
+    socket only goes to a transcriber that would have opened the same one.
+    STT sessions are single-use: a socket is handed over once and closed by
+    the transcriber that adopted it. After each checkout a background task
+    refills the key to size; idle sockets are pinged every ping_interval_sec
+    and dropped if the ping fails or they pass max_age_sec.
+
+    On a miss the transcriber connects inline, as before; that latency is
+    recorded separately from background connects.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = Config.STT_POOL_ENABLED,
+        size: int = Config.STT_POOL_SIZE,
+        max_age_sec: float = Config.STT_POOL_MAX_AGE_SEC,
+        ping_interval_sec: float = Config.STT_POOL_PING_INTERVAL_SEC,
+        ping_timeout_sec: float = 5.0,
+    ):
+        self.enabled = enabled
+        self.size = size
+        self.max_age_sec = max_age_sec
+        self.ping_interval_sec = ping_interval_sec
+        self.ping_timeout_sec = ping_timeout_sec
+
+        # oldest first; checkout takes from the end
+        self._idle: Dict[str, List[_WarmSocket]] = {}
+        self._connecting: Dict[str, int] = {}
+        self._refill = asyncio.Event()
+        self._maintainer: Optional[asyncio.Task] = None
+        self._last_ping = 0.0
+        self._retry_at: Dict[str, float] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.ping_failures = 0
+        self.connect_failures = 0
+        self.pool_connect_ms: Deque[float] = deque(maxlen=500)
+        self.miss_connect_ms: Deque[float] = deque(maxlen=500)
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    async def start(self):
+        if not self.enabled or self.size <= 0:
+            return
+        # default transcriber settings are warmed before the first call
+        self._idle.setdefault(SarvamTranscriber().ws_url, [])
+        self._refill.set()
+        self._maintainer = asyncio.create_task(self._maintain())
+        logger.info("✅ STT connection pool started")
+
+    async def close(self):
+        if self._maintainer and not self._maintainer.done():
+            self._maintainer.cancel()
+            try:
+                await self._maintainer
+            except asyncio.CancelledError:
+                pass
+        for idle in self._idle.values():
+            for warm in idle:
+                await self._close(warm)
+            idle.clear()
+
+    # -------------------------------------------------------------------------
+    # Handoff
+    # -------------------------------------------------------------------------
+    async def acquire(self, transcriber: SarvamTranscriber):
+        """Connect transcriber, from a warm socket when one is available"""
+        warm = None
+        if self.enabled and self.size > 0:
+            idle = self._idle.setdefault(transcriber.ws_url, [])
+            while idle:
+                candidate = idle.pop()
+                if candidate.is_open and candidate.age_sec < self.max_age_sec:
+                    warm = candidate
+                    break
+                self.expired += 1
+                asyncio.create_task(self._close(candidate))
+            self._refill.set()
+
+        if warm is not None:
+            self.hits += 1
+            transcriber.adopt(warm.websocket, warm.connect_ms)
+            return
+
+        self.misses += 1
+        if not await transcriber.connect():
+            raise ConnectionError("Failed to connect to Sarvam STT")
+        self.miss_connect_ms.append(transcriber.connection_time_ms)
+
+    # -------------------------------------------------------------------------
+    # Background upkeep
+    # -------------------------------------------------------------------------
+    async def _close(self, warm: _WarmSocket):
+        try:
+            await warm.websocket.close()
+        except Exception:
+            pass
+
+    async def _open(self, url: str):
+        self._connecting[url] = self._connecting.get(url, 0) + 1
+        try:
+            started = time.perf_counter()
+            websocket = await asyncio.wait_for(
+                websockets.connect(url, extra_headers={"Api-Subscription-Key": Config.SARVAM_API_KEY}),
+                timeout=10.0,
+            )
+            connect_ms = round((time.perf_counter() - started) * 1000, 1)
+            self.pool_connect_ms.append(connect_ms)
+            self._idle.setdefault(url, []).append(_WarmSocket(websocket, connect_ms))
+            self._retry_at.pop(url, None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.connect_failures += 1
+            self._retry_at[url] = time.monotonic() + 5.0
+            logger.warning(f"⚠️ STT pool connect failed: {e}")
+        finally:
+            self._connecting[url] -= 1
+
+    async def _ping(self, warm: _WarmSocket) -> bool:
+        try:
+            pong = await warm.websocket.ping()
+            await asyncio.wait_for(pong, timeout=self.ping_timeout_sec)
+            return True
+        except Exception:
+            self.ping_failures += 1
+            return False
+
+    async def _check_health(self):
+        for idle in self._idle.values():
+            if not idle:
+                continue
+            snapshot = list(idle)
+            alive = await asyncio.gather(*(self._ping(w) for w in snapshot))
+            for warm, ok in zip(snapshot, alive):
+                if not ok and warm in idle:
+                    idle.remove(warm)
+                    await self._close(warm)
+
+    async def _maintain(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._refill.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+            self._refill.clear()
+
+            try:
+                if time.monotonic() - self._last_ping >= self.ping_interval_sec:
+                    self._last_ping = time.monotonic()
+                    await self._check_health()
+
+                opens = []
+                for url, idle in self._idle.items():
+                    for warm in [w for w in idle if not w.is_open or w.age_sec >= self.max_age_sec]:
+                        idle.remove(warm)
+                        self.expired += 1
+                        await self._close(warm)
+                    if self._retry_at.get(url, 0.0) > time.monotonic():
+                        continue
+                    missing = self.size - len(idle) - self._connecting.get(url, 0)
+                    opens.extend(self._open(url) for _ in range(max(0, missing)))
+                if opens:
+                    await asyncio.gather(*opens)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ STT pool upkeep error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        acquired = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": self.size,
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "keys": len(self._idle),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / acquired, 3) if acquired else None,
+            "expired": self.expired,
+            "ping_failures": self.ping_failures,
+            "connect_failures": self.connect_failures,
+            "pool_connect_p50_ms": percentile(self.pool_connect_ms, 50),
+            "pool_connect_p95_ms": percentile(self.pool_connect_ms, 95),
+            "pool_connect_p99_ms": percentile(self.pool_connect_ms, 99),
+            "miss_connect_p50_ms": percentile(self.miss_connect_ms, 50),
+            "miss_connect_p95_ms": percentile(self.miss_connect_ms, 95),
+        }
+
+
+stt_pool = STTConnectionPool()
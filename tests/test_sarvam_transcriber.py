@@ -0,0 +1,100 @@
+"""
+Early transcripts: interim text is merged with what Sarvam sends after END_SPEECH
+"""
+import asyncio
+import json
+
+from config import Config
+from sarvam_transcriber import SarvamTranscriber
+
+
+class FakeSarvam:
+    """Websocket stand-in: recv() replays scripted (delay_sec, message) pairs"""
+
+    def __init__(self, script):
+        self.script = list(script)
+
+    async def recv(self):
+        if not self.script:
+            await asyncio.sleep(3600)
+        delay, message = self.script.pop(0)
+        await asyncio.sleep(delay)
+        return json.dumps(message)
+
+    async def send(self, message):
+        pass
+
+    async def close(self):
+        pass
+
+
+def _transcript(text):
+    return {"type": "data", "data": {"transcript": text}}
+
+
+async def _finals(script, wait_sec):
+    transcriber = SarvamTranscriber(api_key="x")
+    transcriber.websocket = FakeSarvam(script)
+    transcriber.is_connected = True
+    receiver = asyncio.create_task(transcriber._receiver())
+    # as if the sender's energy-drop flush had just gone out
+    transcriber._early_pending = True
+    await asyncio.sleep(wait_sec)
+    receiver.cancel()
+
+    events = []
+    while not transcriber.transcript_queue.empty():
+        events.append(transcriber.transcript_queue.get_nowait())
+    return [e["text"] for e in events if e["type"] == "transcript" and e["is_final"]], events
+
+
+def test_transcript_after_speech_end_is_merged_with_interim():
+    script = [
+        (0.0, {"type": "speech_start"}),
+        (0.01, _transcript("I have five years")),
+        (0.01, {"type": "speech_end"}),
+        # words after the early flush, transcribed once Sarvam's VAD ended
+        (0.1, _transcript("of experience in Python.")),
+    ]
+    finals, events = asyncio.run(_finals(script, 0.3))
+
+    assert finals == ["I have five years of experience in Python."]
+    interims = [e["text"] for e in events if e["type"] == "transcript" and not e["is_final"]]
+    assert interims == ["I have five years"]
+
+
+def test_interim_becomes_final_when_nothing_follows_speech_end():
+    script = [
+        (0.0, {"type": "speech_start"}),
+        (0.01, _transcript("I have five years of experience.")),
+        (0.01, {"type": "speech_end"}),
+    ]
+    wait_sec = Config.STT_POST_SPEECH_WAIT_MS / 1000 + 0.2
+    finals, _ = asyncio.run(_finals(script, wait_sec))
+
+    assert finals == ["I have five years of experience."]
+
+
+def test_new_utterance_ends_the_wait_for_the_previous_one():
+    script = [
+        (0.0, {"type": "speech_start"}),
+        (0.01, _transcript("Yes.")),
+        (0.01, {"type": "speech_end"}),
+        (0.05, {"type": "speech_start"}),
+        (0.01, _transcript("And one more thing.")),
+    ]
+    finals, _ = asyncio.run(_finals(script, 0.2))
+
+    assert finals == ["Yes.", "And one more thing."]
+
+
+def test_speech_end_to_final_is_timed_without_adaptive_chunking():
+    script = [
+        (0.0, {"type": "speech_start"}),
+        (0.01, {"type": "speech_end"}),
+        (0.1, _transcript("Yes, I can start next month.")),
+    ]
+    _, events = asyncio.run(_finals(script, 0.3))
+
+    final = next(e for e in events if e["type"] == "transcript")
+    assert 80 <= final["speech_end_to_final_ms"] < 250
@@ -0,0 +1,55 @@
+"""
+mulaw8k uploads Twilio's μ-law untouched when nothing needs PCM
+"""
+import asyncio
+import base64
+import json
+
+from sarvam_transcriber import SarvamTranscriber
+
+
+class RecordingSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def recv(self):
+        await asyncio.sleep(3600)
+
+    async def ping(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+async def _uploaded(frames, **kwargs):
+    transcriber = SarvamTranscriber(api_key="x", input_profile="mulaw8k", **kwargs)
+    socket = RecordingSocket()
+    transcriber.websocket = socket
+    transcriber.is_connected = True
+    await transcriber.start()
+    for frame in frames:
+        await transcriber.send_audio(frame)
+    await transcriber.stop()
+    return b"".join(
+        base64.b64decode(json.loads(m)["audio"]["data"]) for m in socket.sent if '"audio"' in m
+    )
+
+
+def _frames():
+    # every μ-law code, including the two zeros (0x7F/0xFF) a decode/encode round trip merges
+    return [bytes(range(256))[i:i + 160] for i in (0, 96)] * 25
+
+
+def test_mulaw_passthrough_sends_twilio_bytes_unchanged():
+    frames = _frames()
+    assert asyncio.run(_uploaded(frames, local_vad=False, adaptive_chunking=False)) == b"".join(frames)
+
+
+def test_mulaw_passthrough_with_adaptive_chunking():
+    frames = _frames()
+    uploaded = asyncio.run(_uploaded(frames, local_vad=False, adaptive_chunking=True))
+    assert uploaded == b"".join(frames)
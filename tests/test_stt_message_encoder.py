@@ -0,0 +1,41 @@
+"""
+Templated STT messages match json.dumps of the WAV-wrapped chunk
+"""
+import base64
+import json
+import os
+
+from ring_buffer import PCMRingBuffer
+from stt_message_encoder import STTAudioMessageEncoder, WavHeaderTemplate
+
+
+def _reference(pcm: bytes, sample_rate: int) -> str:
+    wav = WavHeaderTemplate(sample_rate).wrap(pcm)
+    return json.dumps(
+        {
+            "audio": {
+                "data": base64.b64encode(wav).decode("ascii"),
+                "sample_rate": str(sample_rate),
+                "encoding": "audio/wav",
+            }
+        }
+    )
+
+
+def test_encode_matches_reference_for_every_base64_alignment():
+    encoder = STTAudioMessageEncoder(16000)
+    for size in (0, 1, 2, 3, 4, 100, 12800, 12801, 12802):
+        pcm = os.urandom(size)
+        assert encoder.encode(pcm) == _reference(pcm, 16000), size
+
+
+def test_encode_from_ring_buffer_view():
+    encoder = STTAudioMessageEncoder(8000)
+    ring = PCMRingBuffer(1000)
+    ring.write(os.urandom(700))
+    ring.consume(600)
+    # wraps around the end of the ring
+    pcm = os.urandom(500)
+    ring.write(pcm)
+    ring.consume(100)
+    assert encoder.encode(ring.peek()) == _reference(pcm, 8000)
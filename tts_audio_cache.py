@@ -0,0 +1,205 @@
+"""
+TTS Audio Cache
+Ready-to-send μ-law 8k audio for repeated phrases, keyed by text and voice settings
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# open mappings kept for the disk tier (each holds a file descriptor)
+MAX_MAPPED_FILES = 256
+
+
+class TTSAudioCache:
+    """
+    Two-tier cache of synthesized phrases, shared by every call in the process
+
+    Entries are the μ-law 8kHz bytes the synthesizer would have queued for
+    the phrase, keyed by a hash of (text, voice, language, pace, pitch,
+    loudness, model), so any change to the voice settings is a miss rather
+    than wrong audio. The memory tier is an LRU bounded by memory_bytes.
+    With a cache_dir, every entry is also written there as a raw .ulaw file
+    and read back through mmap, so the pages are shared with other worker
+    processes and survive restarts; the disk tier is trimmed oldest-first
+    past disk_bytes. It is opt-in (empty cache_dir: memory only).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = Config.TTS_CACHE_DIR,
+        enabled: bool = Config.TTS_CACHE_ENABLED,
+        memory_bytes: int = Config.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+        disk_bytes: int = Config.TTS_CACHE_DISK_MB * 1024 * 1024,
+        max_chars: int = Config.TTS_CACHE_MAX_CHARS,
+    ):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.max_chars = max_chars
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_used = 0
+        self._mapped: "OrderedDict[str, mmap.mmap]" = OrderedDict()
+        # computed on first store
+        self._disk_used: Optional[int] = None
+
+        # Stats
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.prewarmed = 0
+
+    @staticmethod
+    def key(text: str, voice: str, language: str, pace: float, pitch: float, loudness: float, model: str) -> str:
+        fields = [text, voice, language, pace, pitch, loudness, model]
+        return hashlib.sha256(json.dumps(fields, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def cacheable(self, text: str) -> bool:
+        return self.enabled and 0 < len(text) <= self.max_chars
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.ulaw")
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+    def get(self, key: str) -> Optional[bytes]:
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return audio
+
+        audio = self._read_disk(key)
+        if audio is not None:
+            self.disk_hits += 1
+            self._remember(key, audio)
+            return audio
+
+        self.misses += 1
+        return None
+
+    def contains(self, key: str) -> bool:
+        """Presence check that doesn't count as a lookup"""
+        if key in self._memory or key in self._mapped:
+            return True
+        return bool(self.cache_dir) and os.path.exists(self._path(key))
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        mapped = self._mapped.get(key)
+        if mapped is None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # missing, or empty (mmap refuses zero-length files)
+                return None
+            self._mapped[key] = mapped
+            if len(self._mapped) > MAX_MAPPED_FILES:
+                _, oldest = self._mapped.popitem(last=False)
+                oldest.close()
+        else:
+            self._mapped.move_to_end(key)
+        try:
+            # mtime doubles as last use for disk trimming
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return mapped[:]
+
+    # -------------------------------------------------------------------------
+    # Store
+    # -------------------------------------------------------------------------
+    def put(self, key: str, audio: bytes):
+        if not self.enabled or not audio:
+            return
+        self._remember(key, audio)
+        self._write_disk(key, audio)
+        self.stores += 1
+
+    def _remember(self, key: str, audio: bytes):
+        if len(audio) > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_used -= len(previous)
+        self._memory[key] = audio
+        self._memory_used += len(audio)
+        while self._memory_used > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= len(evicted)
+            self.evictions += 1
+
+    def _write_disk(self, key: str, audio: bytes):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if self._disk_used is None:
+                self._disk_used = sum(
+                    e.stat().st_size for e in os.scandir(self.cache_dir) if e.name.endswith(".ulaw")
+                )
+            existed = os.path.exists(path)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+            if not existed:
+                self._disk_used += len(audio)
+                self._trim_disk()
+        except OSError as e:
+            # memory tier still has it
+            logger.warning(f"⚠️ Could not write TTS cache entry: {e}")
+
+    def _trim_disk(self):
+        if self._disk_used <= self.disk_bytes:
+            return
+        entries = sorted(
+            (e for e in os.scandir(self.cache_dir) if e.name.endswith(".ulaw")),
+            key=lambda e: e.stat().st_mtime,
+        )
+        for entry in entries:
+            if self._disk_used <= self.disk_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._disk_used -= size
+            mapped = self._mapped.pop(entry.name[:-len(".ulaw")], None)
+            if mapped is not None:
+                mapped.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._memory),
+            "memory_bytes": self._memory_used,
+            "disk_bytes": self._disk_used,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else None,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "prewarmed": self.prewarmed,
+        }
+
+
+tts_audio_cache = TTSAudioCache()
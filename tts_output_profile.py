@@ -0,0 +1,70 @@
+"""
+TTS Output Profiles
+Audio format requested from Sarvam TTS, and the cheapest path from each format to Twilio μ-law 8k
+"""
+import logging
+from typing import Any, Dict, Optional, Set
+
+from audio_processor import AudioProcessor, AudioStreamContext
+
+logger = logging.getLogger(__name__)
+
+# profile -> output fields of the TTS config message
+PROFILES: Dict[str, Dict[str, Any]] = {
+    # already Twilio's format: base64 decode only
+    "mulaw8k": {"output_audio_codec": "mulaw", "speech_sample_rate": 8000},
+    # headerless PCM at 8k: μ-law encode only
+    "pcm8k": {"output_audio_codec": "linear16", "speech_sample_rate": 8000},
+    # WAV at the model's rate: parse + resample + encode (the original path)
+    "wav": {"output_audio_codec": "wav", "output_audio_bitrate": "32k"},
+}
+
+FALLBACK_PROFILE = "wav"
+
+# payload bytes per ms of audio, for formats without a header
+BYTES_PER_MS = {"mulaw8k": 8, "pcm8k": 16}
+
+# profiles Sarvam rejected in this process; later connections skip them
+_rejected: Set[str] = set()
+
+
+def choose_profile(requested: str) -> str:
+    if requested not in PROFILES:
+        logger.warning(f"⚠️ Unknown TTS output profile {requested!r}, using {FALLBACK_PROFILE}")
+        return FALLBACK_PROFILE
+    return FALLBACK_PROFILE if requested in _rejected else requested
+
+
+def reject_profile(profile: str):
+    if profile != FALLBACK_PROFILE:
+        _rejected.add(profile)
+
+
+def audio_kind(raw: bytes, content_type: Optional[str], profile: str) -> str:
+    """
+    Format of one audio chunk
+
+    A RIFF header or a WAV content type always wins, so a server that
+    ignores the requested codec still decodes correctly.
+    """
+    if raw[:4] == b"RIFF":
+        return "wav"
+    content_type = (content_type or "").lower()
+    if "wav" in content_type:
+        return "wav"
+    if "mulaw" in content_type or "ulaw" in content_type or "basic" in content_type:
+        return "mulaw8k"
+    if "l16" in content_type or "pcm" in content_type or "linear16" in content_type:
+        return "pcm8k"
+    return profile
+
+
+def to_mulaw_8k(raw: bytes, kind: str, context: AudioStreamContext) -> bytes:
+    """Skip whatever stages the chunk's format doesn't need"""
+    if kind == "mulaw8k":
+        return raw
+    if kind == "pcm8k":
+        return context.pcm16_to_mulaw_8k(raw, from_rate=8000)
+    pcm_data, sample_rate = AudioProcessor.wav_to_pcm(raw)
+    # continues the resampler filter from the previous chunk
+    return context.pcm16_to_mulaw_8k(pcm_data, from_rate=sample_rate)
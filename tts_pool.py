@@ -0,0 +1,265 @@
+"""
+TTS Connection Pool
+Pre-connected, pre-configured Sarvam TTS websockets handed out at call start
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from config import Config
+from latency_stats import percentile
+from sarvam_synthesizer import SarvamSynthesizer
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str, str]  # (model, voice, language)
+
+
+class TTSConnectionPool:
+    """
+    Idle synthesizers per (model, voice, language), connected and configured
+
+    An idle connection has only its heartbeat running. checkout() hands out
+    the most recently used healthy one (or connects inline on a miss);
+    release() takes back a call's connection if it is idle, young enough and
+    the pool is below target, and closes it otherwise.
+
+    The idle target per key follows demand: checkouts over the last
+    rate_window_sec, scaled to refill_horizon_sec (roughly the number of
+    calls that arrive while a replacement connects), clamped to
+    [min_idle, max_idle]. A background task tops keys up to target,
+    replaces connections past max_age_sec and closes surplus ones.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = Config.TTS_POOL_ENABLED,
+        min_idle: int = Config.TTS_POOL_MIN_IDLE,
+        max_idle: int = Config.TTS_POOL_MAX_IDLE,
+        max_age_sec: float = Config.TTS_POOL_MAX_AGE_SEC,
+        refill_horizon_sec: float = Config.TTS_POOL_REFILL_HORIZON_SEC,
+        rate_window_sec: float = 60.0,
+        maintain_interval_sec: float = 1.0,
+    ):
+        self.enabled = enabled
+        self.min_idle = min_idle
+        self.max_idle = max(min_idle, max_idle)
+        self.max_age_sec = max_age_sec
+        self.refill_horizon_sec = refill_horizon_sec
+        self.rate_window_sec = rate_window_sec
+        self.maintain_interval_sec = maintain_interval_sec
+
+        # oldest first; checkout takes from the end
+        self._idle: Dict[PoolKey, List[SarvamSynthesizer]] = {}
+        self._connecting: Dict[PoolKey, int] = {}
+        # (consecutive failures, monotonic time of next attempt)
+        self._backoff: Dict[PoolKey, Tuple[int, float]] = {}
+        self._checkout_times: Dict[PoolKey, Deque[float]] = {}
+        self._wake = asyncio.Event()
+        self._maintainer: Optional[asyncio.Task] = None
+        self._closing: set = set()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.returned = 0
+        self.discarded = 0
+        self.expired = 0
+        self.connect_failures = 0
+        self.checkout_wait_ms: Deque[float] = deque(maxlen=500)
+        self.age_at_checkout_sec: Deque[float] = deque(maxlen=500)
+
+    @staticmethod
+    def key(
+        model: str = Config.SYNTHESIZER_MODEL,
+        voice: str = Config.SYNTHESIZER_VOICE,
+        language: str = Config.SYNTHESIZER_LANGUAGE,
+    ) -> PoolKey:
+        return (model, voice, language)
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    async def start(self):
+        if not self.enabled:
+            return
+        # default voice is warmed before the first call
+        self._idle.setdefault(self.key(), [])
+        self._wake.set()
+        self._maintainer = asyncio.create_task(self._maintain())
+        logger.info("✅ TTS connection pool started")
+
+    async def close(self):
+        if self._maintainer and not self._maintainer.done():
+            self._maintainer.cancel()
+            try:
+                await self._maintainer
+            except asyncio.CancelledError:
+                pass
+        for idle in self._idle.values():
+            for synthesizer in idle:
+                await synthesizer.stop()
+            idle.clear()
+
+    # -------------------------------------------------------------------------
+    # Checkout / return
+    # -------------------------------------------------------------------------
+    def target(self, key: PoolKey) -> int:
+        times = self._checkout_times.get(key)
+        if not times:
+            return self.min_idle
+        horizon = time.monotonic() - self.rate_window_sec
+        while times and times[0] < horizon:
+            times.popleft()
+        expected = len(times) / self.rate_window_sec * self.refill_horizon_sec
+        return max(self.min_idle, min(self.max_idle, math.ceil(expected)))
+
+    async def checkout(
+        self,
+        model: str = Config.SYNTHESIZER_MODEL,
+        voice: str = Config.SYNTHESIZER_VOICE,
+        language: str = Config.SYNTHESIZER_LANGUAGE,
+    ) -> SarvamSynthesizer:
+        """A connected synthesizer for one call; start() it to begin streaming"""
+        started = time.perf_counter()
+        key = self.key(model, voice, language)
+        synthesizer = None
+
+        if self.enabled:
+            self._checkout_times.setdefault(key, deque()).append(time.monotonic())
+            idle = self._idle.setdefault(key, [])
+            while idle:
+                candidate = idle.pop()
+                if candidate.is_open and candidate.age_sec < self.max_age_sec:
+                    synthesizer = candidate
+                    break
+                self.expired += 1
+                self._close_later(candidate)
+            # refill behind this checkout
+            self._wake.set()
+
+        if synthesizer is not None:
+            self.hits += 1
+            self.age_at_checkout_sec.append(round(synthesizer.age_sec, 1))
+        else:
+            self.misses += 1
+            synthesizer = SarvamSynthesizer(model=model, voice=voice, language=language)
+            if not await synthesizer.connect():
+                raise ConnectionError("Failed to connect to Sarvam TTS")
+
+        self.checkout_wait_ms.append(round((time.perf_counter() - started) * 1000, 1))
+        return synthesizer
+
+    async def release(self, synthesizer: SarvamSynthesizer):
+        """Take back a call's synthesizer (stopping it either way)"""
+        if not self.enabled:
+            await synthesizer.stop()
+            return
+
+        fresh = await synthesizer.detach()
+        if fresh is None:
+            self.discarded += 1
+            return
+
+        key = self.key(fresh.model, fresh.voice, fresh.language)
+        idle = self._idle.setdefault(key, [])
+        if fresh.age_sec >= self.max_age_sec or len(idle) >= self.target(key):
+            self.discarded += 1
+            await fresh.stop()
+            return
+
+        fresh.start_heartbeat()
+        idle.append(fresh)
+        self.returned += 1
+
+    # -------------------------------------------------------------------------
+    # Background upkeep
+    # -------------------------------------------------------------------------
+    def _close_later(self, synthesizer: SarvamSynthesizer):
+        task = asyncio.create_task(synthesizer.stop())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _open(self, key: PoolKey):
+        model, voice, language = key
+        self._connecting[key] = self._connecting.get(key, 0) + 1
+        try:
+            synthesizer = SarvamSynthesizer(model=model, voice=voice, language=language)
+            if await synthesizer.connect(retries=1):
+                synthesizer.start_heartbeat()
+                self._idle.setdefault(key, []).append(synthesizer)
+                self._backoff.pop(key, None)
+            else:
+                self.connect_failures += 1
+                failures = self._backoff.get(key, (0, 0.0))[0] + 1
+                self._backoff[key] = (failures, time.monotonic() + min(30.0, 2.0 ** failures))
+        finally:
+            self._connecting[key] -= 1
+
+    async def _maintain(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.maintain_interval_sec)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                opens = []
+                for key, idle in self._idle.items():
+                    healthy = []
+                    for synthesizer in idle:
+                        if synthesizer.is_open and synthesizer.age_sec < self.max_age_sec:
+                            healthy.append(synthesizer)
+                        else:
+                            self.expired += 1
+                            self._close_later(synthesizer)
+                    idle[:] = healthy
+
+                    target = self.target(key)
+                    while len(idle) > target:
+                        self._close_later(idle.pop(0))
+                    if self._backoff.get(key, (0, 0.0))[1] > time.monotonic():
+                        continue
+                    missing = target - len(idle) - self._connecting.get(key, 0)
+                    opens.extend(self._open(key) for _ in range(max(0, missing)))
+
+                if opens:
+                    await asyncio.gather(*opens, return_exceptions=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ TTS pool upkeep error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        checkouts = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "keys": {
+                "/".join(key): {
+                    "idle": len(idle),
+                    "target": self.target(key),
+                    "connecting": self._connecting.get(key, 0),
+                    "oldest_idle_sec": round(max(s.age_sec for s in idle), 1) if idle else None,
+                }
+                for key, idle in self._idle.items()
+            },
+            "checkouts": checkouts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / checkouts, 3) if checkouts else None,
+            "returned": self.returned,
+            "discarded": self.discarded,
+            "expired": self.expired,
+            "connect_failures": self.connect_failures,
+            "checkout_wait_p50_ms": percentile(self.checkout_wait_ms, 50),
+            "checkout_wait_p95_ms": percentile(self.checkout_wait_ms, 95),
+            "age_at_checkout_p50_sec": percentile(self.age_at_checkout_sec, 50),
+            "age_at_checkout_max_sec": max(self.age_at_checkout_sec) if self.age_at_checkout_sec else None,
+        }
+
+
+tts_pool = TTSConnectionPool()
@@ -0,0 +1,69 @@
+"""
+Speculative Turns
+LLM generation started at END_SPEECH, released only once the final transcript agrees
+"""
+import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+
+def normalize_transcript(text: str) -> str:
+    """Case, punctuation and spacing differences don't count as a mismatch"""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+class SpeculativeTurn:
+    """
+    One LLM turn generated ahead of the final transcript
+
+    The generating task puts clauses in held instead of sending them to TTS
+    until confirm() is called, so nothing is heard if the guess was wrong.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.started_at = time.perf_counter()
+        self.held: List[str] = []
+        self.confirmed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def matches(self, final_text: str) -> bool:
+        return normalize_transcript(self.text) == normalize_transcript(final_text)
+
+    def confirm(self) -> int:
+        """Release the turn; returns how far ahead of the final transcript it started"""
+        self.confirmed.set()
+        return round((time.perf_counter() - self.started_at) * 1000)
+
+    def cancel(self):
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+
+class SpeculationStats:
+    """Per-call hit rate and head start of speculative turns"""
+
+    def __init__(self):
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms: List[int] = []
+
+    def record_hit(self, saved_ms: int):
+        self.hits += 1
+        self.saved_ms.append(saved_ms)
+
+    def record_miss(self):
+        self.misses += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        resolved = self.hits + self.misses
+        return {
+            "speculations": self.started,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / resolved, 3) if resolved else None,
+            "saved_ms_total": sum(self.saved_ms),
+            "avg_saved_ms": round(sum(self.saved_ms) / len(self.saved_ms)) if self.saved_ms else None,
+        }
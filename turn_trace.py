@@ -0,0 +1,139 @@
+"""
+Turn Latency Tracing
+Per-turn timestamps across STT, LLM, TTS and Twilio, exported as structured logs and percentiles
+"""
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from config import Config
+from latency_stats import percentile
+
+logger = logging.getLogger(__name__)
+# one JSON object per turn; route this logger to its own sink if needed
+trace_logger = logging.getLogger("turn_trace")
+
+# in pipeline order
+MARKS = (
+    "speech_end",
+    "final_transcript",
+    "llm_request",
+    "llm_first_token",
+    "llm_last_token",
+    "tts_text_sent",
+    "tts_first_audio",
+    "twilio_first_frame",
+)
+
+# name -> (from mark, to mark)
+STAGES: Dict[str, Tuple[str, str]] = {
+    "stt_final_ms": ("speech_end", "final_transcript"),
+    "llm_first_token_ms": ("llm_request", "llm_first_token"),
+    "llm_total_ms": ("llm_request", "llm_last_token"),
+    "tts_first_audio_ms": ("tts_text_sent", "tts_first_audio"),
+    "playout_ms": ("tts_first_audio", "twilio_first_frame"),
+    "transcript_to_audio_ms": ("final_transcript", "twilio_first_frame"),
+    "end_to_end_ms": ("speech_end", "twilio_first_frame"),
+}
+
+# marks made by outbound audio, which may still belong to the previous reply
+AUDIO_MARKS = ("tts_first_audio", "twilio_first_frame")
+
+
+class TurnTrace:
+    """
+    Monotonic timestamps for one user turn
+
+    Each mark keeps its first occurrence (first clause sent, first audio
+    chunk, ...). The trace is done once both the first Twilio frame and the
+    last LLM token are in, since either can come last.
+
+    Marks can carry the synthesizer epoch they belong to. The first
+    tts_text_sent fixes the turn's epoch; audio marks from any other epoch
+    (a barged-in reply still draining) or from before the turn's text went
+    out are ignored.
+    """
+
+    def __init__(self, call_sid: str, turn: int):
+        self.call_sid = call_sid
+        self.turn = turn
+        self.created_at = time.time()
+        self.marks: Dict[str, float] = {}
+        self.epoch: Optional[int] = None
+        self.stale_marks = 0
+        self.exported = False
+
+    def mark(self, name: str, at: Optional[float] = None, epoch: Optional[int] = None):
+        if epoch is not None:
+            if name == "tts_text_sent" and self.epoch is None:
+                self.epoch = epoch
+            elif name in AUDIO_MARKS and epoch != self.epoch:
+                self.stale_marks += 1
+                return
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() if at is None else at
+
+    def clear(self, *names: str):
+        for name in names:
+            self.marks.pop(name, None)
+
+    @property
+    def complete(self) -> bool:
+        return "twilio_first_frame" in self.marks and "llm_last_token" in self.marks
+
+    def stages(self) -> Dict[str, int]:
+        out = {}
+        for stage, (start, end) in STAGES.items():
+            if start in self.marks and end in self.marks:
+                out[stage] = round((self.marks[end] - self.marks[start]) * 1000)
+        return out
+
+    def to_record(self) -> Dict[str, Any]:
+        origin = min(self.marks.values()) if self.marks else 0.0
+        return {
+            "call_sid": self.call_sid,
+            "turn": self.turn,
+            "timestamp": self.created_at,
+            "complete": self.complete,
+            "stale_marks": self.stale_marks,
+            # offsets from the earliest mark, in pipeline order
+            "marks_ms": {
+                name: round((self.marks[name] - origin) * 1000)
+                for name in MARKS if name in self.marks
+            },
+            **self.stages(),
+        }
+
+
+class TurnTraceRecorder:
+    """Process-wide sink: structured log per turn + rolling window for percentiles"""
+
+    def __init__(self, window: int = Config.TURN_TRACE_WINDOW):
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=window)
+        self.exported = 0
+
+    def export(self, trace: TurnTrace):
+        if trace.exported or not trace.marks:
+            return
+        trace.exported = True
+        record = trace.to_record()
+        self.records.append(record)
+        self.exported += 1
+        trace_logger.info(json.dumps(record))
+
+    def get_percentiles(self) -> Dict[str, Any]:
+        stages = {}
+        for stage in STAGES:
+            values = [r[stage] for r in self.records if stage in r]
+            stages[stage] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p90": percentile(values, 90),
+                "p99": percentile(values, 99),
+            }
+        return {"turns": len(self.records), "exported_total": self.exported, "stages": stages}
+
+
+turn_trace_recorder = TurnTraceRecorder()
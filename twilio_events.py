@@ -0,0 +1,48 @@
+"""
+Twilio Inbound Event Parsing
+Fast path for the 50/s media events on a Media Stream, general parser for the rest
+"""
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import orjson  # optional, faster parser for control events
+
+    def loads(message: str) -> Dict[str, Any]:
+        return orjson.loads(message)
+except ImportError:
+    loads = json.loads
+
+_MEDIA_EVENT = '"event":"media"'
+_PAYLOAD_KEY = '"payload":"'
+
+
+def media_payload(message: str) -> Optional[str]:
+    """
+    Base64 payload of a media event, or None if message is anything else
+
+    Twilio serializes media events compactly, e.g.
+
+        {"event":"media","sequenceNumber":"4","media":{"track":"inbound",
+         "chunk":"2","timestamp":"5","payload":"<base64>"},"streamSid":"MZ..."}
+
+    so the payload can be sliced out with two substring searches instead of
+    building the whole dict. Base64 never contains quotes or backslashes;
+    anything unexpected returns None and goes through the general parser.
+    """
+    if _MEDIA_EVENT not in message:
+        return None
+
+    start = message.find(_PAYLOAD_KEY)
+    if start < 0:
+        return None
+    start += len(_PAYLOAD_KEY)
+
+    end = message.find('"', start)
+    if end < 0:
+        return None
+
+    payload = message[start:end]
+    if "\\" in payload:
+        return None
+    return payload
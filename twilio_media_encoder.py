@@ -0,0 +1,43 @@
+"""
+Twilio Media Encoding
+Pre-built JSON framing for outbound Twilio Media Stream messages
+"""
+import binascii
+import json
+
+
+def _dumps(message: dict) -> str:
+    # same separators Starlette's send_json uses, so the wire format is unchanged
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class TwilioMediaEncoder:
+    """
+    Builds outbound Twilio messages for one stream without a per-frame json.dumps
+
+    Everything but the base64 payload is constant for a stream, so the JSON
+    is serialized once into a prefix and suffix. Output is identical to what
+    websocket.send_json produced for:
+
+        {"event": "media", "streamSid": "<sid>", "media": {"payload": "<base64 μ-law>"}}
+    """
+
+    def __init__(self, stream_sid: str):
+        self.stream_sid = stream_sid
+
+        marker = "__media_payload__"
+        template = _dumps(
+            {
+                "event": "media",
+                "streamSid": stream_sid,
+                "media": {"payload": marker},
+            }
+        )
+        self._prefix, self._suffix = template.split(marker)
+
+        self.clear_message = _dumps({"event": "clear", "streamSid": stream_sid})
+
+    def encode(self, mulaw_data) -> str:
+        """Complete media text message for one or more 20ms μ-law frames"""
+        payload = binascii.b2a_base64(mulaw_data, newline=False).decode("ascii")
+        return f"{self._prefix}{payload}{self._suffix}"
@@ -5,8 +5,7 @@ Manages conversation flow, interruption handling, and component integration
 import asyncio
 import logging
 import time
-from typing import Optional, Dict, Any, List
-from openai import AsyncAzureOpenAI
+from typing import Optional, Dict, Any, List, Tuple
 
 import asyncio
 import json
@@ -17,7 +16,18 @@ import logging
 from config import Config, SYSTEM_PROMPT
 from sarvam_transcriber import SarvamTranscriber
 from sarvam_synthesizer import SarvamSynthesizer
+from tts_pool import tts_pool
+from stt_pool import stt_pool
 from audio_processor import AudioProcessor
+from playout_scheduler import PlayoutScheduler
+from twilio_media_encoder import TwilioMediaEncoder
+from clause_segmenter import ClauseSegmenter
+from llm_client import llm_client_manager
+from llm_hedging import llm_hedger
+from conversation_context import ConversationContext, count_tokens
+from document_brief import document_brief_cache
+from turn_speculation import SpeculativeTurn, SpeculationStats
+from turn_trace import TurnTrace, turn_trace_recorder
 
 from hiring_workflow import (
     get_hiring_system_prompt,
@@ -34,6 +44,19 @@ from sales_workflow import (
 
 logger = logging.getLogger(__name__)
 
+HIRING_CLOSING = "Thank you, an HR representative will contact you soon."
+SALES_CLOSING = "Thank you for your time! I will send you the details shortly."
+DEFAULT_GREETING = "Namaste! Main AI assistant bol rahi hoon."
+GOODBYE = "धन्यवाद! AurJobs AI से बात करने के लिए शुक्रिया। हम जल्द ही आपसे संपर्क करेंगे। अच्छा दिन रहे!"
+
+# spoken verbatim on many calls; synthesized into the TTS cache at startup
+PREWARM_PHRASES = [
+    HIRING_CLOSING,
+    SALES_CLOSING,
+    DEFAULT_GREETING,
+    GOODBYE,
+]
+
 
 class VoiceAgent:
     """
@@ -59,9 +82,12 @@ class VoiceAgent:
         self.call_sid = call_sid
         self.stream_sid = stream_sid
         self.ws = websocket
+        self.media_encoder = TwilioMediaEncoder(stream_sid)
         
         # Conversation state
         self.conversation: List[Dict[str, str]] = []
+        # what is actually sent to the LLM: recent turns + rolling summary
+        self.context = ConversationContext(self.conversation)
         # self.questions_asked = 0
         # self.question_number = 0
         self.max_questions = Config.MAX_QUESTIONS
@@ -69,16 +95,15 @@ class VoiceAgent:
         # Component initialization
         self.transcriber: Optional[SarvamTranscriber] = None
         self.synthesizer: Optional[SarvamSynthesizer] = None
+        self.synthesizer_released = False
         self.audio_processor = AudioProcessor()
+        # paces outbound audio as exact 20ms frames on a monotonic clock
+        self.playout = PlayoutScheduler(self._stream_audio_to_twilio)
         
         self.workflow_run_id = workflow_data.get("workflow_run_id")
         
-        # LLM client
-        self.openai_client = AsyncAzureOpenAI(
-            api_key=Config.AZURE_OPENAI_API_KEY,
-            api_version=Config.AZURE_OPENAI_VERSION,
-            azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
-        )
+        # LLM turns go through the shared, pooled client (llm_hedger)
+        self.llm_turns = 0
         
         # State flags
         self.is_speaking = False
@@ -89,11 +114,21 @@ class VoiceAgent:
         # Tasks
         self.transcription_handler_task: Optional[asyncio.Task] = None
         self.synthesis_handler_task: Optional[asyncio.Task] = None
+        self.playout_task: Optional[asyncio.Task] = None
         
         # Performance tracking
         self.call_start_time = time.time()
         self.total_transcripts = 0
         self.total_responses = 0
+        # time from final transcript to first TTS audio, per LLM turn
+        self._turn_started_at: Optional[float] = None
+        self._turn_mode = "buffered"
+        self.first_audio_latencies_ms: List[Dict[str, Any]] = []
+        # (audio, epoch) of a streamed reply's first clause, held until the
+        # clause is known not to be the hangup line (None: audio plays as it
+        # arrives)
+        self._reply_gate: Optional[List[Tuple[bytes, int]]] = None
+        self._reply_clauses = 0
         
         # Auto-hangup / idle detection
         self.last_activity = time.time()  # last time user or assistant spoke
@@ -112,6 +147,11 @@ class VoiceAgent:
         self.candidate_name = workflow_data.get("candidate_name", "Candidate")
         self.workflow_run_id = workflow_data.get("workflow_run_id")
         
+        # system prompt is compiled once per call (resume/JD condensed)
+        self.system_prompt: Optional[str] = None
+        self.prompt_task: Optional[asyncio.Task] = None
+        self.prompt_stats: Dict[str, Any] = {}
+        
         self.transcript = []          # for final transcript
         self.chat_id = workflow_data.get("chat_id")
         
@@ -120,6 +160,15 @@ class VoiceAgent:
         self.user_speaking = False
         self.response_task: Optional[asyncio.Task] = None
 
+        # Speculative turns: LLM starts at END_SPEECH on the text heard so far
+        self.utterance_text = ""
+        self.speculation: Optional[SpeculativeTurn] = None
+        self.speculation_stats = SpeculationStats()
+
+        # latency trace of the current user turn
+        self.turn_trace: Optional[TurnTrace] = None
+        self.traced_turns = 0
+
         logger.info(f"workflow_data-----------------------------: {self.workflow_data}")
 
         logger.info(f"🎬 Agent initialized for call {call_sid}")
@@ -129,12 +178,12 @@ class VoiceAgent:
         self.last_turn_id = None
         self.last_response_time = 0
 
-    def _load_system_prompt(self):
+    def _build_system_prompt(self, resume_text: str, jd_text: str) -> str:
         if self.workflow_type == "hiring":
             return get_hiring_system_prompt(
                 self.candidate_name,
-                self.resume_text,
-                self.jd_text
+                resume_text,
+                jd_text
             )
 
         if self.workflow_type == "sales":
@@ -145,23 +194,63 @@ class VoiceAgent:
 
         return "You are a helpful assistant."
 
+    def _load_system_prompt(self) -> str:
+        if self.system_prompt is not None:
+            return self.system_prompt
+        return self._build_system_prompt(self.resume_text, self.jd_text)
+
+    async def _compile_system_prompt(self):
+        """Build this call's system prompt once, with resume and JD condensed"""
+        raw_prompt = self._build_system_prompt(self.resume_text, self.jd_text)
+        resume_text, jd_text = self.resume_text, self.jd_text
+        try:
+            if self.workflow_type == "hiring" and Config.PROMPT_BRIEF_ENABLED:
+                resume_text, jd_text = await asyncio.gather(
+                    document_brief_cache.get_brief("resume", self.resume_text),
+                    document_brief_cache.get_brief("job_description", self.jd_text),
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Prompt condensation error, using full documents: {e}")
+            resume_text, jd_text = self.resume_text, self.jd_text
+
+        self.system_prompt = self._build_system_prompt(resume_text, jd_text)
+
+        raw_tokens = count_tokens(raw_prompt)
+        compiled_tokens = count_tokens(self.system_prompt)
+        self.prompt_stats = {
+            "raw_tokens": raw_tokens,
+            "compiled_tokens": compiled_tokens,
+            "reduction_pct": round((1 - compiled_tokens / raw_tokens) * 100, 1) if raw_tokens else 0.0,
+        }
+        logger.info(
+            f"🧾 System prompt compiled: {raw_tokens} → {compiled_tokens} tokens "
+            f"({self.prompt_stats['reduction_pct']}% smaller)"
+        )
+
 
     async def initialize(self):
         """Initialize transcriber and synthesizer"""
         try:
             # Initialize transcriber
             self.transcriber = SarvamTranscriber()
+            # warm socket when the pool has one; connects inline otherwise
+            await stt_pool.acquire(self.transcriber)
             await self.transcriber.start()
             logger.info("✅ Transcriber initialized")
             
             # Initialize synthesizer
-            self.synthesizer = SarvamSynthesizer()
+            # pre-connected when the pool has one for this voice
+            self.synthesizer = await tts_pool.checkout()
+            self.synthesizer.on_text_sent = lambda epoch: self._trace_mark("tts_text_sent", epoch=epoch)
             await self.synthesizer.start()
             logger.info("✅ Synthesizer initialized")
             
             # Start handlers
             self.transcription_handler_task = asyncio.create_task(self._handle_transcriptions())
             self.synthesis_handler_task = asyncio.create_task(self._handle_synthesis())
+            self.playout_task = asyncio.create_task(self.playout.run())
+            # condensation runs while the greeting plays
+            self.prompt_task = asyncio.create_task(self._compile_system_prompt())
             self.idle_task = asyncio.create_task(self._monitor_idle_timeout())
             
             logger.info("✅ Agent fully initialized")
@@ -198,13 +287,17 @@ class VoiceAgent:
                     if not text:
                         continue
                     
-                    # Log partials but only process finals
+                    # Log partials but only process finals; an interim
+                    # transcript (early flush) can start a speculative turn
                     if not is_final:
                         logger.debug(f"🎤 (partial) {text}")
+                        self.utterance_text = text
+                        self._start_speculation()
                         continue
                     
                     logger.info(f"📝 User: {text}")
                     self.total_transcripts += 1
+                    self._trace_final_transcript(event.get("speech_end_to_final_ms"))
                     self.user_is_speaking = False
                     
                     # Update activity timestamp
@@ -225,6 +318,11 @@ class VoiceAgent:
                         continue
                     
                     
+                    self.utterance_text = ""
+                    if self.awaiting_response and self._resolve_speculation(text):
+                        self.awaiting_response = False
+                        continue
+
                     if self.awaiting_response:
                         self.awaiting_response = False
                          # 🔥 Cancel older response task if exists
@@ -240,42 +338,150 @@ class VoiceAgent:
                     if signal == "START_SPEECH":
                         self.user_is_speaking = True
                         logger.debug("🎤 Speech detected")
+                        # user kept talking: the speculated text is incomplete
+                        if self.speculation:
+                            self._resolve_speculation(None)
                     
                     elif signal == "END_SPEECH":
                         self.user_is_speaking = False
                         logger.debug("🔇 Speech ended")
+                        self._trace_speech_end()
+                        self._start_speculation()
                         
         except Exception as e:
             logger.error(f"❌ Transcription handler error: {e}")
     
+    # -------------------------------------------------------------------------
+    # Turn latency tracing
+    # -------------------------------------------------------------------------
+    def _begin_turn_trace(self):
+        if self.turn_trace:
+            turn_trace_recorder.export(self.turn_trace)
+        self.traced_turns += 1
+        self.turn_trace = TurnTrace(self.call_sid, self.traced_turns)
+
+    def _trace_mark(self, name: str, at: Optional[float] = None, epoch: Optional[int] = None):
+        trace = self.turn_trace
+        if trace is None or trace.exported:
+            return
+        trace.mark(name, at, epoch)
+        if trace.complete:
+            turn_trace_recorder.export(trace)
+
+    def _trace_speech_end(self):
+        trace = self.turn_trace
+        if trace and not trace.exported and "final_transcript" not in trace.marks:
+            # the user paused and went on: the turn ends at the later END_SPEECH
+            trace.marks["speech_end"] = time.perf_counter()
+            return
+        self._begin_turn_trace()
+        self._trace_mark("speech_end")
+
+    def _trace_final_transcript(self, speech_end_to_final_ms: Optional[int]):
+        trace = self.turn_trace
+        if trace is None or trace.exported or "final_transcript" in trace.marks:
+            # no END_SPEECH for this utterance
+            self._begin_turn_trace()
+        if speech_end_to_final_ms is not None:
+            # local energy-drop estimate, used when Sarvam sent no END_SPEECH
+            self._trace_mark("speech_end", time.perf_counter() - speech_end_to_final_ms / 1000)
+        self._trace_mark("final_transcript")
+
+    def _start_speculation(self):
+        """Begin the LLM turn on the latest interim transcript (before the final)"""
+        if not (Config.LLM_SPECULATIVE and self.awaiting_response and self.utterance_text):
+            return
+        if self.speculation or (self.response_task and not self.response_task.done()):
+            return
+
+        speculation = SpeculativeTurn(self.utterance_text)
+        speculation.task = asyncio.create_task(self._generate_response(speculation))
+        self.speculation = speculation
+        self.response_task = speculation.task
+        self.speculation_stats.started += 1
+        logger.debug(f"🔮 Speculating on: {speculation.text}")
+
+    def _resolve_speculation(self, final_text: Optional[str]) -> bool:
+        """Confirm the pending speculation against final_text, or cancel it"""
+        speculation, self.speculation = self.speculation, None
+        if speculation is None:
+            return False
+
+        if final_text is not None and speculation.matches(final_text) and not speculation.task.done():
+            saved_ms = speculation.confirm()
+            self.speculation_stats.record_hit(saved_ms)
+            self._turn_started_at = time.perf_counter()
+            logger.info(f"🔮 Speculation hit, started {saved_ms}ms before the final transcript")
+            return True
+
+        speculation.cancel()
+        if self.response_task is speculation.task:
+            self.response_task = None
+        if self.turn_trace:
+            # the regenerated turn's LLM timings replace the guess's
+            self.turn_trace.clear("llm_request", "llm_first_token", "llm_last_token")
+        self.speculation_stats.record_miss()
+        logger.info("🔮 Speculation miss, regenerating")
+        return False
+
     async def _handle_synthesis(self):
-        """Stream synthesized audio to Twilio"""
+        """Hand synthesized audio to the playout scheduler (paced to Twilio)"""
         try: 
-            FRAME_DURATION = 0.02
             async for audio_chunk in self.synthesizer.audio_stream():
                 if self.conversation_ended:
                     break
-                
-                # Send to Twilio
-                await self._stream_audio_to_twilio(audio_chunk)
-                 # 🔴 CRITICAL: pace audio to prevent Twilio starvation
-                await asyncio.sleep(FRAME_DURATION)
 
-                
+                # tagged so marks from a barged-in reply can't land on the next turn
+                epoch = self.synthesizer.epoch
+                self._note_audio(epoch)
+                if self._reply_gate is not None:
+                    self._reply_gate.append((audio_chunk, epoch))
+                    continue
+                self.playout.enqueue(audio_chunk, epoch)
+
         except Exception as e:
             logger.error(f"❌ Synthesis handler error: {e}")
+
+    def _note_audio(self, epoch: int):
+        """First-audio latency and trace mark, taken when the synthesizer delivers"""
+        if self._turn_started_at is not None:
+            latency_ms = round((time.perf_counter() - self._turn_started_at) * 1000)
+            self._turn_started_at = None
+            self.first_audio_latencies_ms.append({"mode": self._turn_mode, "ms": latency_ms})
+            logger.info(f"⚡ Time to first audio: {latency_ms}ms ({self._turn_mode})")
+        self._trace_mark("tts_first_audio", epoch=epoch)
+
+    def _release_reply(self):
+        """Play a streamed reply's held audio; later chunks play as they arrive"""
+        held, self._reply_gate = self._reply_gate, None
+        for audio_chunk, epoch in held or ():
+            self.playout.enqueue(audio_chunk, epoch)
+
+    async def _discard_reply(self):
+        """Drop a streamed reply's audio, held and still to come (it ends the call)"""
+        if not self._reply_clauses:
+            return
+        self._reply_gate = None
+        self._reply_clauses = 0
+        self._turn_started_at = None
+        await self.synthesizer.interrupt()
     
     async def _handle_interruption(self):
         """Handle user interruption of bot speech"""
         try:
             self.is_speaking = False
-             # 🔥 CANCEL pending LLM response
-            if self.response_task and not self.response_task.done():
+            self._turn_started_at = None
+             # 🔥 CANCEL pending LLM response (a speculation answers the
+             # utterance that interrupted, so it is kept)
+            if self.speculation is None and self.response_task and not self.response_task.done():
                self.response_task.cancel()
                self.response_task = None
-            # Interrupt synthesizer
+            # Interrupt synthesizer and drop audio not yet sent
             if self.synthesizer:
                 await self.synthesizer.interrupt()
+            if self._reply_gate:
+                self._reply_gate.clear()
+            self.playout.clear()
             
             # Send clear command to Twilio to stop playback
             await self._send_twilio_clear()
@@ -306,8 +512,59 @@ class VoiceAgent:
             logger.error(f"❌ Idle monitor error: {e}")
     
    
-    async def _generate_response(self):
-        """Generate AI response using Azure OpenAI"""
+    def _turn_ends_workflow(self) -> bool:
+        """Whether the workflow may stop after this turn (the reply is replaced then)"""
+        next_question = self.question_number + 1
+        if self.workflow_type == "hiring":
+            return is_interview_finished(next_question)
+        if self.workflow_type == "sales":
+            # the reply itself can add a disinterest, reaching the threshold
+            return is_sales_workflow_complete(
+                next_question, self.workflow_data.get("disinterest_count", 0) + 1
+            )
+        return False
+
+    async def _speak_clause(self, clause: str, speculation: Optional[SpeculativeTurn] = None):
+        """Send one clause of a streaming reply to the synthesizer"""
+        if speculation and not speculation.confirmed.is_set():
+            speculation.held.append(clause)
+            return
+        if self._reply_clauses == 0:
+            # the first clause could be the whole hangup line: held until a
+            # second clause (or the end of the reply) shows it isn't
+            self._reply_gate = []
+        elif self._reply_clauses == 1:
+            self._release_reply()
+        self._reply_clauses += 1
+        self.is_speaking = True
+        self.last_activity = time.time()
+        await self.synthesizer.synthesize(clause, flush=False)
+        logger.debug(f"🔊 Clause: {clause[:50]}")
+
+    async def _confirm_speculation(self, speculation: SpeculativeTurn) -> bool:
+        """Wait for the final transcript, then release clauses held so far"""
+        try:
+            await asyncio.wait_for(speculation.confirmed.wait(), Config.LLM_SPECULATIVE_CONFIRM_SEC)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ No final transcript for speculative turn, discarding it")
+            if self.speculation is speculation:
+                self.speculation = None
+                self.speculation_stats.record_miss()
+            return False
+
+        for clause in speculation.held:
+            await self._speak_clause(clause)
+        speculation.held.clear()
+        return True
+
+    async def _generate_response(self, speculation: Optional[SpeculativeTurn] = None):
+        """
+        Generate AI response using Azure OpenAI
+
+        With a speculation the user's utterance is not in the conversation
+        yet; nothing is spoken or recorded until the final transcript
+        confirms it.
+        """
         # if self.questions_asked >= self.max_questions:
         #     await self.end_call()
         #     return
@@ -315,46 +572,80 @@ class VoiceAgent:
         try:
             logger.info("🤖 Generating response...")
             
+            if self.prompt_task and not self.prompt_task.done():
+                try:
+                    await asyncio.wait_for(asyncio.shield(self.prompt_task), Config.PROMPT_BRIEF_WAIT_SEC)
+                except asyncio.TimeoutError:
+                    logger.warning("⚠️ System prompt not compiled yet, using full documents this turn")
+
             # messages = [{"role": "system", "content": SYSTEM_PROMPT}] + self.conversation
-            messages = [
-                       {"role": "system", "content": self._load_system_prompt()}
-                     ] + self.conversation
+            pending = [{"role": "user", "content": speculation.text}] if speculation else None
+            messages = self.context.build_messages(self._load_system_prompt(), pending)
+            logger.debug(f"🧮 Prompt tokens: {self.context.prompt_tokens_per_turn[-1]}")
 
             
             # Stream response from OpenAI
             response_text = ""
-            
-            stream = await self.openai_client.chat.completions.create(
-                model=Config.AZURE_OPENAI_DEPLOYMENT,
-                messages=messages,
-                stream=True,
-                temperature=0.7,
-                max_tokens=150,
-            )
-            
-            async for chunk in stream:
-                if self.conversation_ended:
-                    break
 
-                # 🔐 Some chunks may have no choices (control / final chunks)
-                if not getattr(chunk, "choices", None):
-                    continue
-                if not chunk.choices:
-                    continue
-
-                delta = chunk.choices[0].delta
+            # Synthesize clauses as they arrive, unless this turn may be
+            # replaced by a closing line. Only the first clause's audio is
+            # held, since a HANGUP_NOW reply must not be heard; the rest
+            # plays as it is synthesized.
+            streaming = Config.LLM_STREAMING_TTS and not self._turn_ends_workflow()
+            self._reply_clauses = 0
+            segmenter = ClauseSegmenter() if streaming else None
+            clauses_sent = 0
+            self._turn_mode = "streaming" if streaming else "buffered"
+            if speculation:
+                self._turn_mode += "+speculative"
+            else:
+                self._turn_started_at = time.perf_counter()
+            first_turn = self.llm_turns == 0
+            self.llm_turns += 1
+            request_sent = time.perf_counter()
+            self._trace_mark("llm_request", request_sent)
+            
+            # first token deadline + backup request (see llm_hedging)
+            pieces = llm_hedger.stream(messages, temperature=0.7, max_tokens=150)
+            try:
+                async for content_piece in pieces:
+                    if self.conversation_ended:
+                        break
+
+                    if not response_text:
+                        self._trace_mark("llm_first_token")
+                        if first_turn:
+                            llm_client_manager.record_first_turn(
+                                round((time.perf_counter() - request_sent) * 1000)
+                            )
+                    response_text += content_piece
 
-                # Extra safety: delta itself can be None in weird cases
-                if not delta:
-                    continue
+                    if segmenter:
+                        # never speak the hangup token; the call ends below
+                        if "HANGUP_NOW" in response_text:
+                            break
+                        for clause in segmenter.feed(content_piece):
+                            await self._speak_clause(clause, speculation)
+                            clauses_sent += 1
+            finally:
+                await pieces.aclose()
+            self._trace_mark("llm_last_token")
+
+            # nothing below may happen for an unconfirmed guess
+            if speculation and not await self._confirm_speculation(speculation):
+                return
 
-                # Typical content field
-                content_piece = getattr(delta, "content", None)
-                if content_piece:
-                    response_text += content_piece
+            if segmenter:
+                tail = segmenter.flush()
+                if tail and "HANGUP_NOW" not in response_text:
+                    await self._speak_clause(tail)
+                    clauses_sent += 1
+                if clauses_sent:
+                    await self.synthesizer.flush()
             
             if not response_text:
                 logger.warning("⚠️ Empty response from LLM")
+                self._turn_started_at = None
                 return
             
             logger.info(f"💬 Assistant: {response_text}")
@@ -366,6 +657,7 @@ class VoiceAgent:
             # Check for hangup signal from LLM
             if "HANGUP_NOW" in response_text:
                 logger.info("🛑 LLM detected hangup intent, ending call")
+                await self._discard_reply()
                 await self.end_call()
                 return
             
@@ -379,7 +671,8 @@ class VoiceAgent:
             # Hiring interview ends automatically
             if self.workflow_type == "hiring" and is_interview_finished(self.question_number):
 
-                closing = "Thank you, an HR representative will contact you soon."
+                closing = HIRING_CLOSING
+                await self._discard_reply()
                 await self.speak(closing)
                 self.conversation.append({"role": "assistant", "content": closing})
                 await self.end_call()
@@ -394,14 +687,18 @@ class VoiceAgent:
                     self.workflow_data["disinterest_count"] = disinterest_count
 
                 if is_sales_workflow_complete(self.question_number, disinterest_count):
-                    closing = "Thank you for your time! I will send you the details shortly."
+                    closing = SALES_CLOSING
+                    await self._discard_reply()
                     await self.speak(closing)
                     self.conversation.append({"role": "assistant", "content": closing})
                     await self.end_call()
                     return
 
-            # Speak the response
-            await self.speak(response_text)
+            # Speak the response (already sent clause by clause when streaming)
+            if streaming:
+                self._release_reply()
+            else:
+                await self.speak(response_text, cache=False)
             
             # Wait for user response
             self.awaiting_response = True
@@ -410,14 +707,20 @@ class VoiceAgent:
             logger.error(f"❌ Response generation error: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            # failed or cancelled mid-reply: stop holding audio
+            self._reply_gate = None
+            self._reply_clauses = 0
        
 
-    async def speak(self, text: str):
+    async def speak(self, text: str, cache: bool = True):
         """
         Speak text via synthesizer
         
         Args:
             text: Text to speak
+            cache: Whether the TTS audio cache may serve/keep it (off for LLM
+                replies and text built per call, e.g. with a name)
         """
         try:
             self.is_speaking = True
@@ -426,7 +729,7 @@ class VoiceAgent:
             self.last_activity = time.time()
             
             # Send text to synthesizer
-            await self.synthesizer.synthesize(text, flush=True)
+            await self.synthesizer.synthesize(text, flush=True, cache=cache)
             
             logger.info(f"🔊 Speaking: {text[:50]}...")
             
@@ -440,7 +743,8 @@ class VoiceAgent:
 
         if self.workflow_type == "hiring":
             first_q = get_first_question(self.candidate_name)
-            await self.speak(first_q)
+            # per-candidate text (their name): never cached
+            await self.speak(first_q, cache=False)
             self.conversation.append({"role": "assistant", "content": first_q})
 
             # 🔥 REQUIRED
@@ -451,7 +755,7 @@ class VoiceAgent:
             first_q = get_sales_first_question(
                 self.workflow_data.get("company_name", "Our Company")
             )
-            await self.speak(first_q)
+            await self.speak(first_q, cache=False)
             self.conversation.append({"role": "assistant", "content": first_q})
 
             # 🔥 REQUIRED
@@ -459,7 +763,7 @@ class VoiceAgent:
             return
 
         # default behavior
-        greeting = "Namaste! Main AI assistant bol rahi hoon."
+        greeting = DEFAULT_GREETING
         await self.speak(greeting)
         self.conversation.append({"role": "assistant", "content": greeting})
 
@@ -472,7 +776,7 @@ class VoiceAgent:
         
         self.conversation_ended = True
         
-        goodbye = "धन्यवाद! AurJobs AI से बात करने के लिए शुक्रिया। हम जल्द ही आपसे संपर्क करेंगे। अच्छा दिन रहे!"
+        goodbye = GOODBYE
         
         # Speak goodbye
         await self.speak(goodbye)
@@ -494,33 +798,15 @@ class VoiceAgent:
             audio_data: μ-law 8kHz audio bytes
         """
         try:
-            import base64
-            
-            # Encode to base64
-            audio_b64 = base64.b64encode(audio_data).decode('utf-8')
-            
-            # Send media message to Twilio
-            message = {
-                "event": "media",
-                "streamSid": self.stream_sid,
-                "media": {
-                    "payload": audio_b64
-                }
-            }
-            
-            await self.ws.send_json(message)
-            
+            await self.ws.send_text(self.media_encoder.encode(audio_data))
+            self._trace_mark("twilio_first_frame", epoch=self.playout.frame_tag)
         except Exception as e:
             logger.error(f"❌ Twilio stream error: {e}")
     
     async def _send_twilio_clear(self):
         """Send clear command to Twilio to stop current audio playback"""
         try:
-            message = {
-                "event": "clear",
-                "streamSid": self.stream_sid
-            }
-            await self.ws.send_json(message)
+            await self.ws.send_text(self.media_encoder.clear_message)
             logger.debug("📤 Clear command sent to Twilio")
         except Exception as e:
             logger.error(f"❌ Clear command error: {e}")
@@ -538,7 +824,39 @@ class VoiceAgent:
         except Exception as e:
             logger.error(f"❌ Hangup error: {e}")
 
+    def get_playout_stats(self) -> Dict[str, Any]:
+        """Outbound pacing counters (jitter, underruns) for this call"""
+        return self.playout.get_stats()
+
     async def cleanup(self):
+        # stop pacing outbound audio; nothing more will be sent
+        self.playout.close()
+        self.context.close()
+        if self.speculation:
+            self.speculation.cancel()
+        if self.prompt_task and not self.prompt_task.done():
+            self.prompt_task.cancel()
+        if self.playout_task and not self.playout_task.done():
+            self.playout_task.cancel()
+
+        # last turn may be partial (e.g. the call ended mid-reply)
+        if self.turn_trace:
+            turn_trace_recorder.export(self.turn_trace)
+        if self.transcriber:
+            logger.info(f"📊 Transcriber stats: {self.transcriber.get_stats()}")
+        if self.synthesizer:
+            logger.info(f"📊 Synthesizer stats: {self.synthesizer.get_stats()}")
+
+        if self.synthesis_handler_task and not self.synthesis_handler_task.done():
+            self.synthesis_handler_task.cancel()
+        if self.transcriber and self.transcriber.is_connected:
+            # pooled STT sockets are single-use; close ours
+            await self.transcriber.stop()
+        if self.synthesizer and not self.synthesizer_released:
+            self.synthesizer_released = True
+            # the connection moves to a new instance; ours stays disconnected
+            await tts_pool.release(self.synthesizer)
+
         payload = {
             "call_sid": self.call_sid,
             "workflow_run_id": self.workflow_run_id,